@@ -1 +1,11 @@
+import importlib
+from typing import Any
+
 __all__ = ['anpp_packets', 'an_devices']
+
+
+def __getattr__(name: str) -> Any:
+    # Subpackages are imported on first access
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,17 @@
 from .an_device_async import AnDevice
 from .an_device_async_interface import AnDeviceInterface
+from .an_fleet_async import (
+    AnFleet,
+    FirmwareRolloutReport,
+    FirmwareUpdateResult,
+    FirmwareUpdateStatus,
+    FleetDeviceMetrics,
+    FleetPacket,
+)
+from .an_callback_runner import CallbackMode, CallbackStats
+from .an_clock_offset import ClockOffsetEstimator
+from .an_packet_subscription import ANPacketSubscription
+from .an_receive_queue import ANReceiveQueue, QueuePolicy
 from .gpio_functions import get_gpio_functions
 from .supported_packets import get_supported_packets
 from .device_capabilities import *  # noqa: F403
@@ -9,6 +21,18 @@ from . import device_capabilities
 __all__ = [
     'AnDevice',
     'AnDeviceInterface',
+    'AnFleet',
+    'FirmwareRolloutReport',
+    'FirmwareUpdateResult',
+    'FirmwareUpdateStatus',
+    'FleetDeviceMetrics',
+    'FleetPacket',
+    'CallbackMode',
+    'CallbackStats',
+    'ClockOffsetEstimator',
+    'ANPacketSubscription',
+    'ANReceiveQueue',
+    'QueuePolicy',
     'get_gpio_functions',
     'get_supported_packets'
 ]
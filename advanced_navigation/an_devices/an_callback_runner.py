@@ -0,0 +1,200 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                           an_callback_runner.py                            ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+import asyncio
+import inspect
+import logging
+import time
+from collections import deque
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Deque, Optional
+
+from advanced_navigation.an_devices.an_receive_queue import QueuePolicy
+
+
+class CallbackMode(Enum):
+    """How a packet callback is run by the packet worker"""
+
+    inline = 0  # Plain function called by the worker, awaiting its result if it returns an awaitable
+    awaited = 1  # Coroutine function awaited by the worker
+    executor = 2  # Plain function run in an executor, without holding up the worker
+
+
+@dataclass
+class CallbackStats:
+    """Timing of the calls of a packet callback, in seconds"""
+
+    calls: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    # Packets waiting for an executor callback
+    backlog: int = 0
+    # Packets dropped from the backlog by the queue policy of their packet type
+    dropped: int = 0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def record(self, duration: float, failed: bool = False):
+        self.calls += 1
+        self.errors += failed
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+
+
+class CallbackRunner:
+    """
+    Runs a packet callback in its execution mode and times its calls.
+
+    Executor callbacks are passed their packets one at a time, in the order they were received, by a
+    task of the runner, so that a slow callback only delays its own packets. The packets waiting for
+    the callback follow the queue policy of their packet type, like the receive queue.
+    """
+
+    def __init__(
+        self,
+        callback: Callable,
+        mode: Optional[CallbackMode] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Initializes the runner.
+
+        Args:
+            callback (Callable): The callback, called with a single argument.
+            mode (Optional[CallbackMode], optional): The execution mode. Defaults to awaited for coroutine
+                functions and inline for other callables, whose result is awaited if it is awaitable.
+            executor (Optional[Executor], optional): The executor of the executor mode, e.g. a ThreadPoolExecutor
+                or a ProcessPoolExecutor, which requires the callback and packets to be picklable. Defaults to
+                the default executor of the event loop.
+        """
+        if mode is None:
+            mode = CallbackMode.awaited if inspect.iscoroutinefunction(callback) else CallbackMode.inline
+        self.callback = callback
+        self.mode = mode
+        self.executor = executor
+        self.stats = CallbackStats()
+        self._pending: Deque[Any] = deque()
+        self._task: Optional[asyncio.Task] = None
+
+    async def run(self, argument: Any):
+        """
+        Calls the callback, or queues the call for the executor. Exceptions raised by inline and awaited
+        callbacks are passed on.
+
+        Args:
+            argument (Any): The packet, or batch of packets, passed to the callback.
+        """
+        if self.mode == CallbackMode.executor:
+            if len(self._pending) == self._pending.maxlen:
+                self.stats.dropped += 1
+            self._pending.append(argument)
+            self.stats.backlog = len(self._pending)
+            if self._task is None or self._task.done():
+                self._task = asyncio.create_task(self._run_pending())
+            return
+
+        start = time.perf_counter()
+        failed = True
+        try:
+            if self.mode == CallbackMode.awaited:
+                await self.callback(argument)
+            else:
+                result = self.callback(argument)
+                # e.g. a lambda wrapping a coroutine function, or an object with an async __call__
+                if inspect.isawaitable(result):
+                    await result
+            failed = False
+        finally:
+            self.stats.record(time.perf_counter() - start, failed)
+
+    async def _run_pending(self):
+        """
+        Runs the queued calls of an executor callback, in order.
+        """
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            argument = self._pending.popleft()
+            start = time.perf_counter()
+            failed = True
+            try:
+                await loop.run_in_executor(self.executor, self.callback, argument)
+                failed = False
+            except Exception as e:
+                logging.warning(f"Failed to run callback {self.callback!r} in executor: {e}")
+            finally:
+                self.stats.record(time.perf_counter() - start, failed)
+                self.stats.backlog = len(self._pending)
+
+    def set_policy(self, policy: Optional[QueuePolicy], maxsize: int = 1):
+        """
+        Sets the backpressure policy of the queued calls of an executor callback. The oldest calls are dropped
+        first when there are more than the policy allows.
+
+        Args:
+            policy (Optional[QueuePolicy]): QueuePolicy.drop_oldest to keep the latest maxsize calls,
+                QueuePolicy.conflate to keep only the latest call, or QueuePolicy.unbounded or None to keep
+                every call.
+            maxsize (int, optional): The maximum number of queued calls for QueuePolicy.drop_oldest. Defaults to 1.
+        """
+        if policy == QueuePolicy.drop_oldest:
+            if maxsize < 1:
+                raise ValueError(f"The drop_oldest policy needs a maxsize of at least 1, not {maxsize}")
+            maxlen = maxsize
+        elif policy == QueuePolicy.conflate:
+            maxlen = 1
+        else:
+            maxlen = None
+        if maxlen is not None and len(self._pending) > maxlen:
+            self.stats.dropped += len(self._pending) - maxlen
+        self._pending = deque(self._pending, maxlen)
+        self.stats.backlog = len(self._pending)
+
+    async def join(self):
+        """
+        Waits until the queued calls of an executor callback have run.
+        """
+        while self._task is not None and not self._task.done():
+            await asyncio.shield(self._task)
+
+    def cancel(self):
+        """
+        Cancels the queued calls of an executor callback. The call already running in the executor is not
+        waited for.
+        """
+        self._pending.clear()
+        self.stats.backlog = 0
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
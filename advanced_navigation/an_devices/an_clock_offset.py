@@ -0,0 +1,209 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                             an_clock_offset.py                             ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+import struct
+from collections import deque
+from typing import Any, Deque, Final, List, Optional, Tuple
+
+from advanced_navigation.anpp_packets.an_packets import PacketID
+from advanced_navigation.anpp_packets.an_packet_protocol import ANFrame
+
+# Offset of the unix time seconds and microseconds in the packets that carry the device time
+_DEVICE_TIME_OFFSETS: Final = {PacketID.unix_time: 0, PacketID.system_state: 4}
+DEVICE_TIME_PACKET_IDS: Final = frozenset(_DEVICE_TIME_OFFSETS)
+_device_time = struct.Struct("<II")
+
+
+class ClockOffsetEstimator:
+    """
+    Online estimate of the offset and drift between the device clock and the host clock.
+
+    Each sample pairs the device time of a packet, from the unix time fields of packets 20 and 21,
+    with the host time the packet was received, from time.monotonic_ns(). Transport delays only ever
+    make a packet late, so the least delayed sample of each segment of device time is kept, and a
+    line fitted through the latest segments gives the offset and drift. Memory is bounded by the
+    number of segments. The constant part of the transport delay cannot be observed from one way
+    timing and is included in the offset.
+    """
+
+    def __init__(self, segment_duration: float = 1.0, max_segments: int = 60, step_threshold: float = 1.0):
+        """
+        Initializes the estimator.
+
+        Args:
+            segment_duration (float, optional): The device time covered by each segment, in seconds. Defaults to 1.0.
+            max_segments (int, optional): The number of segments fitted, older segments are dropped. Defaults to 60.
+            step_threshold (float, optional): A device time that moves backwards, or a sample earlier than the
+                estimate, by more than this many seconds is taken as a step of the device clock, and restarts
+                the estimate. Defaults to 1.0.
+        """
+        if max_segments < 2:
+            raise ValueError(f"The estimator needs at least 2 segments, not {max_segments}")
+        self._segment_ns = int(segment_duration * 1e9)
+        self._step_ns = int(step_threshold * 1e9)
+        # Device time and offset of the least delayed sample of each completed segment
+        self._segments: Deque[Tuple[int, int]] = deque(maxlen=max_segments - 1)
+        # Start device time, device time and offset of the least delayed sample of the current segment
+        self._current: Optional[List[int]] = None
+        # Reference device time, offset at the reference and drift of the fitted line
+        self._fit: Optional[Tuple[int, int, float]] = None
+        self._last_device_time = 0
+        self.samples = 0
+        self.resets = 0
+
+    def reset(self):
+        """
+        Discards every sample.
+        """
+        self._segments.clear()
+        self._current = None
+        self._fit = None
+
+    def update(self, device_time_ns: int, host_time_ns: int):
+        """
+        Adds a sample.
+
+        Args:
+            device_time_ns (int): The device time of a packet, in nanoseconds since the unix epoch.
+            host_time_ns (int): The host time the packet was received, from time.monotonic_ns().
+        """
+        offset = host_time_ns - device_time_ns
+        current = self._current
+        if current is not None:
+            # The drift over a segment is negligible next to the threshold
+            if device_time_ns < self._last_device_time - self._step_ns or offset < current[2] - self._step_ns:
+                # The device clock stepped, the previous samples no longer apply
+                self.reset()
+                self.resets += 1
+                current = None
+        self.samples += 1
+        self._last_device_time = device_time_ns
+
+        if current is None or device_time_ns - current[0] >= self._segment_ns:
+            if current is not None:
+                self._segments.append((current[1], current[2]))
+            self._current = [device_time_ns, device_time_ns, offset]
+            self._fit = None
+        elif offset < current[2]:
+            current[1] = device_time_ns
+            current[2] = offset
+            self._fit = None
+
+    def update_from_frame(self, an_packet: ANFrame) -> bool:
+        """
+        Adds a sample from a received Unix Time Packet or System State Packet stamped with its receive time.
+
+        Args:
+            an_packet (ANFrame): The received raw packet.
+
+        Returns:
+            bool: True if the packet carried a sample.
+        """
+        offset = _DEVICE_TIME_OFFSETS.get(an_packet.id)
+        if offset is None or an_packet.timestamp == 0 or an_packet.length < offset + _device_time.size:
+            return False
+        seconds, microseconds = _device_time.unpack_from(an_packet.data, offset)
+        if seconds == 0:
+            # The device time is not yet known
+            return False
+        self.update(seconds * 1_000_000_000 + microseconds * 1000, an_packet.timestamp)
+        return True
+
+    def _fit_line(self) -> Optional[Tuple[int, int, float]]:
+        """
+        Fits the offset as a line of the device time through the least delayed samples.
+        """
+        if self._fit is None and self._current is not None:
+            points = list(self._segments)
+            points.append((self._current[1], self._current[2]))
+            reference_time, reference_offset = points[-1]
+            if len(points) == 1:
+                self._fit = (reference_time, reference_offset, 0.0)
+            else:
+                xs = [(time - reference_time) / 1e9 for time, _ in points]
+                ys = [float(offset - reference_offset) for _, offset in points]
+                mean_x = sum(xs) / len(xs)
+                mean_y = sum(ys) / len(ys)
+                sxx = sum((x - mean_x) ** 2 for x in xs)
+                sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+                drift = sxy / sxx if sxx > 0 else 0.0
+                # Offset at the reference time, in nanoseconds, and drift in nanoseconds per second
+                self._fit = (reference_time, reference_offset + round(mean_y - drift * mean_x), drift)
+        return self._fit
+
+    def offset_at(self, device_time_ns: int) -> Optional[int]:
+        """
+        Returns the estimated offset from the device time to the host time at a device time, in nanoseconds,
+        or None if there are no samples.
+
+        Args:
+            device_time_ns (int): The device time, in nanoseconds since the unix epoch.
+        """
+        fit = self._fit_line()
+        if fit is None:
+            return None
+        reference_time, reference_offset, drift = fit
+        return reference_offset + round(drift * (device_time_ns - reference_time) / 1e9)
+
+    @property
+    def offset_ns(self) -> Optional[int]:
+        """The estimated offset from the device time to the host time at the latest sample, in nanoseconds"""
+        return None if self._current is None else self.offset_at(self._current[1])
+
+    @property
+    def drift_ppm(self) -> float:
+        """The estimated drift of the host clock relative to the device clock, in parts per million"""
+        fit = self._fit_line()
+        return 0.0 if fit is None else fit[2] / 1e3
+
+    def to_host_time(self, device_time_ns: int) -> Optional[int]:
+        """
+        Maps a device time to the host time, as returned by time.monotonic_ns().
+
+        Args:
+            device_time_ns (int): The device time, in nanoseconds since the unix epoch.
+
+        Returns:
+            Optional[int]: The host time in nanoseconds, or None if there are no samples.
+        """
+        offset = self.offset_at(device_time_ns)
+        return None if offset is None else device_time_ns + offset
+
+    def packet_host_time(self, packet: Any) -> Optional[int]:
+        """
+        Maps the device time of a decoded packet with unix_time_seconds and microseconds fields, such as the
+        System State Packet, to the host time.
+
+        Args:
+            packet (Any): The decoded packet object.
+
+        Returns:
+            Optional[int]: The host time in nanoseconds, or None if there are no samples.
+        """
+        return self.to_host_time(packet.unix_time_seconds * 1_000_000_000 + packet.microseconds * 1000)
@@ -28,12 +28,16 @@
 ################################################################################
 
 import asyncio
+import json
 import logging
+import mmap
+import os
 import struct
 from datetime import datetime
 import time
 from pathlib import Path
-from typing import Optional, Any
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from advanced_navigation.anpp_packets.an_packet_0 import (
     AcknowledgePacket,
@@ -53,6 +57,30 @@ from advanced_navigation.anpp_packets.an_packet_9 import (
     FileTransferLimits,
 )
 from advanced_navigation.an_devices.an_device_async_interface import AnDeviceInterface
+from advanced_navigation.an_devices.an_packet_subscription import ANPacketSubscription
+
+
+@dataclass
+class FileTransferProgress:
+    """Progress of a file transfer"""
+
+    total_size: int = 0
+    bytes_acknowledged: int = 0
+    fragments_sent: int = 0
+    retransmissions: int = 0
+    start_index: int = 0  # Data index the transfer was resumed from
+    start_time: float = 0.0  # time.monotonic() at the start of the transfer
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the start of the transfer"""
+        return time.monotonic() - self.start_time
+
+    @property
+    def throughput(self) -> float:
+        """Bytes acknowledged per second, since the start of the transfer"""
+        elapsed = self.elapsed
+        return (self.bytes_acknowledged - self.start_index) / elapsed if elapsed > 0 else 0.0
 
 
 class AnDevice(AnDeviceInterface):
@@ -61,19 +89,24 @@ class AnDevice(AnDeviceInterface):
     Inherits from AnDeviceInterface to provide specific functionality like boot mode management and firmware updates.
     """
 
+    AN_FIRMWARE_HEADER_LENGTH = 16
+
     def __init__(self):
         """
         Initializes the AnDevice.
         """
         super().__init__()
 
-    async def wait_online(self, timeout: int = 10):
+    async def wait_online(self, timeout: int = 10) -> DeviceInformationPacket:
         """
         Waits for the device to come online by requesting DeviceInformationPacket.
 
         Args:
             timeout (int): Maximum time to wait in seconds. Defaults to 10.
 
+        Returns:
+            DeviceInformationPacket: The device information of the device.
+
         Raises:
             Exception: If the device does not come online within the timeout.
         """
@@ -81,7 +114,7 @@ class AnDevice(AnDeviceInterface):
         while (time.monotonic() - start_time) < timeout:
             device_info = await self.request(DeviceInformationPacket)
             if device_info is not None:
-                return
+                return device_info
         raise Exception("Device offline")
 
     async def get_boot_mode(self) -> Optional[BootMode]:
@@ -131,12 +164,31 @@ class AnDevice(AnDeviceInterface):
             await asyncio.sleep(0.5)
         raise Exception("Unable to set bootmode: timeout")
 
-    async def write_firmware(self, file_path: Path) -> bool:
+    async def write_firmware(
+        self,
+        file_path: Path,
+        window: int = 1,
+        progress: Optional[Callable[[FileTransferProgress], Any]] = None,
+        resume: bool = False,
+        checkpoint_path: Optional[Path] = None,
+    ) -> bool:
         """
         Writes firmware to the device from a file.
 
+        The file is memory mapped and sent without being copied. With resume, the progress of the transfer
+        is saved to a checkpoint file next to the firmware file, named after it with a .checkpoint suffix,
+        so that a transfer that fails is resumed from where the device got to by the next call.
+
         Args:
             file_path (Path): Path to the firmware file (.anfw).
+            window (int, optional): The maximum number of fragments waiting for an acknowledgement, see
+                transfer_file(). Defaults to 1.
+            progress (Optional[Callable[[FileTransferProgress], Any]], optional): Function called with the progress of
+                the transfer each time a fragment is acknowledged. Defaults to None.
+            resume (bool, optional): Resume a transfer of the file that failed, and save the progress of this
+                transfer if it fails. Defaults to False.
+            checkpoint_path (Optional[Path], optional): Path to the checkpoint file, for uploads of the same file to
+                several devices. Defaults to the path of the firmware file with a .checkpoint suffix.
 
         Raises:
             Exception: If firmware validation fails or transfer fails.
@@ -144,26 +196,167 @@ class AnDevice(AnDeviceInterface):
         AN_FIRMWARE_METADATA_SIZE = 48
         logging.info(f"Write firmware: {file_path}")
 
-        if not self.validate_firmware(file_path):
-            raise Exception("Invalid anfw file")
+        file_path = Path(file_path)
+        if not resume:
+            checkpoint_path = None
+        elif checkpoint_path is None:
+            checkpoint_path = file_path.with_name(file_path.name + ".checkpoint")
 
         with open(file_path, "rb") as f:
-            file_data = f.read()
+            file_stat = os.fstat(f.fileno())
+            if file_stat.st_size < AN_FIRMWARE_METADATA_SIZE:
+                raise Exception("Invalid anfw file")
+            file_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        file_view = memoryview(file_map)
+        # Fragments of the file are sent as slices of the map
+        file_data = file_view[AN_FIRMWARE_METADATA_SIZE:]
+        try:
+            if not self._validate_firmware_header(file_view[: self.AN_FIRMWARE_HEADER_LENGTH]):
+                raise Exception("Invalid anfw file")
+
+            # Get the metadata at the beginning of the anfw file
+            metadata = bytes(file_view[:AN_FIRMWARE_METADATA_SIZE])
+
+            # The transfer ID and acknowledged data index of the interrupted transfer to resume
+            checkpoint = self._read_checkpoint(checkpoint_path, file_stat) if checkpoint_path else None
+            last_progress: Optional[FileTransferProgress] = None
+            last_saved = 0.0
+
+            def on_progress(transfer: FileTransferProgress):
+                nonlocal last_progress, last_saved
+                last_progress = transfer
+                if checkpoint_path is not None and time.monotonic() - last_saved >= 1.0:
+                    self._write_checkpoint(checkpoint_path, file_stat, transfer_id, transfer.bytes_acknowledged)
+                    last_saved = time.monotonic()
+                if progress is not None:
+                    progress(transfer)
+
+            if checkpoint is not None:
+                transfer_id, start_index = checkpoint
+                logging.info(f"Resuming firmware transfer {transfer_id} at {start_index}")
+                try:
+                    await self.transfer_file(
+                        file_data,
+                        transfer_id,
+                        FileTransferDataEncoding.aes256,
+                        FileTransferMetadataType.an_firmware,
+                        metadata,
+                        window,
+                        on_progress,
+                        start_index,
+                    )
+                    checkpoint_path.unlink(missing_ok=True)
+                    return True
+                except Exception as e:
+                    if last_progress is not None and last_progress.bytes_acknowledged > start_index:
+                        # The device accepted the resumed transfer, keep its progress for the next attempt
+                        self._write_checkpoint(
+                            checkpoint_path, file_stat, transfer_id, last_progress.bytes_acknowledged
+                        )
+                        raise
+                    logging.warning(f"Unable to resume firmware transfer, restarting: {e}")
+                    last_progress = None
+
+            # Generate a unique id for this file transfer
+            transfer_id = int(time.time()) & 0x7FFFFFFF
+
+            try:
+                await self.transfer_file(
+                    file_data,
+                    transfer_id,
+                    FileTransferDataEncoding.aes256,
+                    FileTransferMetadataType.an_firmware,
+                    metadata,
+                    window,
+                    on_progress,
+                )
+            except Exception:
+                if checkpoint_path is not None and last_progress is not None:
+                    self._write_checkpoint(checkpoint_path, file_stat, transfer_id, last_progress.bytes_acknowledged)
+                raise
+            if checkpoint_path is not None:
+                checkpoint_path.unlink(missing_ok=True)
+            return True
+        finally:
+            del file_data, file_view
+            try:
+                file_map.close()
+            except BufferError:
+                # A fragment of the file is still referenced, by the traceback of a failed transfer,
+                # the map is closed once it is released
+                pass
+
+    async def _wait_acknowledgement(self, acknowledgements: ANPacketSubscription, timeout: float) -> List[Any]:
+        """
+        Waits for a file transfer acknowledgement, giving up early if the connection is lost and will
+        not be reconnected.
 
-        # Generate a unique id for this file transfer
-        transfer_id = int(time.time()) & 0x7FFFFFFF
+        Args:
+            acknowledgements (ANPacketSubscription): The subscription to the acknowledgements.
+            timeout (float): Timeout in seconds.
+
+        Returns:
+            List[Any]: The acknowledgement, or an empty list if none was received.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0 or (not self.connected and self._reconnect_backoff is None):
+                return []
+            responses = await acknowledgements.get_batch(1, min(remaining, 0.1))
+            if responses:
+                return responses
+
+    @staticmethod
+    def _read_checkpoint(checkpoint_path: Path, file_stat: os.stat_result) -> Optional[Tuple[int, int]]:
+        """
+        Reads the checkpoint of an interrupted firmware transfer.
 
-        # Get the metadata at the beginning of the anfw file
-        metadata = file_data[:AN_FIRMWARE_METADATA_SIZE]
+        Args:
+            checkpoint_path (Path): Path to the checkpoint file.
+            file_stat (os.stat_result): The status of the firmware file, which must not have changed since the checkpoint.
 
-        await self.transfer_file(
-            file_data[AN_FIRMWARE_METADATA_SIZE:],
-            transfer_id,
-            FileTransferDataEncoding.aes256,
-            FileTransferMetadataType.an_firmware,
-            metadata,
-        )
-        return True
+        Returns:
+            Optional[Tuple[int, int]]: The transfer ID and the acknowledged data index, or None if there is no valid checkpoint.
+        """
+        try:
+            with open(checkpoint_path, "r") as f:
+                checkpoint = json.load(f)
+            if checkpoint["size"] != file_stat.st_size or checkpoint["mtime_ns"] != file_stat.st_mtime_ns:
+                logging.info(f"Ignoring checkpoint of a different firmware file: {checkpoint_path}")
+                return None
+            if checkpoint["data_index"] <= 0:
+                return None
+            return checkpoint["transfer_id"], checkpoint["data_index"]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"Invalid firmware transfer checkpoint {checkpoint_path}: {e}")
+            return None
+
+    @staticmethod
+    def _write_checkpoint(checkpoint_path: Path, file_stat: os.stat_result, transfer_id: int, data_index: int):
+        """
+        Saves the progress of a firmware transfer, replacing the checkpoint file atomically.
+
+        Args:
+            checkpoint_path (Path): Path to the checkpoint file.
+            file_stat (os.stat_result): The status of the firmware file.
+            transfer_id (int): The unique ID of the transfer.
+            data_index (int): The data index acknowledged by the device.
+        """
+        checkpoint = {
+            "transfer_id": transfer_id,
+            "data_index": data_index,
+            "size": file_stat.st_size,
+            "mtime_ns": file_stat.st_mtime_ns,
+        }
+        temporary_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+        with open(temporary_path, "w") as f:
+            json.dump(checkpoint, f)
+        os.replace(temporary_path, checkpoint_path)
 
     def validate_firmware(self, file_path: Path) -> bool:
         """
@@ -175,26 +368,40 @@ class AnDevice(AnDeviceInterface):
         Returns:
             bool: True if the file is a valid ANFW file, False otherwise.
         """
-        AN_FIRMWARE_HEADER_LENGTH = 16
         logging.debug(f"Validating Firmware: {file_path}")
         try:
             with open(file_path, "rb") as f:
-                header = f.read(AN_FIRMWARE_HEADER_LENGTH)
-                if len(header) < AN_FIRMWARE_HEADER_LENGTH:
-                    return False
+                return self._validate_firmware_header(f.read(self.AN_FIRMWARE_HEADER_LENGTH))
+        except Exception as e:
+            logging.warning(f"Firmware validation error: {e}")
+        return False
 
-                identifier = header[0:4].decode("ascii")
-                version = struct.unpack("<I", header[8:12])[0] / 1000.0
-                timestamp = struct.unpack("<I", header[12:16])[0]
+    def _validate_firmware_header(self, header: bytes) -> bool:
+        """
+        Validates the header at the start of a firmware file.
 
-                if identifier == "ANFW":
-                    date_str = datetime.fromtimestamp(timestamp).strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    )
-                    logging.info(
-                        f"Valid ANFW File found - Version: {version} | Date: {date_str}"
-                    )
-                    return True
+        Args:
+            header (bytes): The first AN_FIRMWARE_HEADER_LENGTH bytes of the file.
+
+        Returns:
+            bool: True if the header is a valid ANFW header, False otherwise.
+        """
+        try:
+            if len(header) < self.AN_FIRMWARE_HEADER_LENGTH:
+                return False
+
+            identifier = bytes(header[0:4]).decode("ascii")
+            version = struct.unpack("<I", header[8:12])[0] / 1000.0
+            timestamp = struct.unpack("<I", header[12:16])[0]
+
+            if identifier == "ANFW":
+                date_str = datetime.fromtimestamp(timestamp).strftime(
+                    "%Y-%m-%d %H:%M:%S"
+                )
+                logging.info(
+                    f"Valid ANFW File found - Version: {version} | Date: {date_str}"
+                )
+                return True
 
         except Exception as e:
             logging.warning(f"Firmware validation error: {e}")
@@ -207,16 +414,30 @@ class AnDevice(AnDeviceInterface):
         data_encoding: FileTransferDataEncoding,
         metadata_type: FileTransferMetadataType,
         metadata: bytes,
+        window: int = 1,
+        progress: Optional[Callable[[FileTransferProgress], Any]] = None,
+        start_index: int = 0,
     ):
         """
         Transfers a file to the device using the ANPP file transfer protocol.
 
+        Up to window fragments are sent ahead of their acknowledgements. The device accepts the fragments
+        in order, so an acknowledgement also acknowledges the fragments sent before it, and answers a fragment
+        that does not follow the last one it accepted with an index mismatch, from which the transfer resumes.
+
         Args:
-            file_data (bytes): The content of the file to transfer.
+            file_data (bytes): The content of the file to transfer, a memoryview is sent without copying.
             transfer_id (int): Unique ID for the transfer.
             data_encoding (FileTransferDataEncoding): Encoding of the data.
             metadata_type (FileTransferMetadataType): Type of metadata.
             metadata (bytes): Metadata bytes.
+            window (int, optional): The maximum number of fragments waiting for an acknowledgement. Defaults to 1,
+                which waits for the acknowledgement of each fragment before sending the next.
+            progress (Optional[Callable[[FileTransferProgress], Any]], optional): Function called with the progress of
+                the transfer each time a fragment is acknowledged. Defaults to None.
+            start_index (int, optional): The data index to resume an interrupted transfer with the same transfer_id
+                from. The device answers with the index it got to if it differs. Defaults to 0, which starts a
+                new transfer.
 
         Raises:
             Exception: If the transfer fails, times out, or receives an error response.
@@ -225,6 +446,9 @@ class AnDevice(AnDeviceInterface):
 
         logging.info(f"Transfer file start - Length: {len(file_data)}")
 
+        if window < 1:
+            raise ValueError(f"The transfer window needs at least 1 fragment, not {window}")
+
         retry = PACKET_RETRY_COUNT
 
         max_data_size = FileTransferLimits.max_data_size.value
@@ -232,10 +456,15 @@ class AnDevice(AnDeviceInterface):
         if len(metadata) > max_data_size:
             raise Exception(f"Metadata to long {len(metadata)} > {max_data_size}")
 
-        data_index = 0
         total_length = len(metadata) + len(file_data)
+        transfer = FileTransferProgress(
+            total_size=total_length,
+            bytes_acknowledged=start_index,
+            start_index=start_index,
+            start_time=time.monotonic(),
+        )
 
-        while data_index < total_length:
+        def fragment(data_index: int) -> Any:
             packet: Any
             if data_index == 0:
                 packet = FileTransferFirstPacket()
@@ -245,25 +474,68 @@ class AnDevice(AnDeviceInterface):
                 packet.data_encoding = data_encoding
                 packet.metadata_type = metadata_type
                 packet.metadata_length = len(metadata)
-                packet.packet_data = (
-                    metadata
-                    + file_data[0 : data_index + (max_data_size - len(metadata))]
-                )
+                packet.packet_data = metadata + bytes(file_data[0 : max_data_size - len(metadata)])
             else:
                 packet = FileTransferOngoingPacket()
                 packet.unique_id = transfer_id
                 packet.data_index = data_index
                 file_index = data_index - len(metadata)
                 packet.packet_data = file_data[file_index : file_index + max_data_size]
-
-            timeout = (
-                10.0 if data_index == 0 else 3.0
-            )  # Use a longer timeout for the very first packet
-            response = await self.send(
-                packet, expected_response=FileTransferAcknowledgePacket, timeout=timeout
+            return packet
+
+        def complete() -> int:
+            transfer.bytes_acknowledged = total_length
+            if progress is not None:
+                progress(transfer)
+            logging.info(
+                f"File transfer complete - {transfer.throughput:.0f} bytes/s, "
+                f"{transfer.retransmissions} retransmissions"
             )
-
-            if response and isinstance(response, FileTransferAcknowledgePacket):
+            return 0
+
+        # Length of the fragments sent and not yet acknowledged, by data index, oldest first
+        in_flight: Dict[int, int] = {}
+        data_index = start_index
+        # Data index the transfer resumed from after an index mismatch, until a fragment is acknowledged
+        resumed_index: Optional[int] = None
+
+        async with self.stream(FileTransferAcknowledgePacket, maxsize=max(1000, 4 * window)) as acknowledgements:
+            while True:
+                # The first fragment, which starts the transfer, is acknowledged before the others are sent
+                limit = 1 if data_index == 0 or 0 in in_flight else window
+                while data_index < total_length and len(in_flight) < limit:
+                    packet = fragment(data_index)
+                    await self.send(packet, expected_response=None)
+                    in_flight[data_index] = len(packet.packet_data)
+                    data_index += len(packet.packet_data)
+                    transfer.fragments_sent += 1
+
+                timeout = (
+                    10.0 if 0 in in_flight else 3.0
+                )  # Use a longer timeout for the very first packet
+                responses = await self._wait_acknowledgement(acknowledgements, timeout)
+
+                if not responses:
+                    oldest_index = next(iter(in_flight), data_index)
+                    if not self.connected and self._reconnect_backoff is None:
+                        raise Exception(
+                            f"File transfer - connection lost at {oldest_index}"
+                        )
+                    logging.warning(
+                        f"File transfer - unable to send fragment at {oldest_index}"
+                    )
+                    retry = retry - 1
+                    if retry <= 0:
+                        raise Exception(
+                            f"File transfer - unable to send fragment at {oldest_index}"
+                        )
+                    # Send every unacknowledged fragment again
+                    data_index = oldest_index
+                    in_flight.clear()
+                    transfer.retransmissions += 1
+                    continue
+
+                response = responses[0]
                 if response.unique_id != transfer_id:
                     raise Exception(
                         f"Unexpected transfer id: {response.unique_id} expecting {transfer_id}"
@@ -273,26 +545,36 @@ class AnDevice(AnDeviceInterface):
                     response.response_code
                     == FileTransferResponse.completed_successfully
                 ):
-                    logging.info("File transfer complete")
-                    return 0
+                    return complete()
                 elif response.response_code == FileTransferResponse.ready:
-                    data_index += len(packet.packet_data)
-                    retry = PACKET_RETRY_COUNT
+                    # An acknowledgement of a fragment no longer in flight, e.g. sent again after a timeout,
+                    # is ignored
+                    if response.data_index in in_flight:
+                        # The fragments sent before the acknowledged fragment, whose acknowledgements may have
+                        # been lost, were accepted before it
+                        for acknowledged_index in list(in_flight):
+                            if acknowledged_index > response.data_index:
+                                break
+                            transfer.bytes_acknowledged = acknowledged_index + in_flight.pop(acknowledged_index)
+                        resumed_index = None
+                        retry = PACKET_RETRY_COUNT
+                        if data_index >= total_length and not in_flight:
+                            # The last fragment was acknowledged as ready rather than completed
+                            return complete()
+                        if progress is not None:
+                            progress(transfer)
                 elif response.response_code == FileTransferResponse.index_mismatch:
-                    logging.warning(
-                        f"File transfer - index mismatch. Change index {data_index}->{response.data_index}"
-                    )
-                    data_index = response.data_index
+                    # The fragments in flight after a lost fragment are all answered with the same
+                    # mismatch, only the first one resumes the transfer
+                    if response.data_index != resumed_index:
+                        logging.warning(
+                            f"File transfer - index mismatch. Change index {data_index}->{response.data_index}"
+                        )
+                        data_index = response.data_index
+                        resumed_index = data_index
+                        in_flight.clear()
+                        transfer.retransmissions += 1
                 else:
                     raise Exception(
                         f"Device returned error code: {response.response_code}"
                     )
-            else:
-                logging.warning(
-                    f"File transfer - unable to send fragment at {data_index}"
-                )
-                retry = retry - 1
-                if retry <= 0:
-                    raise Exception(
-                        f"File transfer - unable to send fragment at {data_index}"
-                    )
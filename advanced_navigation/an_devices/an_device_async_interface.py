@@ -28,15 +28,21 @@
 ################################################################################
 
 import asyncio
-import copy
 import serial_asyncio  # type: ignore
 import logging
-from typing import Callable, Dict, Any, Type, Optional, List, Tuple
+import time
+from concurrent.futures import Executor
+from typing import Awaitable, Callable, Dict, Any, Iterable, Type, Optional, List, Tuple
 
 from advanced_navigation.anpp_packets.an_packets import PacketID
-from advanced_navigation.anpp_packets.an_packet_protocol import ANDecoder, ANPacket
-from advanced_navigation.anpp_packets.an_packet_0 import AcknowledgePacket
+from advanced_navigation.anpp_packets.an_packet_protocol import ANDecoder, ANFrame, ANPacket, ANRingDecoder
+from advanced_navigation.anpp_packets.an_packet_0 import AcknowledgePacket, AcknowledgeResult
 from advanced_navigation.anpp_packets.an_packet_1 import RequestPacket
+from advanced_navigation.anpp_packets.an_packet_181 import PacketPeriod, PacketsPeriodPacket
+from advanced_navigation.an_devices.an_clock_offset import DEVICE_TIME_PACKET_IDS, ClockOffsetEstimator
+from advanced_navigation.an_devices.an_callback_runner import CallbackMode, CallbackRunner, CallbackStats
+from advanced_navigation.an_devices.an_packet_subscription import ANPacketSubscription
+from advanced_navigation.an_devices.an_receive_queue import ANReceiveQueue, QueuePolicy
 
 
 class AnDeviceInterfaceProtocol(asyncio.Protocol):
@@ -44,23 +50,37 @@ class AnDeviceInterfaceProtocol(asyncio.Protocol):
     Asyncio Protocol implementation for handling Advanced Navigation Packet Protocol (ANPP) communication.
     """
 
+    # Maximum number of queued packets passed to on_packets_received at once
+    MAX_BATCH_SIZE: int = 1024
+
     def __init__(
         self,
-        on_packet_received: Callable[[ANPacket], Any],
+        on_packet_received: Callable[[ANFrame], Any],
         on_connection_state_change: Callable[[bool], Any] | None = None,
+        on_response_received: Callable[[ANFrame], bool] | None = None,
+        on_packets_received: Callable[[List[ANFrame]], Any] | None = None,
     ):
         """
         Initializes the protocol.
 
         Args:
-            on_packet_received (Callable[[ANPacket], Any]): Callback function to handle received packets.
+            on_packet_received (Callable[[ANFrame], Any]): Callback function to handle received packets.
             on_connection_state_change (Callable[[bool], Any] | None, optional): Callback function to handle connection state changes. Defaults to None.
+            on_response_received (Callable[[ANFrame], bool] | None, optional): Function called for every packet as
+                soon as it is received, ahead of the receive queue, to resolve pending responses. Returns True if the
+                packet needs no further handling, so it is not queued. Defaults to None.
+            on_packets_received (Callable[[List[ANFrame]], Any] | None, optional): Callback function to handle every
+                packet waiting in the receive queue at once, used instead of on_packet_received. Defaults to None.
         """
-        self._receive_queue: asyncio.Queue[ANPacket] = asyncio.Queue()
+        self._receive_queue = ANReceiveQueue()
         self._on_packet_received = on_packet_received
         self._on_connection_state_change = on_connection_state_change
+        self._on_response_received = on_response_received
+        self._on_packets_received = on_packets_received
         self._transport: Optional[asyncio.Transport] = None
         self._decoder = ANDecoder()
+        self.bytes_received = 0
+        self.packets_received = 0
         self._worker_task = asyncio.create_task(self._worker())
 
     async def _worker(self):
@@ -70,8 +90,19 @@ class AnDeviceInterfaceProtocol(asyncio.Protocol):
         while True:
             try:
                 an_packet = await self._receive_queue.get()
-                await self._on_packet_received(an_packet)
-                self._receive_queue.task_done()
+            except asyncio.QueueEmpty:
+                # The connection was lost and every received packet has been handled
+                return
+            try:
+                if self._on_packets_received is None:
+                    await self._on_packet_received(an_packet)
+                    continue
+                # Handle every queued packet with a single call, up to MAX_BATCH_SIZE packets
+                an_packets = [an_packet]
+                receive_queue = self._receive_queue
+                while not receive_queue.empty() and len(an_packets) < self.MAX_BATCH_SIZE:
+                    an_packets.append(receive_queue.get_nowait())
+                await self._on_packets_received(an_packets)
             except Exception as e:
                 logging.error(f"Worker task error: {e}")
 
@@ -89,18 +120,42 @@ class AnDeviceInterfaceProtocol(asyncio.Protocol):
 
     def data_received(self, data: bytes):
         """
-        Called when data is received. Handles incoming byte chunks and assemble ANPP packets.
+        Called when data is received. Handles incoming byte chunks and assemble ANPP packets,
+        stamped with the receive time from time.monotonic_ns().
 
         Args:
             data (bytes): The received data.
         """
+        timestamp = time.monotonic_ns()
+        self.bytes_received += len(data)
         self._decoder.add_data(packet_bytes=data)
-        while True:
-            an_packet = self._decoder.decode()
-            if an_packet is None:
-                break
-            self._receive_queue.put_nowait(copy.deepcopy(an_packet))
-            self._decoder.remove_processed_data()
+        self._queue_packets(self._decoder.decode_all(timestamp))
+
+    def _queue_packets(self, an_packets: List[ANFrame]):
+        """
+        Passes the received packets to the response handler, and queues those that need further handling.
+
+        Args:
+            an_packets (List[ANFrame]): The received packets.
+        """
+        self.packets_received += len(an_packets)
+        for an_packet in an_packets:
+            if self._on_response_received is not None:
+                try:
+                    if self._on_response_received(an_packet):
+                        continue
+                except Exception as e:
+                    logging.warning(f"Failed to handle response {an_packet.id}: {e}")
+            self._receive_queue.put_nowait(an_packet)
+
+    def set_id_filter(self, packet_ids: Optional[Iterable[int]]):
+        """
+        Sets the IDs of the packets to decode and pass on, other packets are skipped without being checked.
+
+        Args:
+            packet_ids (Optional[Iterable[int]]): The packet IDs to decode, or None to decode every packet.
+        """
+        self._decoder.set_id_filter(packet_ids)
 
     def send(self, packet: ANPacket):
         """
@@ -121,10 +176,79 @@ class AnDeviceInterfaceProtocol(asyncio.Protocol):
         """
         logging.info(f"Connection lost: {exc}")
         self._transport = None
+        # The worker stops once it has handled the packets already received
+        self._receive_queue.close()
         if self._on_connection_state_change:
             asyncio.create_task(self._on_connection_state_change(False))
 
 
+class AnDeviceInterfaceBufferedProtocol(AnDeviceInterfaceProtocol, asyncio.BufferedProtocol):
+    """
+    Asyncio BufferedProtocol implementation for handling ANPP communication, which receives data
+    directly into the ring buffer of its decoder instead of a new bytes object for every read.
+    Transports that do not support buffered protocols deliver the data through data_received().
+    """
+
+    # Large enough for the biggest read of the asyncio socket transports
+    RING_BUFFER_CAPACITY: int = 256 * 1024
+
+    def __init__(
+        self,
+        on_packet_received: Callable[[ANFrame], Any],
+        on_connection_state_change: Callable[[bool], Any] | None = None,
+        on_response_received: Callable[[ANFrame], bool] | None = None,
+        on_packets_received: Callable[[List[ANFrame]], Any] | None = None,
+    ):
+        """
+        Initializes the protocol.
+
+        Args:
+            on_packet_received (Callable[[ANFrame], Any]): Callback function to handle received packets.
+            on_connection_state_change (Callable[[bool], Any] | None, optional): Callback function to handle connection state changes. Defaults to None.
+            on_response_received (Callable[[ANFrame], bool] | None, optional): Function called for every packet as
+                soon as it is received, ahead of the receive queue, to resolve pending responses. Returns True if the
+                packet needs no further handling, so it is not queued. Defaults to None.
+            on_packets_received (Callable[[List[ANFrame]], Any] | None, optional): Callback function to handle every
+                packet waiting in the receive queue at once, used instead of on_packet_received. Defaults to None.
+        """
+        super().__init__(on_packet_received, on_connection_state_change, on_response_received, on_packets_received)
+        self._decoder = ANRingDecoder(self.RING_BUFFER_CAPACITY)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """
+        Called to allocate a new receive buffer. Returns the free space of the decoder ring buffer.
+
+        Args:
+            sizehint (int): The recommended minimum size of the buffer, or -1 for any size.
+        """
+        return self._decoder.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes: int):
+        """
+        Called when data is received into the buffer returned by get_buffer().
+
+        Args:
+            nbytes (int): The number of bytes received.
+        """
+        timestamp = time.monotonic_ns()
+        self.bytes_received += nbytes
+        self._decoder.buffer_updated(nbytes)
+        # The packet data is copied out of the ring buffer, which is reused by the next read
+        self._queue_packets(self._decoder.decode_all(timestamp, copy_data=True))
+
+    def data_received(self, data: bytes):
+        """
+        Called when data is received by a transport without buffered protocol support.
+
+        Args:
+            data (bytes): The received data.
+        """
+        timestamp = time.monotonic_ns()
+        self.bytes_received += len(data)
+        self._decoder.add_data(packet_bytes=data)
+        self._queue_packets(self._decoder.decode_all(timestamp, copy_data=True))
+
+
 class AnDeviceInterface:
     """
     Interface for communicating with Advanced Navigation devices via TCP or Serial.
@@ -135,29 +259,355 @@ class AnDeviceInterface:
         Initializes the AnDeviceInterface.
         """
         self._protocol: Optional[AnDeviceInterfaceProtocol] = None
-        self._callbacks: Dict[PacketID, List[Tuple[Callable, Type]]] = {}
+        self._callbacks: Dict[PacketID, List[Tuple[CallbackRunner, Type, Optional[Any], bool]]] = {}
         self._raw_callbacks: List[Callable] = []
+        self._batch_callbacks: Dict[int, List[Tuple[CallbackRunner, Type, bool]]] = {}
+        self._subscriptions: Dict[int, List[ANPacketSubscription]] = {}
+        # Futures of the requests waiting for a response, by packet ID, in the order they were sent
+        self._pending_responses: Dict[int, Dict[asyncio.Future, Type]] = {}
+        # Futures of the packets waiting for an acknowledgement, by acknowledged packet ID
+        self._pending_acknowledgements: Dict[int, Dict[asyncio.Future, None]] = {}
+        self._queue_policies: Dict[int, Tuple[Optional[QueuePolicy], int]] = {}
+        # Requests in flight that concurrent requests of the same packet type share, see request_many()
+        self._shared_requests: Dict[Type, List[Any]] = {}
+        # Offset between the device and host clocks, from the received Unix Time and System State Packets
+        self.clock_offset = ClockOffsetEstimator()
+        self._clock_offset_enabled = True
+        # Opens the connection of the last connect call, again when reconnecting
+        self._open_connection: Optional[Callable[[], Awaitable[AnDeviceInterfaceProtocol]]] = None
+        # Initial delay, maximum delay and growth factor of the reconnect attempts, None if disabled
+        self._reconnect_backoff: Optional[Tuple[float, float, float]] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.reconnects = 0
+        # Packet periods set by the packets period packets sent, restored after reconnecting
+        self._packet_periods: Dict[int, int] = {}
+        self._packet_periods_cleared = False
 
-    def register_callback(self, packet_type: Type, callback: Callable):
+    def register_callback(
+        self,
+        packet_type: Type,
+        callback: Callable,
+        packet: Optional[Any] = None,
+        copy: bool = False,
+        mode: Optional[CallbackMode] = None,
+        executor: Optional[Executor] = None,
+    ) -> CallbackStats:
         """
         Registers a callback for a specific packet type.
 
+        Each received packet is decoded once per packet type, and the same packet object is passed to
+        every callback registered for that type, so callbacks must not modify it.
+
+        Inline and awaited callbacks are called one after another by the packet worker, so a slow callback
+        delays every packet. Executor callbacks run in the executor instead, each passed its packets in
+        the order they were received.
+
         Args:
             packet_type (Type): The class of the packet to listen for.
             callback (Callable): The function to call when the packet is received.
+            packet (Optional[Any], optional): A packet object of packet_type that every received packet is
+                decoded into, instead of creating a new packet object each time. Only supported by the packet
+                classes whose decode() overwrites every field, marked REUSABLE. The callback must copy any
+                data it keeps after it returns. Defaults to None.
+            copy (bool, optional): Decode a separate packet object for this callback, which it may modify.
+                Defaults to False.
+            mode (Optional[CallbackMode], optional): CallbackMode.inline to call a plain function, awaiting
+                its result if it is awaitable, CallbackMode.awaited to await a coroutine function, or
+                CallbackMode.executor to run a plain function in the executor. Defaults to awaited for
+                coroutine functions and inline otherwise.
+            executor (Optional[Executor], optional): The executor of CallbackMode.executor, e.g. a
+                ThreadPoolExecutor, or a ProcessPoolExecutor for a picklable module level function.
+                Defaults to the default executor of the event loop.
+
+        Returns:
+            CallbackStats: The number of calls and the time spent in the callback, updated as packets are received.
         """
+        if packet is not None and not getattr(type(packet), "REUSABLE", False):
+            # The decoder would keep data of the previous packet, e.g. the entries of a variable length packet
+            raise ValueError(f"{type(packet).__name__} objects cannot be reused, decode() does not set every field")
+        runner = CallbackRunner(callback, mode, executor)
+        if runner.mode == CallbackMode.executor and packet is not None:
+            raise ValueError("Executor callbacks cannot reuse a packet object, it may still be in use")
+        runner.set_policy(*self._queue_policies.get(packet_type.ID, (None, 1)))
         if packet_type.ID not in self._callbacks:
             self._callbacks[packet_type.ID] = []
-        self._callbacks[packet_type.ID].append((callback, packet_type))
+        self._callbacks[packet_type.ID].append((runner, packet_type, packet, copy))
+        self._update_id_filter()
+        return runner.stats
+
+    def register_batch_callback(
+        self,
+        packet_type: Type,
+        callback: Callable,
+        columnar: bool = False,
+        mode: Optional[CallbackMode] = None,
+        executor: Optional[Executor] = None,
+    ) -> CallbackStats:
+        """
+        Registers a callback for the received packets of a packet type, called once with every packet of
+        that type waiting in the receive queue, rather than once per packet.
+
+        Args:
+            packet_type (Type): The class of the packets to listen for.
+            callback (Callable): The function to call with the list of the received packet objects, oldest first.
+            columnar (bool, optional): Pass the packets as a numpy structured array with a row per packet,
+                see an_packet_batch.decode_batch(), instead of a list of packet objects. Only supported by
+                fixed length packets, and requires numpy. Defaults to False.
+            mode (Optional[CallbackMode], optional): The execution mode of the callback, see register_callback().
+                Defaults to awaited for coroutine functions and inline otherwise.
+            executor (Optional[Executor], optional): The executor of CallbackMode.executor. Defaults to the default
+                executor of the event loop.
+
+        Returns:
+            CallbackStats: The number of calls and the time spent in the callback, updated as packets are received.
+        """
+        if columnar:
+            from advanced_navigation.anpp_packets.an_packet_batch import packet_dtype
+
+            # Raises ValueError for packets that are not fixed length
+            packet_dtype(packet_type)
+        if packet_type.ID not in self._batch_callbacks:
+            self._batch_callbacks[packet_type.ID] = []
+        runner = CallbackRunner(callback, mode, executor)
+        runner.set_policy(*self._queue_policies.get(packet_type.ID, (None, 1)))
+        self._batch_callbacks[packet_type.ID].append((runner, packet_type, columnar))
+        self._update_id_filter()
+        return runner.stats
 
     def register_raw_callback(self, callback: Callable):
         """
-        Registers a callback for all received raw ANPackets.
+        Registers a callback for all received raw packets, delivered as ANFrames.
 
         Args:
             callback (Callable): The function to call when any raw packet is received.
         """
         self._raw_callbacks.append(callback)
+        self._update_id_filter()
+
+    def stream(self, packet_type: Type, maxsize: int = 1000) -> ANPacketSubscription:
+        """
+        Subscribes to the received packets of a packet type.
+
+        The packets are buffered by the subscription as soon as they are received, ahead of the receive
+        queue and the callbacks, and are decoded into a new packet object each when they are retrieved.
+
+        Args:
+            packet_type (Type): The class of the packets to stream.
+            maxsize (int, optional): The maximum number of buffered packets, the oldest packet is dropped
+                when the buffer is full. Defaults to 1000.
+
+        Returns:
+            ANPacketSubscription: The subscription, an async iterator of the received packet objects.
+                Close it to unsubscribe.
+        """
+        subscription = ANPacketSubscription(packet_type, maxsize, self._unsubscribe)
+        self._subscribe(subscription)
+        return subscription
+
+    def _subscribe(self, subscription: ANPacketSubscription):
+        """
+        Starts delivering the received packets of its packet type to a subscription.
+
+        Args:
+            subscription (ANPacketSubscription): The subscription.
+        """
+        packet_id = subscription.packet_type.ID
+        if packet_id not in self._subscriptions:
+            self._subscriptions[packet_id] = []
+        self._subscriptions[packet_id].append(subscription)
+        self._update_id_filter()
+
+    def _unsubscribe(self, subscription: ANPacketSubscription):
+        """
+        Stops delivering packets to a closed subscription.
+
+        Args:
+            subscription (ANPacketSubscription): The closed subscription.
+        """
+        subscriptions = self._subscriptions.get(subscription.packet_type.ID)
+        if subscriptions and subscription in subscriptions:
+            subscriptions.remove(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.packet_type.ID]
+            self._update_id_filter()
+
+    def set_queue_policy(self, packet_type: Type, policy: Optional[QueuePolicy], maxsize: int = 1):
+        """
+        Sets the backpressure policy of the received packets of a packet type, waiting to be handled, either in
+        the receive queue or by the executor callbacks of the packet type.
+
+        Acknowledgements and file transfer acknowledgements are never dropped.
+
+        Args:
+            packet_type (Type): The class of the packet.
+            policy (Optional[QueuePolicy]): QueuePolicy.unbounded to keep every packet, QueuePolicy.drop_oldest to
+                keep the latest maxsize packets, QueuePolicy.conflate to keep only the latest packet, or None to
+                restore the default unbounded policy.
+            maxsize (int, optional): The maximum number of queued packets for QueuePolicy.drop_oldest. Defaults to 1.
+        """
+        if self._protocol is not None:
+            self._protocol._receive_queue.set_policy(packet_type.ID, policy, maxsize)
+        for runner in self._callback_runners(packet_type.ID):
+            runner.set_policy(policy, maxsize)
+        self._queue_policies[packet_type.ID] = (policy, maxsize)
+
+    def _callback_runners(self, packet_id: Optional[int] = None) -> List[CallbackRunner]:
+        """
+        Returns the runners of the callbacks and batch callbacks of a packet ID, or of every packet ID if None.
+        """
+        runners = []
+        for callbacks in (self._callbacks, self._batch_callbacks):
+            for callback_id, entries in callbacks.items():
+                if packet_id is None or callback_id == packet_id:
+                    runners.extend(entry[0] for entry in entries)
+        return runners
+
+    async def join_callbacks(self):
+        """
+        Waits until the packets queued for the executor callbacks have been passed to them, e.g. before close().
+        """
+        for runner in self._callback_runners():
+            await runner.join()
+
+    @property
+    def receive_queue(self) -> Optional[ANReceiveQueue]:
+        """
+        The queue of the received packets of the connection, with its frames_dropped and frames_conflated counters
+        and the time packets wait in it, latency_ns and max_latency_ns.
+        """
+        return self._protocol._receive_queue if self._protocol is not None else None
+
+    def _configure_protocol(self):
+        """
+        Applies the packet ID filter and the queue policies to a new protocol.
+        """
+        for packet_id, (policy, maxsize) in self._queue_policies.items():
+            self._protocol._receive_queue.set_policy(packet_id, policy, maxsize)
+        self._update_id_filter()
+
+    def _update_id_filter(self):
+        """
+        Limits the packets decoded by the protocol to those with a registered callback, batch callback, a
+        subscription or a pending response, and to the packets carrying the device time while the clock offset
+        is estimated.
+        Every packet is decoded while a raw callback is registered.
+        """
+        if self._protocol is None:
+            return
+        if self._raw_callbacks:
+            self._protocol.set_id_filter(None)
+        else:
+            packet_ids = {packet_id for packet_id, callbacks in self._callbacks.items() if callbacks}
+            packet_ids.update(self._batch_callbacks)
+            packet_ids.update(self._subscriptions)
+            packet_ids.update(self._pending_responses)
+            if self._pending_acknowledgements:
+                packet_ids.add(PacketID.acknowledge)
+            if self._clock_offset_enabled:
+                packet_ids.update(DEVICE_TIME_PACKET_IDS)
+            self._protocol.set_id_filter(packet_ids)
+
+    def _add_pending(
+        self, table: Dict[int, Dict[asyncio.Future, Any]], key: int, future: asyncio.Future, value: Any = None
+    ):
+        """
+        Adds a future waiting for a response to a pending response table.
+
+        Args:
+            table (Dict[int, Dict[asyncio.Future, Any]]): The pending response table.
+            key (int): The packet ID the future is waiting for.
+            future (asyncio.Future): The future to resolve with the response.
+            value (Any, optional): The value stored with the future. Defaults to None.
+        """
+        pending = table.get(key)
+        if pending is None:
+            table[key] = {future: value}
+            self._update_id_filter()
+        else:
+            pending[future] = value
+
+    def _remove_pending(self, table: Dict[int, Dict[asyncio.Future, Any]], key: int, future: asyncio.Future):
+        """
+        Removes a future from a pending response table.
+
+        Args:
+            table (Dict[int, Dict[asyncio.Future, Any]]): The pending response table.
+            key (int): The packet ID the future is waiting for.
+            future (asyncio.Future): The future to remove.
+        """
+        pending = table.get(key)
+        if pending is not None:
+            pending.pop(future, None)
+            if not pending:
+                del table[key]
+                self._update_id_filter()
+
+    def _handle_response(self, an_packet: ANFrame) -> bool:
+        """
+        Internal handler called by the protocol as soon as a raw packet is received, ahead of the
+        streaming packets waiting in the receive queue, so that responses are not delayed by them.
+        Also buffers the packet in the subscriptions to its packet ID, and updates the clock offset.
+
+        Args:
+            an_packet (ANFrame): The received raw packet.
+
+        Returns:
+            bool: True if the packet was a response, streamed or a clock offset sample and has no callbacks,
+                so it does not need to be queued.
+        """
+        handled = self._resolve_pending(an_packet)
+        if self._clock_offset_enabled and an_packet.id in DEVICE_TIME_PACKET_IDS:
+            self.clock_offset.update_from_frame(an_packet)
+            handled = True
+        subscriptions = self._subscriptions.get(an_packet.id)
+        if subscriptions:
+            handled = True
+            for subscription in subscriptions:
+                subscription.put_nowait(an_packet)
+        return (
+            handled
+            and not self._raw_callbacks
+            and not self._callbacks.get(an_packet.id)
+            and an_packet.id not in self._batch_callbacks
+        )
+
+    def _resolve_pending(self, an_packet: ANFrame) -> bool:
+        """
+        Resolves the futures waiting for a received raw packet.
+
+        Every request waiting for the packet ID receives the packet, while an acknowledgement only
+        resolves the oldest packet waiting for it.
+
+        Args:
+            an_packet (ANFrame): The received raw packet.
+
+        Returns:
+            bool: True if a future was waiting for the packet.
+        """
+        handled = False
+        pending = self._pending_responses.get(an_packet.id)
+        if pending:
+            handled = True
+            # Packet objects decoded for each packet type, None if decoding failed
+            decoded_packets: Dict[Type, Optional[Any]] = {}
+            for future, packet_type in pending.items():
+                if future.done():
+                    continue
+                if packet_type not in decoded_packets:
+                    decoded_packets[packet_type] = self._decode_packet(an_packet, packet_type)
+                if decoded_packets[packet_type] is not None:
+                    future.set_result(decoded_packets[packet_type])
+
+        if an_packet.id == PacketID.acknowledge and self._pending_acknowledgements:
+            handled = True
+            acknowledge = self._decode_packet(an_packet, AcknowledgePacket)
+            if acknowledge is not None:
+                for future in self._pending_acknowledgements.get(acknowledge.packet_id, ()):
+                    if not future.done():
+                        future.set_result(acknowledge)
+                        break
+        return handled
 
     async def connect_tcp(self, host: str, port: int):
         """
@@ -167,15 +617,22 @@ class AnDeviceInterface:
             host (str): The hostname or IP address.
             port (int): The port number.
         """
-        loop = asyncio.get_running_loop()
-        _, protocol = await loop.create_connection(
-            lambda: AnDeviceInterfaceProtocol(
-                self._handle_recv_packet, self._handle_connection_state_change
-            ),
-            host,
-            port,
-        )
-        self._protocol = protocol
+
+        async def open_connection() -> AnDeviceInterfaceProtocol:
+            loop = asyncio.get_running_loop()
+            _, protocol = await loop.create_connection(
+                lambda: AnDeviceInterfaceBufferedProtocol(
+                    self._handle_recv_packet,
+                    self._handle_connection_state_change,
+                    self._handle_response,
+                    self._handle_recv_packets,
+                ),
+                host,
+                port,
+            )
+            return protocol
+
+        await self._connect(open_connection)
 
     async def connect_serial(self, com_port: str, baudrate: int = 115200):
         """
@@ -185,39 +642,248 @@ class AnDeviceInterface:
             com_port (str): The COM port (e.g., 'COM1', '/dev/ttyUSB0').
             baudrate (int, optional): The baud rate. Defaults to 115200.
         """
-        loop = asyncio.get_running_loop()
-        _, protocol = await serial_asyncio.create_serial_connection(
-            loop,
-            lambda: AnDeviceInterfaceProtocol(
-                self._handle_recv_packet, self._handle_connection_state_change
-            ),
-            com_port,
-            baudrate=baudrate,
-        )
-        self._protocol = protocol
+
+        async def open_connection() -> AnDeviceInterfaceProtocol:
+            loop = asyncio.get_running_loop()
+            # Serial transports always deliver data through data_received(), so the buffered protocol gains nothing
+            _, protocol = await serial_asyncio.create_serial_connection(
+                loop,
+                lambda: AnDeviceInterfaceProtocol(
+                    self._handle_recv_packet,
+                    self._handle_connection_state_change,
+                    self._handle_response,
+                    self._handle_recv_packets,
+                ),
+                com_port,
+                baudrate=baudrate,
+            )
+            return protocol
+
+        await self._connect(open_connection)
+
+    async def _connect(self, open_connection: Callable[[], Awaitable[AnDeviceInterfaceProtocol]]):
+        """
+        Replaces the current connection, if any, by a new connection.
+
+        Args:
+            open_connection (Callable[[], Awaitable[AnDeviceInterfaceProtocol]]): Opens the connection and returns its protocol.
+        """
+        self._closing = False
+        self._open_connection = open_connection
+        await self._teardown_protocol()
+        self._protocol = await open_connection()
+        self._configure_protocol()
+
+    async def _teardown_protocol(self):
+        """
+        Closes the current connection and stops its worker, discarding the packets not yet handled, including
+        those queued for the executor callbacks, so that nothing of the connection is left behind when it is
+        replaced.
+        """
+        protocol = self._protocol
+        if protocol is None:
+            return
+        for runner in self._callback_runners():
+            runner.cancel()
+        if protocol._transport is not None:
+            protocol._transport.close()
+        worker_task = protocol._worker_task
+        if not worker_task.done() and worker_task is not asyncio.current_task():
+            worker_task.cancel()
+            await asyncio.wait([worker_task])
+
+    def enable_reconnect(self, initial_delay: float = 0.5, max_delay: float = 30.0, factor: float = 2.0):
+        """
+        Reconnects automatically when the connection is lost, other than by close(). The delay before each attempt
+        grows exponentially from initial_delay to max_delay. Callbacks, subscriptions and queue policies are kept,
+        and the packet periods set by the packets period packets sent are restored.
+
+        Args:
+            initial_delay (float, optional): Delay before the first attempt, in seconds. Defaults to 0.5.
+            max_delay (float, optional): Maximum delay between attempts, in seconds. Defaults to 30.0.
+            factor (float, optional): Growth of the delay after each failed attempt. Defaults to 2.0.
+        """
+        self._reconnect_backoff = (initial_delay, max_delay, factor)
+
+    def disable_reconnect(self):
+        """
+        Stops reconnecting automatically, including the reconnect attempts in progress.
+        """
+        self._reconnect_backoff = None
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+    def enable_clock_offset(self):
+        """
+        Estimates the clock offset from the Unix Time and System State Packets received, see clock_offset.
+        Enabled by default, which decodes these packets even without a callback.
+        """
+        self._clock_offset_enabled = True
+        self._update_id_filter()
+
+    def disable_clock_offset(self):
+        """
+        Stops estimating the clock offset, so that the Unix Time and System State Packets are only decoded for
+        their callbacks. The estimate so far is kept.
+        """
+        self._clock_offset_enabled = False
+        self._update_id_filter()
+
+    @property
+    def connected(self) -> bool:
+        return self._protocol is not None and self._protocol._transport is not None
 
     def close(self):
         """
-        Closes the connection.
+        Closes the connection. The packets queued for the executor callbacks are discarded, see join_callbacks().
         """
+        self._closing = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        for runner in self._callback_runners():
+            runner.cancel()
         if self._protocol and self._protocol._transport:
             self._protocol._transport.close()
 
     async def _handle_connection_state_change(self, connected_state: bool):
         """
-        Internal handler for connection state changes.
+        Internal handler for connection state changes. Starts reconnecting when the current connection is lost.
 
         Args:
             connected_state (bool): True if connected, False otherwise.
         """
-        pass
+        if (
+            not connected_state
+            and not self.connected
+            and not self._closing
+            and self._reconnect_backoff is not None
+            and self._open_connection is not None
+            and (self._reconnect_task is None or self._reconnect_task.done())
+        ):
+            self._reconnect_task = asyncio.create_task(self._reconnect())
 
-    async def _handle_recv_packet(self, an_packet: ANPacket):
+    async def _reconnect(self):
+        """
+        Reconnects with exponential backoff, then restores the packet periods. A connection lost while
+        the packet periods are restored is not reconnected by _handle_connection_state_change(), as this
+        task is still running, so it reconnects again until the packet periods are restored on a connection
+        that is still open.
         """
-        Internal handler for received raw ANPackets. Decodes them and triggers callbacks.
+        initial_delay, max_delay, factor = self._reconnect_backoff
+        delay = initial_delay
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                await self._connect(self._open_connection)
+            except Exception as e:
+                logging.warning(f"Reconnect failed, retrying in {delay} s: {e}")
+                delay = min(delay * factor, max_delay)
+                continue
+            self.reconnects += 1
+            logging.info("Reconnected")
+            try:
+                await self._restore_packet_periods()
+            except Exception as e:
+                logging.warning(f"Failed to restore packet periods: {e}")
+            if self.connected or self._closing:
+                return
+            logging.warning("Connection lost while restoring packet periods, reconnecting")
+            delay = initial_delay
+
+    def _remember_packet_periods(self, packet: PacketsPeriodPacket):
+        """
+        Records the packet periods set by a packets period packet sent to the device.
+
+        Args:
+            packet (PacketsPeriodPacket): The packets period packet.
+        """
+        if packet.clear_existing_packets:
+            self._packet_periods.clear()
+            self._packet_periods_cleared = True
+        for packet_period in packet.packet_periods:
+            self._packet_periods[packet_period.packet_id] = packet_period.period
+
+    async def _restore_packet_periods(self):
+        """
+        Sends the packet periods set on the previous connection again.
+        """
+        periods = list(self._packet_periods.items())
+        packets = []
+        for index in range(0, len(periods), PacketsPeriodPacket.MAXIMUM_PACKET_PERIODS):
+            packet = PacketsPeriodPacket()
+            packet.clear_existing_packets = int(self._packet_periods_cleared and index == 0)
+            for packet_id, period in periods[index : index + PacketsPeriodPacket.MAXIMUM_PACKET_PERIODS]:
+                packet_period = PacketPeriod()
+                packet_period.packet_id = packet_id
+                packet_period.period = period
+                packet.packet_periods.append(packet_period)
+            packets.append(packet)
+        for packet in packets:
+            acknowledge = await self.send(packet)
+            if acknowledge is None or acknowledge.acknowledge_result != AcknowledgeResult.success:
+                logging.warning(f"Failed to restore packet periods: {acknowledge}")
+
+    async def _handle_recv_packets(self, an_packets: List[ANFrame]):
+        """
+        Internal handler for the received raw packets waiting in the receive queue. Passes the packets of
+        each packet ID with batch callbacks to them at once, and the other packets to _handle_recv_packet().
 
         Args:
-            an_packet (ANPacket): The received raw packet.
+            an_packets (List[ANFrame]): The received raw packets, oldest first.
+        """
+        batches: Dict[int, List[ANFrame]] = {}
+        for an_packet in an_packets:
+            if an_packet.id in self._batch_callbacks:
+                if an_packet.id not in batches:
+                    batches[an_packet.id] = []
+                batches[an_packet.id].append(an_packet)
+                if not self._raw_callbacks and not self._callbacks.get(an_packet.id):
+                    continue
+            await self._handle_recv_packet(an_packet)
+
+        for packet_id, batch in batches.items():
+            # Packet objects shared by the list callbacks of each packet type
+            decoded_batches: Dict[Tuple[Type, bool], Any] = {}
+            for runner, packet_type, columnar in self._batch_callbacks.get(packet_id, ()):
+                try:
+                    key = (packet_type, columnar)
+                    if key not in decoded_batches:
+                        decoded_batches[key] = self._decode_batch(batch, packet_type, columnar)
+                    await runner.run(decoded_batches[key])
+                except Exception as e:
+                    logging.warning(f"Failed to handle batch of packet {packet_id}: {e}")
+
+    def _decode_batch(self, an_packets: List[ANFrame], packet_type: Type, columnar: bool) -> Any:
+        """
+        Decodes received raw packets into a list of packet objects, or a numpy structured array.
+
+        Args:
+            an_packets (List[ANFrame]): The received raw packets.
+            packet_type (Type): The class of the packets to decode.
+            columnar (bool): Decode into a numpy structured array instead of packet objects.
+
+        Returns:
+            Any: The list of the packet objects that were decoded, or the numpy structured array.
+        """
+        if columnar:
+            from advanced_navigation.anpp_packets.an_packet_batch import decode_batch
+
+            return decode_batch(packet_type, an_packets)
+        packets = []
+        for an_packet in an_packets:
+            packet = self._decode_packet(an_packet, packet_type)
+            if packet is not None:
+                packets.append(packet)
+        return packets
+
+    async def _handle_recv_packet(self, an_packet: ANFrame):
+        """
+        Internal handler for received raw packets. Decodes them and triggers callbacks.
+
+        Args:
+            an_packet (ANFrame): The received raw packet.
         """
         # Generic handler for raw packets
         for callback in self._raw_callbacks:
@@ -234,14 +900,21 @@ class AnDeviceInterface:
 
         if packet_id in self._callbacks:
             callbacks = self._callbacks[packet_id]
-            for callback, packet_type in callbacks:
+            # Packet objects shared by the callbacks of each packet type, None if decoding failed
+            decoded_packets: Dict[Type, Optional[Any]] = {}
+            for runner, packet_type, reused_packet, copy in callbacks:
                 try:
-                    if packet_type is not None:
-                        packet = packet_type()
-                        if packet.decode(an_packet) == 0:
-                            await callback(packet)
-                        else:
-                            logging.warning(f"Failed to decode packet {packet_id}")
+                    if packet_type is None:
+                        continue
+                    if reused_packet is not None or copy:
+                        packet = self._decode_packet(an_packet, packet_type, reused_packet)
+                    elif packet_type in decoded_packets:
+                        packet = decoded_packets[packet_type]
+                    else:
+                        packet = self._decode_packet(an_packet, packet_type)
+                        decoded_packets[packet_type] = packet
+                    if packet is not None:
+                        await runner.run(packet)
                 except Exception as e:
                     logging.warning(f"Failed to handle packet {packet_id}: {e}")
         else:
@@ -249,6 +922,27 @@ class AnDeviceInterface:
             if not self._raw_callbacks:
                 logging.debug(f"Packet {an_packet.id} not handled")
 
+    def _decode_packet(
+        self, an_packet: ANFrame, packet_type: Type, packet: Optional[Any] = None
+    ) -> Optional[Any]:
+        """
+        Decodes a received raw packet into a packet object.
+
+        Args:
+            an_packet (ANFrame): The received raw packet.
+            packet_type (Type): The class of the packet to decode.
+            packet (Optional[Any], optional): The packet object to decode into. Defaults to a new packet object.
+
+        Returns:
+            Optional[Any]: The decoded packet object or None if decoding failed.
+        """
+        if packet is None:
+            packet = packet_type()
+        if packet.decode(an_packet) != 0:
+            logging.warning(f"Failed to decode packet {an_packet.id}")
+            return None
+        return packet
+
     # System Packets
     async def request(self, packet_type: Any, timeout: float = 1.0) -> Optional[Any]:
         """
@@ -261,27 +955,61 @@ class AnDeviceInterface:
         Returns:
             Optional[Any]: The decoded packet object or None if timeout/error occurs.
         """
-        loop = asyncio.get_running_loop()
-        future = loop.create_future()
+        return (await self.request_many([packet_type], timeout))[packet_type]
 
-        async def one_shot_callback(packet):
-            if not future.done():
-                future.set_result(packet)
+    async def request_many(
+        self, packet_types: Iterable[Any], timeout: float = 1.0
+    ) -> Dict[Any, Optional[Any]]:
+        """
+        Request several packets with a single request packet and wait for the responses.
 
-        self.register_callback(packet_type, one_shot_callback)
+        A packet type that is already being requested is not requested again, the response to the
+        request in flight is shared instead.
+
+        Args:
+            packet_types (Iterable[type]): The classes of the packets to request.
+            timeout (float, optional): Timeout in seconds. Defaults to 1.0.
+
+        Returns:
+            Dict[Any, Optional[Any]]: The decoded packet object of each packet class, or None if timeout/error occurs.
+        """
+        loop = asyncio.get_running_loop()
+        # The shared request of each packet type, as a list of its future and number of waiters
+        requests: Dict[Any, List[Any]] = {}
+        packet_ids = []
+        for packet_type in packet_types:
+            if packet_type in requests:
+                continue
+            shared_request = self._shared_requests.get(packet_type)
+            if shared_request is None or shared_request[0].done():
+                future = loop.create_future()
+                shared_request = [future, 0]
+                self._shared_requests[packet_type] = shared_request
+                self._add_pending(self._pending_responses, packet_type.ID, future, packet_type)
+                packet_ids.append(packet_type.ID)
+            shared_request[1] += 1
+            requests[packet_type] = shared_request
+        if not requests:
+            return {}
 
         try:
-            self.send_request_packet(packet_type.ID)
-            return await asyncio.wait_for(future, timeout)
-        except Exception:
-            return None
+            if packet_ids:
+                self.send_request_packet(*packet_ids)
+            await asyncio.wait([future for future, _ in requests.values()], timeout=timeout)
+        except Exception as ex:
+            logging.warning(f"Failed to request packets: {ex}")
         finally:
-            if packet_type.ID in self._callbacks:
-                self._callbacks[packet_type.ID] = [
-                    cb
-                    for cb in self._callbacks[packet_type.ID]
-                    if cb[0] != one_shot_callback
-                ]
+            for packet_type, shared_request in requests.items():
+                shared_request[1] -= 1
+                if shared_request[1] == 0:
+                    if self._shared_requests.get(packet_type) is shared_request:
+                        del self._shared_requests[packet_type]
+                    self._remove_pending(self._pending_responses, packet_type.ID, shared_request[0])
+
+        return {
+            packet_type: future.result() if future.done() and not future.cancelled() else None
+            for packet_type, (future, _) in requests.items()
+        }
 
     async def send(
         self,
@@ -300,21 +1028,19 @@ class AnDeviceInterface:
         Returns:
             Optional[AcknowledgePacket]: The received response packet or None if timeout/error occurs.
         """
+        if send_packet.ID == PacketID.packets_period:
+            self._remember_packet_periods(send_packet)
         loop = asyncio.get_running_loop()
         future = loop.create_future()
-
-        async def one_shot_callback(recev_packet):
-            if isinstance(recev_packet, AcknowledgePacket):
-                # Does this ack belong to the sent packet?
-                if recev_packet.packet_id == send_packet.ID:
-                    if not future.done():
-                        future.set_result(recev_packet)
-            else:
-                if not future.done():
-                    future.set_result(recev_packet)
-
-        if expected_response is not None:
-            self.register_callback(expected_response, one_shot_callback)
+        if expected_response is None:
+            table, key = None, None
+        elif expected_response.ID == PacketID.acknowledge:
+            # Acknowledgements are matched to the sent packet by its ID
+            table, key = self._pending_acknowledgements, send_packet.ID
+            self._add_pending(table, key, future)
+        else:
+            table, key = self._pending_responses, expected_response.ID
+            self._add_pending(table, key, future, expected_response)
 
         try:
             if self._protocol:
@@ -327,25 +1053,17 @@ class AnDeviceInterface:
             logging.warning(f"Failed to send packet: {ex}")
             return None
         finally:
-            if (
-                expected_response
-                and hasattr(expected_response, "ID")
-                and expected_response.ID in self._callbacks
-            ):
-                self._callbacks[expected_response.ID] = [
-                    cb
-                    for cb in self._callbacks[expected_response.ID]
-                    if cb[0] != one_shot_callback
-                ]
+            if table is not None:
+                self._remove_pending(table, key, future)
 
-    def send_request_packet(self, packet_id: PacketID):
+    def send_request_packet(self, *packet_ids: PacketID):
         """
-        Sends a request packet for a specific packet ID.
+        Sends a request packet for one or more packet IDs.
 
         Args:
-            packet_id (PacketID): The ID of the packet to request.
+            *packet_ids (PacketID): The IDs of the packets to request.
         """
         request = RequestPacket()
-        request.requested_packets = [packet_id]
+        request.requested_packets = list(packet_ids)
         if self._protocol:
             self._protocol.send(request.encode())
@@ -0,0 +1,584 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                             an_fleet_async.py                              ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, Union
+
+from advanced_navigation.anpp_packets.an_packet_2 import BootMode
+from advanced_navigation.anpp_packets.an_packet_3 import DeviceID, DeviceInformationPacket
+from advanced_navigation.anpp_packets.an_packet_protocol import ANFrame
+from advanced_navigation.an_devices.an_device_async import AnDevice, FileTransferProgress
+from advanced_navigation.an_devices.an_packet_subscription import ANPacketSubscription
+from advanced_navigation.an_devices.device_capabilities import has_anfw_v2, has_application_bootloader
+
+
+class FleetPacket(NamedTuple):
+    """Packet received from a device of a fleet"""
+
+    device: str  # Name of the source device
+    packet: Any
+
+
+@dataclass
+class FleetDeviceMetrics:
+    """Snapshot of the connection of a device of a fleet"""
+
+    connected: bool = False
+    connect_time: float = 0.0  # Seconds taken to open the connection
+    online_time: float = 0.0  # Seconds taken by the device to answer once connected
+    bytes_received: int = 0
+    packets_received: int = 0
+    crc_errors: int = 0
+    bytes_skipped: int = 0
+    queue_size: int = 0
+    frames_dropped: int = 0
+    max_queue_latency_ns: int = 0
+
+
+@dataclass
+class FleetDevice:
+    """Device of a fleet, with the result of its bring up"""
+
+    name: str
+    device: AnDevice
+    device_information: Optional[DeviceInformationPacket] = None
+    error: Optional[Exception] = None
+    connect_time: float = 0.0
+    online_time: float = 0.0
+    _connect: Optional[Callable[[], Awaitable[Any]]] = field(default=None, repr=False)
+
+    def metrics(self) -> FleetDeviceMetrics:
+        """
+        Returns a snapshot of the counters of the connection.
+        """
+        metrics = FleetDeviceMetrics(connect_time=self.connect_time, online_time=self.online_time)
+        protocol = self.device._protocol
+        if protocol is not None:
+            metrics.connected = protocol._transport is not None
+            metrics.bytes_received = protocol.bytes_received
+            metrics.packets_received = protocol.packets_received
+            metrics.crc_errors = protocol._decoder.crc_errors
+            metrics.bytes_skipped = protocol._decoder.bytes_skipped
+            receive_queue = protocol._receive_queue
+            metrics.queue_size = receive_queue.qsize()
+            metrics.frames_dropped = receive_queue.frames_dropped
+            metrics.max_queue_latency_ns = receive_queue.max_latency_ns
+        return metrics
+
+
+class FirmwareUpdateStatus(Enum):
+    pending = 0
+    updated = 1
+    skipped = 2  # The device does not support the firmware update
+    failed = 3
+
+
+@dataclass
+class FirmwareUpdateResult:
+    """Result of the firmware update of a device of a fleet"""
+
+    name: str
+    status: FirmwareUpdateStatus = FirmwareUpdateStatus.pending
+    file_path: Optional[Path] = None
+    attempts: int = 0
+    bytes_transferred: int = 0  # Bytes acknowledged by the device, over every attempt
+    transfer_time: float = 0.0  # Seconds spent transferring the file, over every attempt
+    duration: float = 0.0  # Seconds from the start of the update until the device was back online
+    retransmissions: int = 0
+    progress: Optional[FileTransferProgress] = None  # Progress of the latest attempt
+    device_information: Optional[DeviceInformationPacket] = None  # Device information after the update
+    error: Optional[Exception] = None
+
+    @property
+    def throughput(self) -> float:
+        """Bytes acknowledged per second of transfer"""
+        return self.bytes_transferred / self.transfer_time if self.transfer_time > 0 else 0.0
+
+
+@dataclass
+class FirmwareRolloutReport:
+    """Results of the firmware update of a fleet, returned by AnFleet.update_firmware()"""
+
+    results: Dict[str, FirmwareUpdateResult] = field(default_factory=dict)
+    concurrency: int = 1
+    duration: float = 0.0  # Seconds taken by the whole rollout
+
+    def _names(self, status: FirmwareUpdateStatus) -> List[str]:
+        return [name for name, result in self.results.items() if result.status == status]
+
+    @property
+    def updated(self) -> List[str]:
+        return self._names(FirmwareUpdateStatus.updated)
+
+    @property
+    def skipped(self) -> List[str]:
+        return self._names(FirmwareUpdateStatus.skipped)
+
+    @property
+    def failed(self) -> List[str]:
+        return self._names(FirmwareUpdateStatus.failed)
+
+    @property
+    def bytes_transferred(self) -> int:
+        return sum(result.bytes_transferred for result in self.results.values())
+
+    @property
+    def throughput(self) -> float:
+        """Bytes acknowledged per second by the whole fleet, over the duration of the rollout"""
+        return self.bytes_transferred / self.duration if self.duration > 0 else 0.0
+
+    def __str__(self) -> str:
+        lines = [
+            f"Firmware rollout: {len(self.updated)} updated, {len(self.skipped)} skipped, {len(self.failed)} failed "
+            f"in {self.duration:.1f} s, {self.bytes_transferred} bytes at {self.throughput / 1024:.1f} KiB/s "
+            f"with {self.concurrency} concurrent updates"
+        ]
+        for name, result in self.results.items():
+            line = (
+                f"  {name}: {result.status.name}, {result.attempts} attempts, {result.bytes_transferred} bytes "
+                f"at {result.throughput / 1024:.1f} KiB/s, {result.retransmissions} retransmissions, "
+                f"{result.duration:.1f} s"
+            )
+            if result.error is not None:
+                line += f", {result.error}"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+class FleetSubscription(ANPacketSubscription):
+    """
+    Stream of the received packets of a packet type from every device of a fleet, returned by AnFleet.stream().
+
+    Packets are buffered together in the order they were received, and returned as FleetPackets tagged
+    with the name of their source device. get_frames() returns (device name, ANFrame) tuples.
+    """
+
+    def _decode(self, item: Tuple[str, ANFrame]) -> Optional[FleetPacket]:
+        name, an_packet = item
+        packet = super()._decode(an_packet)
+        return None if packet is None else FleetPacket(name, packet)
+
+
+class _FleetTap(ANPacketSubscription):
+    """Subscription to the packets of one device, which passes them on to a fleet subscription"""
+
+    def __init__(self, subscription: FleetSubscription, name: str):
+        super().__init__(subscription.packet_type, 1)
+        self.subscription = subscription
+        self.name = name
+
+    def put_nowait(self, an_packet: ANFrame):
+        self.subscription.put_nowait((self.name, an_packet))  # type: ignore[arg-type]
+
+
+class AnFleet:
+    """
+    Manages the connections to many Advanced Navigation devices from a single event loop.
+
+    Devices are brought up concurrently, the packets of every device can be streamed together, and the
+    firmware of the devices can be updated concurrently.
+
+        fleet = AnFleet()
+        fleet.add_tcp("boreas-1", "192.168.1.10", 16718)
+        fleet.add_serial("certus-1", "/dev/ttyUSB0", 115200)
+        await fleet.connect()
+        async with fleet.stream(SystemStatePacket) as subscription:
+            async for source, packet in subscription:
+                ...
+        report = await fleet.update_firmware(Path("certus.anfw"), concurrency=8)
+    """
+
+    # Seconds between the connection attempts, and timeout of each device information request, while
+    # waiting for a device to come online
+    RECONNECT_INTERVAL = 0.5
+
+    def __init__(self, device_factory: Callable[[], AnDevice] = AnDevice):
+        """
+        Initializes the fleet.
+
+        Args:
+            device_factory (Callable[[], AnDevice], optional): Function that creates the device objects. Defaults to AnDevice.
+        """
+        self.devices: Dict[str, FleetDevice] = {}
+        self._device_factory = device_factory
+        # Taps of each fleet subscription, by device name
+        self._taps: Dict[ANPacketSubscription, Dict[str, _FleetTap]] = {}
+
+    def __getitem__(self, name: str) -> AnDevice:
+        return self.devices[name].device
+
+    def __len__(self) -> int:
+        return len(self.devices)
+
+    def _add(self, name: str, connect: Callable[[AnDevice], Awaitable[Any]]) -> AnDevice:
+        if name in self.devices:
+            raise ValueError(f"Device {name} is already in the fleet")
+        device = self._device_factory()
+        self.devices[name] = FleetDevice(name, device, _connect=lambda: connect(device))
+        for subscription, taps in self._taps.items():
+            taps[name] = self._tap(device, subscription, name)
+        return device
+
+    def add_tcp(self, name: str, host: str, port: int) -> AnDevice:
+        """
+        Adds a device connected via TCP.
+
+        Args:
+            name (str): The name of the device in the fleet.
+            host (str): The hostname or IP address.
+            port (int): The port number.
+
+        Returns:
+            AnDevice: The device, connected by connect().
+        """
+        return self._add(name, lambda device: device.connect_tcp(host, port))
+
+    def add_serial(self, name: str, com_port: str, baudrate: int = 115200) -> AnDevice:
+        """
+        Adds a device connected via Serial.
+
+        Args:
+            name (str): The name of the device in the fleet.
+            com_port (str): The COM port (e.g., 'COM1', '/dev/ttyUSB0').
+            baudrate (int, optional): The baud rate. Defaults to 115200.
+
+        Returns:
+            AnDevice: The device, connected by connect().
+        """
+        return self._add(name, lambda device: device.connect_serial(com_port, baudrate))
+
+    async def _bring_up(self, fleet_device: FleetDevice, timeout: float):
+        """
+        Connects to a device and waits for its device information.
+
+        Args:
+            fleet_device (FleetDevice): The device.
+            timeout (float): Timeout in seconds of each step.
+        """
+        fleet_device.error = None
+        try:
+            start = time.monotonic()
+            await asyncio.wait_for(fleet_device._connect(), timeout)
+            connected = time.monotonic()
+            fleet_device.connect_time = connected - start
+            # The device information request is the online check
+            fleet_device.device_information = await fleet_device.device.wait_online(timeout)
+            fleet_device.online_time = time.monotonic() - connected
+        except Exception as e:
+            logging.warning(f"Failed to bring up device {fleet_device.name}: {e!r}")
+            fleet_device.error = e
+
+    async def connect(self, timeout: float = 10.0) -> Dict[str, Exception]:
+        """
+        Connects to every device that is not connected and waits for their device information, concurrently,
+        so that the fleet comes up in the time of its slowest device.
+
+        Args:
+            timeout (float, optional): Timeout in seconds of the connection and of the device information. Defaults to 10.0.
+
+        Returns:
+            Dict[str, Exception]: The error of each device that could not be brought up.
+        """
+        pending = [
+            fleet_device
+            for fleet_device in self.devices.values()
+            if fleet_device.device._protocol is None or fleet_device.device._protocol._transport is None
+        ]
+        await asyncio.gather(*(self._bring_up(fleet_device, timeout) for fleet_device in pending))
+        return {
+            fleet_device.name: fleet_device.error for fleet_device in pending if fleet_device.error is not None
+        }
+
+    def _tap(self, device: AnDevice, subscription: FleetSubscription, name: str) -> _FleetTap:
+        tap = _FleetTap(subscription, name)
+        device._subscribe(tap)
+        return tap
+
+    def stream(self, packet_type: Type, maxsize: int = 10000) -> FleetSubscription:
+        """
+        Subscribes to the received packets of a packet type from every device, including those added later.
+
+        Args:
+            packet_type (Type): The class of the packets to stream.
+            maxsize (int, optional): The maximum number of buffered packets of all the devices, the oldest
+                packet is dropped when the buffer is full. Defaults to 10000.
+
+        Returns:
+            FleetSubscription: The subscription, an async iterator of FleetPackets. Close it to unsubscribe.
+        """
+        subscription = FleetSubscription(packet_type, maxsize, self._unsubscribe)
+        self._taps[subscription] = {
+            name: self._tap(fleet_device.device, subscription, name)
+            for name, fleet_device in self.devices.items()
+        }
+        return subscription
+
+    def _unsubscribe(self, subscription: ANPacketSubscription):
+        """
+        Stops delivering the packets of every device to a closed fleet subscription.
+
+        Args:
+            subscription (ANPacketSubscription): The closed subscription.
+        """
+        for name, tap in self._taps.pop(subscription, {}).items():
+            self.devices[name].device._unsubscribe(tap)
+
+    async def _wait_online(self, fleet_device: FleetDevice, timeout: float) -> DeviceInformationPacket:
+        """
+        Waits for a device to answer the device information request, connecting again when its connection was
+        lost, as it is when the device restarts.
+
+        Args:
+            fleet_device (FleetDevice): The device.
+            timeout (float): Timeout in seconds.
+
+        Returns:
+            DeviceInformationPacket: The device information of the device.
+
+        Raises:
+            Exception: If the device does not come online within the timeout.
+        """
+        device = fleet_device.device
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            remaining = deadline - loop.time()
+            if not device.connected:
+                # A device with reconnection enabled connects again by itself
+                if device._reconnect_backoff is None:
+                    try:
+                        await asyncio.wait_for(fleet_device._connect(), remaining)
+                    except Exception as e:
+                        logging.debug(f"Failed to connect to device {fleet_device.name}: {e!r}")
+                if not device.connected:
+                    await asyncio.sleep(min(self.RECONNECT_INTERVAL, max(deadline - loop.time(), 0)))
+                    continue
+            # The connection may be about to drop as the device restarts, so a request is not waited on for long
+            device_information = await device.request(
+                DeviceInformationPacket, min(self.RECONNECT_INTERVAL, remaining)
+            )
+            if device_information is not None:
+                fleet_device.device_information = device_information
+                return device_information
+        raise Exception("Device offline")
+
+    async def _update_device_firmware(
+        self,
+        fleet_device: FleetDevice,
+        result: FirmwareUpdateResult,
+        window: int,
+        timeout: float,
+        progress: Optional[Callable[[str, FileTransferProgress], Any]],
+    ):
+        """
+        Makes one attempt at updating the firmware of a device, resuming the transfer of the previous attempt.
+
+        Args:
+            fleet_device (FleetDevice): The device.
+            result (FirmwareUpdateResult): The result of the update of the device, updated with the attempt.
+            window (int): The maximum number of fragments waiting for an acknowledgement.
+            timeout (float): Timeout in seconds of the device coming online.
+            progress (Optional[Callable[[str, FileTransferProgress], Any]]): Function called with the name of
+                the device and the progress of the transfer.
+        """
+        device = fleet_device.device
+        device_information = await self._wait_online(fleet_device, timeout)
+        if has_application_bootloader(device_information.device_id):
+            await device.request_boot_mode(BootMode.bootloader)
+
+        attempt_progress: Optional[FileTransferProgress] = None
+
+        def on_progress(transfer: FileTransferProgress):
+            nonlocal attempt_progress
+            attempt_progress = result.progress = transfer
+            if progress is not None:
+                progress(fleet_device.name, transfer)
+
+        start = time.monotonic()
+        try:
+            await device.write_firmware(
+                result.file_path,
+                window,
+                on_progress,
+                resume=True,
+                # Each device resumes its own transfer of the file
+                checkpoint_path=result.file_path.with_name(f"{result.file_path.name}.{fleet_device.name}.checkpoint"),
+            )
+        finally:
+            result.transfer_time += time.monotonic() - start
+            if attempt_progress is not None:
+                result.bytes_transferred += attempt_progress.bytes_acknowledged - attempt_progress.start_index
+                result.retransmissions += attempt_progress.retransmissions
+
+        # The device restarts into the new firmware
+        result.device_information = await self._wait_online(fleet_device, timeout)
+
+    async def _roll_out(
+        self,
+        fleet_device: FleetDevice,
+        result: FirmwareUpdateResult,
+        firmware: Union[Path, Dict[DeviceID, Path]],
+        semaphore: asyncio.Semaphore,
+        retries: int,
+        retry_delay: float,
+        timeout: float,
+        **kwargs,
+    ):
+        """
+        Checks that a device supports the firmware update, then updates its firmware once a slot of the
+        rollout is free, retrying failed attempts.
+
+        Args:
+            fleet_device (FleetDevice): The device.
+            result (FirmwareUpdateResult): The result of the update of the device.
+            firmware (Union[Path, Dict[DeviceID, Path]]): The firmware file, or the firmware file of each device ID.
+            semaphore (asyncio.Semaphore): The slots of the rollout.
+            retries (int): The number of retries after a failed attempt.
+            retry_delay (float): Seconds between attempts.
+            timeout (float): Timeout in seconds of the device coming online.
+            **kwargs: The other arguments of _update_device_firmware().
+        """
+        # Devices are checked before taking a slot, so that an offline device does not hold up the others
+        if fleet_device.device_information is None:
+            try:
+                await self._wait_online(fleet_device, timeout)
+            except Exception as e:
+                result.status = FirmwareUpdateStatus.failed
+                result.error = e
+                return
+        device_id = fleet_device.device_information.device_id
+        if not has_anfw_v2(device_id):
+            result.status = FirmwareUpdateStatus.skipped
+            result.error = Exception(f"Device {device_id.name} does not support ANFW v2 firmware files")
+            return
+        file_path = firmware.get(device_id) if isinstance(firmware, dict) else firmware
+        if file_path is None:
+            result.status = FirmwareUpdateStatus.skipped
+            result.error = Exception(f"No firmware file for device {device_id.name}")
+            return
+        result.file_path = Path(file_path)
+
+        async with semaphore:
+            start = time.monotonic()
+            while True:
+                result.attempts += 1
+                try:
+                    await self._update_device_firmware(fleet_device, result, timeout=timeout, **kwargs)
+                    result.status = FirmwareUpdateStatus.updated
+                    result.error = None
+                    break
+                except Exception as e:
+                    logging.warning(
+                        f"Firmware update of device {fleet_device.name} failed, attempt {result.attempts}: {e!r}"
+                    )
+                    result.error = e
+                    if result.attempts > retries:
+                        result.status = FirmwareUpdateStatus.failed
+                        break
+                await asyncio.sleep(retry_delay)
+            result.duration = time.monotonic() - start
+
+    async def update_firmware(
+        self,
+        firmware: Union[Path, Dict[DeviceID, Path]],
+        names: Optional[Iterable[str]] = None,
+        concurrency: int = 4,
+        window: int = 16,
+        retries: int = 2,
+        retry_delay: float = 1.0,
+        timeout: float = 30.0,
+        progress: Optional[Callable[[str, FileTransferProgress], Any]] = None,
+    ) -> FirmwareRolloutReport:
+        """
+        Updates the firmware of many devices concurrently.
+
+        Each device is switched to its bootloader if it has an application bootloader, sent the firmware file
+        and waited for until it is back online. Devices that do not support ANFW v2 firmware files, or have no
+        firmware file, are skipped. A failed attempt is retried, resuming the transfer where the device got to.
+
+        Args:
+            firmware (Union[Path, Dict[DeviceID, Path]]): Path to the firmware file (.anfw), or the path to the
+                firmware file of each device ID.
+            names (Optional[Iterable[str]], optional): The names of the devices to update. Defaults to every device.
+            concurrency (int, optional): The maximum number of devices updated at the same time. Defaults to 4.
+            window (int, optional): The maximum number of fragments waiting for an acknowledgement, see
+                AnDevice.transfer_file(). Defaults to 16.
+            retries (int, optional): The number of retries of each device after a failed attempt. Defaults to 2.
+            retry_delay (float, optional): Seconds between the attempts of a device. Defaults to 1.0.
+            timeout (float, optional): Timeout in seconds of a device coming online, before the update and
+                after it restarts. Defaults to 30.0.
+            progress (Optional[Callable[[str, FileTransferProgress], Any]], optional): Function called with the name
+                of the device and the progress of its transfer each time a fragment is acknowledged. Defaults to None.
+
+        Returns:
+            FirmwareRolloutReport: The result of each device, with the throughput of the rollout.
+        """
+        if concurrency < 1:
+            raise ValueError("The concurrency must be at least 1")
+        start = time.monotonic()
+        report = FirmwareRolloutReport(concurrency=concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+        rollouts = []
+        for name in self.devices if names is None else names:
+            result = report.results[name] = FirmwareUpdateResult(name)
+            rollouts.append(
+                self._roll_out(
+                    self.devices[name],
+                    result,
+                    firmware,
+                    semaphore,
+                    retries,
+                    retry_delay,
+                    timeout,
+                    window=window,
+                    progress=progress,
+                )
+            )
+        await asyncio.gather(*rollouts)
+        report.duration = time.monotonic() - start
+        logging.info(str(report))
+        return report
+
+    def metrics(self) -> Dict[str, FleetDeviceMetrics]:
+        """
+        Returns a snapshot of the counters of the connection of each device.
+        """
+        return {name: fleet_device.metrics() for name, fleet_device in self.devices.items()}
+
+    def close(self):
+        """
+        Closes every connection.
+        """
+        for fleet_device in self.devices.values():
+            fleet_device.device.close()
@@ -0,0 +1,205 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                         an_packet_subscription.py                          ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Type
+
+from advanced_navigation.anpp_packets.an_packet_protocol import ANFrame
+
+
+class ANPacketSubscription:
+    """
+    Stream of the received packets of a packet type, returned by AnDeviceInterface.stream().
+
+    Received packets are buffered as raw frames in a bounded buffer, dropping the oldest packet when it
+    is full, and are decoded when they are retrieved. The subscription is an async iterator of packet
+    objects, and get_batch() retrieves several packets with a single wake up of the consumer.
+
+        async with device.stream(SystemStatePacket) as subscription:
+            async for packet in subscription:
+                ...
+    """
+
+    def __init__(
+        self,
+        packet_type: Type,
+        maxsize: int = 1000,
+        on_close: Optional[Callable[["ANPacketSubscription"], Any]] = None,
+    ):
+        """
+        Initializes the subscription.
+
+        Args:
+            packet_type (Type): The class of the packets to stream.
+            maxsize (int, optional): The maximum number of buffered packets. Defaults to 1000.
+            on_close (Optional[Callable[[ANPacketSubscription], Any]], optional): Function called when the
+                subscription is closed, to stop delivering packets to it. Defaults to None.
+        """
+        if maxsize < 1:
+            raise ValueError(f"A subscription needs a maxsize of at least 1, not {maxsize}")
+        self.packet_type = packet_type
+        self.maxsize = maxsize
+        self.frames_dropped = 0
+        self._frames: Deque[ANFrame] = deque(maxlen=maxsize)
+        self._on_close = on_close
+        self._closed = False
+        self._waiter: Optional[asyncio.Future] = None
+        # Number of buffered packets the waiting consumer needs before it is woken up
+        self._wake_size = 1
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def qsize(self) -> int:
+        """Number of buffered packets"""
+        return len(self._frames)
+
+    def put_nowait(self, an_packet: ANFrame):
+        """
+        Buffers a received packet, dropping the oldest packet if the buffer is full.
+
+        Args:
+            an_packet (ANFrame): The received packet.
+        """
+        if self._closed:
+            return
+        if len(self._frames) == self.maxsize:
+            self.frames_dropped += 1
+        self._frames.append(an_packet)
+        if len(self._frames) >= self._wake_size:
+            self._wake()
+
+    def close(self):
+        """
+        Unsubscribes from the received packets. The packets already buffered can still be retrieved, after
+        which iteration stops.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wake()
+        if self._on_close is not None:
+            self._on_close(self)
+
+    def _wake(self):
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def _wait(self, size: int, timeout: Optional[float] = None):
+        """
+        Waits until at least size packets are buffered, the subscription is closed or the timeout expires.
+
+        Args:
+            size (int): The number of packets to wait for.
+            timeout (Optional[float], optional): Timeout in seconds, or None to wait indefinitely. Defaults to None.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while len(self._frames) < size and not self._closed:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return
+            self._waiter = loop.create_future()
+            self._wake_size = size
+            try:
+                await asyncio.wait((self._waiter,), timeout=remaining)
+            finally:
+                self._waiter = None
+                self._wake_size = 1
+
+    def _decode(self, an_packet: ANFrame) -> Optional[Any]:
+        packet = self.packet_type()
+        if packet.decode(an_packet) != 0:
+            logging.warning(f"Failed to decode packet {an_packet.id}")
+            return None
+        return packet
+
+    def get_frames_nowait(self, max_n: int) -> List[ANFrame]:
+        """
+        Returns up to max_n of the oldest buffered packets as raw frames, without decoding them.
+
+        Args:
+            max_n (int): The maximum number of packets to return.
+        """
+        frames = self._frames
+        count = min(max_n, len(frames))
+        return [frames.popleft() for _ in range(count)]
+
+    async def get_frames(self, max_n: int, timeout: Optional[float] = None) -> List[ANFrame]:
+        """
+        Waits until max_n packets are buffered and returns them as raw frames, without decoding them.
+        Fewer packets are returned when the timeout expires or the subscription is closed.
+
+        Args:
+            max_n (int): The maximum number of packets to return.
+            timeout (Optional[float], optional): Timeout in seconds, or None to wait indefinitely. Defaults to None.
+        """
+        await self._wait(max_n, timeout)
+        return self.get_frames_nowait(max_n)
+
+    async def get_batch(self, max_n: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Waits until max_n packets are buffered and returns them as packet objects, oldest first.
+        Fewer packets are returned when the timeout expires or the subscription is closed.
+
+        Args:
+            max_n (int): The maximum number of packets to return.
+            timeout (Optional[float], optional): Timeout in seconds, or None to wait indefinitely. Defaults to None.
+
+        Returns:
+            List[Any]: The decoded packet objects, without the packets that failed to decode.
+        """
+        packets = []
+        for an_packet in await self.get_frames(max_n, timeout):
+            packet = self._decode(an_packet)
+            if packet is not None:
+                packets.append(packet)
+        return packets
+
+    def __aiter__(self) -> "ANPacketSubscription":
+        return self
+
+    async def __anext__(self) -> Any:
+        while True:
+            if not self._frames:
+                await self._wait(1)
+                if not self._frames:
+                    raise StopAsyncIteration
+            packet = self._decode(self._frames.popleft())
+            if packet is not None:
+                return packet
+
+    async def __aenter__(self) -> "ANPacketSubscription":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,223 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                            an_receive_queue.py                             ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict, Final, List, Optional, Tuple
+
+from advanced_navigation.anpp_packets.an_packets import PacketID
+from advanced_navigation.anpp_packets.an_packet_protocol import ANFrame
+
+# Responses that are never dropped or conflated, whatever the queue policy
+NEVER_DROPPED_PACKET_IDS: Final = frozenset(
+    {PacketID.acknowledge, PacketID.file_transfer_acknowledge}
+)
+
+
+class QueuePolicy(Enum):
+    """Backpressure policy of the received packets of a packet ID"""
+
+    unbounded = 0  # Every packet is kept
+    drop_oldest = 1  # At most maxsize packets are kept, the oldest is dropped first
+    conflate = 2  # Only the latest packet is kept, in the place of the oldest
+
+
+class ANReceiveQueue:
+    """
+    Queue of received packets, with a backpressure policy for each packet ID.
+
+    Packets are returned in the order they were received. Each queued packet is held in a cell, a
+    one item list, so that a dropped packet is removed from the middle of the queue by clearing its
+    cell, and a conflated packet is replaced in place.
+    """
+
+    def __init__(
+        self,
+        default_policy: QueuePolicy = QueuePolicy.unbounded,
+        default_maxsize: int = 0,
+    ):
+        """
+        Initializes the queue.
+
+        Args:
+            default_policy (QueuePolicy, optional): The policy of the packet IDs without a policy. Defaults to unbounded.
+            default_maxsize (int, optional): The maximum number of queued packets of each packet ID for the
+                drop_oldest policy. Defaults to 0.
+        """
+        self._cells: Deque[List[Optional[ANFrame]]] = deque()
+        self._size = 0
+        self._dropped_cells = 0  # Cleared cells still in _cells
+        self._getter: Optional[asyncio.Future] = None
+        self._policies: Dict[int, Tuple[QueuePolicy, int]] = {}
+        self._default_policy = (default_policy, default_maxsize)
+        # Queued cells of each packet ID with the drop_oldest policy, oldest first
+        self._bounded_cells: Dict[int, Deque[List[Optional[ANFrame]]]] = {}
+        # Queued cell of each packet ID with the conflate policy
+        self._conflated_cells: Dict[int, List[Optional[ANFrame]]] = {}
+        self.frames_dropped = 0
+        self.frames_conflated = 0
+        # Time the last returned packet and the slowest packet spent between being received and returned,
+        # in nanoseconds, for packets stamped with a receive time
+        self.latency_ns = 0
+        self.max_latency_ns = 0
+        self._closed = False
+        self._check_policy(default_policy, default_maxsize)
+
+    @staticmethod
+    def _check_policy(policy: QueuePolicy, maxsize: int):
+        if policy == QueuePolicy.drop_oldest and maxsize < 1:
+            raise ValueError(f"The drop_oldest policy needs a maxsize of at least 1, not {maxsize}")
+
+    def set_policy(self, packet_id: int, policy: Optional[QueuePolicy], maxsize: int = 1):
+        """
+        Sets the policy of a packet ID, applied to the packets queued from now on.
+
+        Args:
+            packet_id (int): The packet ID.
+            policy (Optional[QueuePolicy]): The policy, or None for the default policy.
+            maxsize (int, optional): The maximum number of queued packets for the drop_oldest policy. Defaults to 1.
+        """
+        if packet_id in NEVER_DROPPED_PACKET_IDS:
+            raise ValueError(f"Packet {packet_id} is never dropped")
+        if policy is None:
+            self._policies.pop(packet_id, None)
+        else:
+            self._check_policy(policy, maxsize)
+            self._policies[packet_id] = (policy, maxsize)
+
+    def get_policy(self, packet_id: int) -> Tuple[QueuePolicy, int]:
+        """
+        Returns the policy and maximum size applied to a packet ID.
+
+        Args:
+            packet_id (int): The packet ID.
+        """
+        if packet_id in NEVER_DROPPED_PACKET_IDS:
+            return QueuePolicy.unbounded, 0
+        return self._policies.get(packet_id, self._default_policy)
+
+    def qsize(self) -> int:
+        """Number of packets in the queue"""
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def put_nowait(self, an_packet: ANFrame):
+        """
+        Queues a received packet following the policy of its packet ID.
+
+        Args:
+            an_packet (ANFrame): The received packet.
+        """
+        packet_id = an_packet.id
+        policy, maxsize = self.get_policy(packet_id)
+
+        if policy == QueuePolicy.conflate:
+            cell = self._conflated_cells.get(packet_id)
+            if cell is not None:
+                cell[0] = an_packet
+                self.frames_conflated += 1
+                return
+            cell = [an_packet]
+            self._conflated_cells[packet_id] = cell
+        elif policy == QueuePolicy.drop_oldest:
+            cells = self._bounded_cells.get(packet_id)
+            if cells is None:
+                cells = self._bounded_cells[packet_id] = deque()
+            while len(cells) >= maxsize:
+                cells.popleft()[0] = None
+                self._size -= 1
+                self._dropped_cells += 1
+                self.frames_dropped += 1
+            if self._dropped_cells > max(self._size, 1024):
+                # Remove the cleared cells when they outnumber the queued packets, so that memory
+                # stays bounded while the consumer is stalled
+                self._cells = deque(cell for cell in self._cells if cell[0] is not None)
+                self._dropped_cells = 0
+            cell = [an_packet]
+            cells.append(cell)
+        else:
+            cell = [an_packet]
+
+        self._cells.append(cell)
+        self._size += 1
+        if self._getter is not None and not self._getter.done():
+            self._getter.set_result(None)
+
+    def get_nowait(self) -> ANFrame:
+        """
+        Returns the oldest queued packet. Raises asyncio.QueueEmpty if the queue is empty.
+        """
+        while self._cells:
+            cell = self._cells.popleft()
+            an_packet = cell[0]
+            if an_packet is None:
+                # Dropped packet
+                self._dropped_cells -= 1
+                continue
+            self._size -= 1
+            packet_id = an_packet.id
+            if self._conflated_cells.get(packet_id) is cell:
+                del self._conflated_cells[packet_id]
+            else:
+                cells = self._bounded_cells.get(packet_id)
+                if cells and cells[0] is cell:
+                    cells.popleft()
+            if an_packet.timestamp:
+                self.latency_ns = time.monotonic_ns() - an_packet.timestamp
+                if self.latency_ns > self.max_latency_ns:
+                    self.max_latency_ns = self.latency_ns
+            return an_packet
+        raise asyncio.QueueEmpty
+
+    def close(self):
+        """
+        Marks the end of the received packets, once the connection is lost. The queued packets can still be returned.
+        """
+        self._closed = True
+        if self._getter is not None and not self._getter.done():
+            self._getter.set_result(None)
+
+    async def get(self) -> ANFrame:
+        """
+        Returns the oldest queued packet, waiting for a packet if the queue is empty. Raises asyncio.QueueEmpty
+        if the queue is empty and closed.
+        """
+        while self._size == 0:
+            if self._closed:
+                raise asyncio.QueueEmpty
+            self._getter = asyncio.get_running_loop().create_future()
+            try:
+                await self._getter
+            finally:
+                self._getter = None
+        return self.get_nowait()
@@ -1,4 +1,17 @@
-__all__ = ['an_packet_protocol',
+"""
+Advanced Navigation Packet Protocol packets.
+
+The packet modules are imported lazily: a module listed in __all__, or a packet
+class such as SystemStatePacket, is only imported when it is first accessed as
+an attribute of this package.
+"""
+
+import importlib
+from typing import Any, Dict, Optional, Tuple
+
+__all__ = ['an_packet_bitfield',
+           'an_packet_protocol',
+           'an_packet_registry',
            'an_packets',
            'an_packet_0',
            'an_packet_1',
@@ -96,3 +109,41 @@ __all__ = ['an_packet_protocol',
            'an_packet_207',
            'an_packet_208',
            'an_packet_209']
+
+
+# Modules that require an optional dependency (numpy), left out of __all__ so
+# that "from advanced_navigation.anpp_packets import *" works without it
+_OPTIONAL_MODULES = ('an_packet_batch',)
+
+# Module and class name of each packet class, built on first use
+_packet_class_locations: Optional[Dict[str, Tuple[str, str]]] = None
+
+
+def _get_packet_class_locations() -> Dict[str, Tuple[str, str]]:
+    global _packet_class_locations
+    if _packet_class_locations is None:
+        from .an_packet_registry import _PACKET_CLASSES, _PACKET_VARIANTS
+
+        _packet_class_locations = {}
+        for location in (*_PACKET_CLASSES.values(), *_PACKET_VARIANTS):
+            # Classes sharing a name are only reachable through their module
+            _packet_class_locations.setdefault(location[1], location)
+    return _packet_class_locations
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__ or name in _OPTIONAL_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    location = _get_packet_class_locations().get(name)
+    if location is not None:
+        module = importlib.import_module(f"{__name__}.{location[0]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__, *_get_packet_class_locations()})
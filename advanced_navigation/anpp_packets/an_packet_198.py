@@ -45,7 +45,7 @@ class UserDataPacket:
         """Decode ANPacket to User Data Packet
         Returns 0 on success and 1 on failure"""
         if (an_packet.id == self.ID) and (len(an_packet.data) == self.LENGTH):
-            self.user_data = an_packet.data[0 : self.LENGTH]
+            self.user_data = bytes(an_packet.data[0 : self.LENGTH])
             return 0
         else:
             return 1
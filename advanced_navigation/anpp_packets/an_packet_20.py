@@ -33,6 +33,7 @@ from typing import List
 import struct
 from .an_packets import PacketID
 from .an_packet_protocol import ANPacket
+from .an_packet_bitfield import LazyBitfield
 
 
 class GNSSFixType(Enum):
@@ -49,7 +50,7 @@ class GNSSFixType(Enum):
 
 
 @dataclass()
-class SystemStatus:
+class SystemStatus(LazyBitfield):
     """System Status"""
 
     system_failure: bool = False
@@ -69,28 +70,53 @@ class SystemStatus:
     gnss_antenna_disconnected: bool = False
     data_output_overflow_alarm: bool = False
 
-    def unpack(self, data):
-        """Unpack data bytes"""
-        self.system_failure = (data & (1 << 0)) != 0
-        self.accelerometer_sensor_failure = (data & (1 << 1)) != 0
-        self.gyroscope_sensor_failure = (data & (1 << 2)) != 0
-        self.magnetometer_sensor_failure = (data & (1 << 3)) != 0
-        self.pressure_sensor_failure = (data & (1 << 4)) != 0
-        self.gnss_failure = (data & (1 << 5)) != 0
-        self.accelerometer_over_range = (data & (1 << 6)) != 0
-        self.gyroscope_over_range = (data & (1 << 7)) != 0
-        self.magnetometer_over_range = (data & (1 << 8)) != 0
-        self.pressure_over_range = (data & (1 << 9)) != 0
-        self.minimum_temperature_alarm = (data & (1 << 10)) != 0
-        self.maximum_temperature_alarm = (data & (1 << 11)) != 0
-        self.low_voltage_alarm = (data & (1 << 12)) != 0
-        self.high_voltage_alarm = (data & (1 << 13)) != 0
-        self.gnss_antenna_disconnected = (data & (1 << 14)) != 0
-        self.data_output_overflow_alarm = (data & (1 << 15)) != 0
+    FLAG_MASK = 0xFFFF
+
+    def _unpack_flags(self, data):
+        """Returns the flags decoded from the raw value"""
+        return {
+            "system_failure": (data & (1 << 0)) != 0,
+            "accelerometer_sensor_failure": (data & (1 << 1)) != 0,
+            "gyroscope_sensor_failure": (data & (1 << 2)) != 0,
+            "magnetometer_sensor_failure": (data & (1 << 3)) != 0,
+            "pressure_sensor_failure": (data & (1 << 4)) != 0,
+            "gnss_failure": (data & (1 << 5)) != 0,
+            "accelerometer_over_range": (data & (1 << 6)) != 0,
+            "gyroscope_over_range": (data & (1 << 7)) != 0,
+            "magnetometer_over_range": (data & (1 << 8)) != 0,
+            "pressure_over_range": (data & (1 << 9)) != 0,
+            "minimum_temperature_alarm": (data & (1 << 10)) != 0,
+            "maximum_temperature_alarm": (data & (1 << 11)) != 0,
+            "low_voltage_alarm": (data & (1 << 12)) != 0,
+            "high_voltage_alarm": (data & (1 << 13)) != 0,
+            "gnss_antenna_disconnected": (data & (1 << 14)) != 0,
+            "data_output_overflow_alarm": (data & (1 << 15)) != 0,
+        }
+
+    def pack(self) -> int:
+        """Pack the flags into the raw value"""
+        data = 0
+        data |= int(self.system_failure) << 0
+        data |= int(self.accelerometer_sensor_failure) << 1
+        data |= int(self.gyroscope_sensor_failure) << 2
+        data |= int(self.magnetometer_sensor_failure) << 3
+        data |= int(self.pressure_sensor_failure) << 4
+        data |= int(self.gnss_failure) << 5
+        data |= int(self.accelerometer_over_range) << 6
+        data |= int(self.gyroscope_over_range) << 7
+        data |= int(self.magnetometer_over_range) << 8
+        data |= int(self.pressure_over_range) << 9
+        data |= int(self.minimum_temperature_alarm) << 10
+        data |= int(self.maximum_temperature_alarm) << 11
+        data |= int(self.low_voltage_alarm) << 12
+        data |= int(self.high_voltage_alarm) << 13
+        data |= int(self.gnss_antenna_disconnected) << 14
+        data |= int(self.data_output_overflow_alarm) << 15
+        return data
 
 
 @dataclass()
-class FilterStatus:
+class FilterStatus(LazyBitfield):
     """Filter Status"""
 
     orientation_filter_initialised: bool = False
@@ -108,22 +134,45 @@ class FilterStatus:
     external_velocity_active: bool = False
     external_heading_active: bool = False
 
-    def unpack(self, data):
-        """Unpack data bytes"""
-        self.orientation_filter_initialised = (data & (1 << 0)) != 0
-        self.ins_filter_initialised = (data & (1 << 1)) != 0
-        self.heading_initialised = (data & (1 << 2)) != 0
-        self.utc_time_initialised = (data & (1 << 3)) != 0
-        self.gnss_fix_type = GNSSFixType((data & 0x0070) >> 4)
-        self.event1_flag = (data & (1 << 7)) != 0
-        self.event2_flag = (data & (1 << 8)) != 0
-        self.internal_gnss_enabled = (data & (1 << 9)) != 0
-        self.magnetic_heading_enabled = (data & (1 << 10)) != 0
-        self.velocity_heading_enabled = (data & (1 << 11)) != 0
-        self.atmospheric_altitude_enabled = (data & (1 << 12)) != 0
-        self.external_position_active = (data & (1 << 13)) != 0
-        self.external_velocity_active = (data & (1 << 14)) != 0
-        self.external_heading_active = (data & (1 << 15)) != 0
+    FLAG_MASK = 0xFFFF
+
+    def _unpack_flags(self, data):
+        """Returns the flags decoded from the raw value"""
+        return {
+            "orientation_filter_initialised": (data & (1 << 0)) != 0,
+            "ins_filter_initialised": (data & (1 << 1)) != 0,
+            "heading_initialised": (data & (1 << 2)) != 0,
+            "utc_time_initialised": (data & (1 << 3)) != 0,
+            "gnss_fix_type": GNSSFixType((data & 0x0070) >> 4),
+            "event1_flag": (data & (1 << 7)) != 0,
+            "event2_flag": (data & (1 << 8)) != 0,
+            "internal_gnss_enabled": (data & (1 << 9)) != 0,
+            "magnetic_heading_enabled": (data & (1 << 10)) != 0,
+            "velocity_heading_enabled": (data & (1 << 11)) != 0,
+            "atmospheric_altitude_enabled": (data & (1 << 12)) != 0,
+            "external_position_active": (data & (1 << 13)) != 0,
+            "external_velocity_active": (data & (1 << 14)) != 0,
+            "external_heading_active": (data & (1 << 15)) != 0,
+        }
+
+    def pack(self) -> int:
+        """Pack the flags into the raw value"""
+        data = 0
+        data |= int(self.orientation_filter_initialised) << 0
+        data |= int(self.ins_filter_initialised) << 1
+        data |= int(self.heading_initialised) << 2
+        data |= int(self.utc_time_initialised) << 3
+        data |= (self.gnss_fix_type.value << 4) & 0x0070
+        data |= int(self.event1_flag) << 7
+        data |= int(self.event2_flag) << 8
+        data |= int(self.internal_gnss_enabled) << 9
+        data |= int(self.magnetic_heading_enabled) << 10
+        data |= int(self.velocity_heading_enabled) << 11
+        data |= int(self.atmospheric_altitude_enabled) << 12
+        data |= int(self.external_position_active) << 13
+        data |= int(self.external_velocity_active) << 14
+        data |= int(self.external_heading_active) << 15
+        return data
 
 
 @dataclass()
@@ -150,6 +199,8 @@ class SystemStatePacket:
 
     ID = PacketID.system_state
     LENGTH = 100
+    # decode() overwrites every field, so a packet object can be decoded into again
+    REUSABLE = True
 
     _structure = struct.Struct("<HHIIdddffffffffffffffff")
 
@@ -168,11 +219,13 @@ class SystemStatePacket:
                 self.height,
             ) = values[2:7]
 
-            self.velocity = list(values[7:10])
-            self.body_acceleration = list(values[10:13])
-            (self.g_force, *self.orientation) = values[13:17]
-            self.angular_velocity = list(values[17:20])
-            self.standard_deviation = list(values[20:23])
+            # Lists are filled in place so that a packet object can be reused
+            self.velocity[:] = values[7:10]
+            self.body_acceleration[:] = values[10:13]
+            self.g_force = values[13]
+            self.orientation[:] = values[14:17]
+            self.angular_velocity[:] = values[17:20]
+            self.standard_deviation[:] = values[20:23]
             return 0
         else:
             return 1
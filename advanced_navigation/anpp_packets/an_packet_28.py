@@ -47,6 +47,8 @@ class RawSensorsPacket:
 
     ID = PacketID.raw_sensors
     LENGTH = 48
+    # decode() overwrites every field, so a packet object can be decoded into again
+    REUSABLE = True
 
     _structure = struct.Struct("<ffffffffffff")
 
@@ -55,9 +57,9 @@ class RawSensorsPacket:
         Returns 0 on success and 1 on failure"""
         if (an_packet.id == self.ID) and (len(an_packet.data) == self.LENGTH):
             values = self._structure.unpack_from(an_packet.data)
-            self.accelerometers = list(values[0:3])
-            self.gyroscopes = list(values[3:6])
-            self.magnetometers = list(values[6:9])
+            self.accelerometers[:] = values[0:3]
+            self.gyroscopes[:] = values[3:6]
+            self.magnetometers[:] = values[6:9]
 
             (self.imu_temperature, self.pressure, self.pressure_temperature) = values[
                 9:12
@@ -42,6 +42,8 @@ class EulerOrientationPacket:
 
     ID = PacketID.euler_orientation
     LENGTH = 12
+    # decode() overwrites every field, so a packet object can be decoded into again
+    REUSABLE = True
 
     _structure = struct.Struct("<fff")
 
@@ -49,7 +51,7 @@ class EulerOrientationPacket:
         """Decode ANPacket to Euler Orientation Packet
         Returns 0 on success and 1 on failure"""
         if (an_packet.id == self.ID) and (len(an_packet.data) == self.LENGTH):
-            self.orientation = list(self._structure.unpack_from(an_packet.data))
+            self.orientation[:] = self._structure.unpack_from(an_packet.data)
             return 0
         else:
             return 1
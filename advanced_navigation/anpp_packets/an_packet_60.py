@@ -33,11 +33,12 @@ from typing import List
 import struct
 from .an_packets import PacketID
 from .an_packet_protocol import ANPacket
+from .an_packet_bitfield import LazyBitfield
 from .an_packet_31 import SatelliteSystem
 
 
 @dataclass()
-class TrackingStatus:
+class TrackingStatus(LazyBitfield):
     """Tracking Status"""
 
     carrier_phase_valid: bool = False
@@ -47,14 +48,29 @@ class TrackingStatus:
     doppler_valid: bool = False
     snr_valid: bool = False
 
-    def unpack(self, data):
-        """Unpack data bytes"""
-        self.carrier_phase_valid = (data & (1 << 0)) != 0
-        self.carrier_phase_cycle_slip_detected = (data & (1 << 1)) != 0
-        self.carrier_phase_half_cycle_ambiguity = (data & (1 << 2)) != 0
-        self.pseudo_range_valid = (data & (1 << 3)) != 0
-        self.doppler_valid = (data & (1 << 4)) != 0
-        self.snr_valid = (data & (1 << 5)) != 0
+    FLAG_MASK = 0x003F
+
+    def _unpack_flags(self, data):
+        """Returns the flags decoded from the raw value"""
+        return {
+            "carrier_phase_valid": (data & (1 << 0)) != 0,
+            "carrier_phase_cycle_slip_detected": (data & (1 << 1)) != 0,
+            "carrier_phase_half_cycle_ambiguity": (data & (1 << 2)) != 0,
+            "pseudo_range_valid": (data & (1 << 3)) != 0,
+            "doppler_valid": (data & (1 << 4)) != 0,
+            "snr_valid": (data & (1 << 5)) != 0,
+        }
+
+    def pack(self) -> int:
+        """Pack the flags into the raw value"""
+        data = 0
+        data |= int(self.carrier_phase_valid) << 0
+        data |= int(self.carrier_phase_cycle_slip_detected) << 1
+        data |= int(self.carrier_phase_half_cycle_ambiguity) << 2
+        data |= int(self.pseudo_range_valid) << 3
+        data |= int(self.doppler_valid) << 4
+        data |= int(self.snr_valid) << 5
+        return data
 
 
 class GPSSatelliteFrequency(Enum):
@@ -45,6 +45,8 @@ class VesselMotionPacket:
 
     ID = PacketID.vessel_motion
     LENGTH = 48
+    # decode() overwrites every field, so a packet object can be decoded into again
+    REUSABLE = True
 
     _structure = struct.Struct("<ffffffffffff")
 
@@ -53,9 +55,9 @@ class VesselMotionPacket:
         Returns 0 on success and 1 on failure"""
         if (an_packet.id == self.ID) and (len(an_packet.data) == self.LENGTH):
             values = self._structure.unpack_from(an_packet.data)
-            self.surge = list(values[0:4])
-            self.sway = list(values[4:8])
-            self.heave = list(values[8:12])
+            self.surge[:] = values[0:4]
+            self.sway[:] = values[4:8]
+            self.heave[:] = values[8:12]
             return 0
         else:
             return 1
\ No newline at end of file
@@ -91,6 +91,8 @@ class GNSSPositionVelocityTimePacket:
 
     ID = PacketID.gnss_position_velocity_time
     LENGTH = 76
+    # decode() overwrites every field, so a packet object can be decoded into again
+    REUSABLE = True
 
     _structure = struct.Struct("<BBHIIdddfffffffffI")
     
@@ -108,10 +110,10 @@ class GNSSPositionVelocityTimePacket:
                 self.posix_time_s = values[3]
                 self.posix_time_micros = values[4]
 
-                self.position = list(values[5:8])                    
-                self.position_standard_deviation = list(values[8:11]) 
-                self.velocity = list(values[11:14])                   
-                self.velocity_standard_deviation = list(values[14:17])
+                self.position[:] = values[5:8]
+                self.position_standard_deviation[:] = values[8:11]
+                self.velocity[:] = values[11:14]
+                self.velocity_standard_deviation[:] = values[14:17]
                 
                 self.latency_micros = values[17]
 
@@ -32,22 +32,36 @@ import struct
 from typing import List
 from .an_packets import PacketID
 from .an_packet_protocol import ANPacket
+from .an_packet_bitfield import LazyBitfield
 
 
 @dataclass()
-class AidingSourceStatus:
+class AidingSourceStatus(LazyBitfield):
     """Aiding Source Status Flags"""
     online: bool = False
     valid: bool = False
     origin: int = 0
 
-    def unpack(self, data: int):
-        """Unpack data bytes"""
-        self.online = (data & (1 << 0)) != 0
-        self.valid = (data & (1 << 1)) != 0
-        # Bits 2-9 are reserved.
-        # Bits 10-15 define the origin (6 bits wide). Shift right by 10, mask with 0x3F (00111111).
-        self.origin = (data >> 10) & 0x3F
+    # Bits 2-9 are reserved
+    FLAG_MASK = 0xFC03
+
+    def _unpack_flags(self, data: int):
+        """Returns the flags decoded from the raw value"""
+        return {
+            "online": (data & (1 << 0)) != 0,
+            "valid": (data & (1 << 1)) != 0,
+            # Bits 2-9 are reserved.
+            # Bits 10-15 define the origin (6 bits wide). Shift right by 10, mask with 0x3F (00111111).
+            "origin": (data >> 10) & 0x3F,
+        }
+
+    def pack(self) -> int:
+        """Pack the flags into the raw value"""
+        data = 0
+        data |= int(self.online) << 0
+        data |= int(self.valid) << 1
+        data |= (self.origin & 0x3F) << 10
+        return data
 
 
 @dataclass()
@@ -0,0 +1,166 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                             an_packet_batch.py                             ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+"""
+Columnar decoding of many fixed length packets of one type.
+
+Instead of creating a packet object for every packet, the payloads of all
+packets of one ID are joined and read by a single numpy.frombuffer call into a
+structured array. Each field of the packet class becomes a column of the
+array, with the list fields (e.g. velocity) as sub-arrays. Status and enum
+fields are kept as their raw integer values.
+
+This module requires numpy, installed with the numpy extra of the package.
+"""
+
+import dataclasses
+import re
+import struct
+from typing import Any, Dict, Final, Iterable, List, Tuple, Type, Union
+
+import numpy as np
+
+from .an_packet_protocol import ANFrame, ANPacket
+
+# numpy type of each struct format code with a fixed size
+_NUMPY_TYPES: Final[Dict[str, str]] = {
+    "b": "i1",
+    "B": "u1",
+    "?": "?",
+    "h": "i2",
+    "H": "u2",
+    "i": "i4",
+    "I": "u4",
+    "l": "i4",
+    "L": "u4",
+    "q": "i8",
+    "Q": "u8",
+    "e": "f2",
+    "f": "f4",
+    "d": "f8",
+}
+
+_FORMAT_CODE: Final = re.compile(r"\s*(\d*)(\D)")
+
+# Structured data type of each packet class, built on first use
+_dtypes: Dict[type, Any] = {}
+
+
+def _format_fields(structure: struct.Struct) -> List[Tuple[str, int]]:
+    """Returns the numpy type and byte offset of every value of a little endian
+    struct format. Padding bytes are skipped."""
+    fmt = structure.format
+    if not fmt.startswith("<"):
+        raise ValueError(f"Only little endian formats are supported, not {fmt!r}")
+
+    values = []
+    offset = 0
+    for count, code in _FORMAT_CODE.findall(fmt[1:]):
+        count = int(count) if count else 1
+        if code == "x":
+            offset += count
+            continue
+        if code not in _NUMPY_TYPES:
+            raise ValueError(f"Format code {code!r} has no fixed size numpy type")
+        size = struct.calcsize(f"<{code}")
+        for _ in range(count):
+            values.append((f"<{_NUMPY_TYPES[code]}", offset))
+            offset += size
+    return values
+
+
+def _field_length(packet_field: dataclasses.Field) -> int:
+    """Returns the number of struct values stored in a packet field"""
+    if packet_field.default_factory is not dataclasses.MISSING:
+        default = packet_field.default_factory()
+    else:
+        default = packet_field.default
+    return len(default) if isinstance(default, list) else 1
+
+
+def packet_dtype(packet_class: Type) -> np.dtype:
+    """Returns the numpy structured data type of the payload of a fixed length packet.
+
+    Args:
+        packet_class: The packet class, e.g. SystemStatePacket.
+
+    Raises:
+        ValueError: If the packet fields do not map onto the values of the
+            packet structure, such as for variable length packets.
+    """
+    dtype = _dtypes.get(packet_class)
+    if dtype is not None:
+        return dtype
+
+    structure = getattr(packet_class, "_structure", None)
+    length = getattr(packet_class, "LENGTH", None)
+    if not isinstance(structure, struct.Struct) or structure.size != length:
+        raise ValueError(f"{packet_class.__name__} is not a fixed length packet")
+
+    values = _format_fields(structure)
+    names, formats, offsets = [], [], []
+    index = 0
+    for packet_field in dataclasses.fields(packet_class):
+        count = _field_length(packet_field)
+        field_values = values[index : index + count]
+        if len(field_values) != count or len({value[0] for value in field_values}) != 1:
+            raise ValueError(
+                f"{packet_class.__name__}.{packet_field.name} does not match the packet structure"
+            )
+        names.append(packet_field.name)
+        formats.append(field_values[0][0] if count == 1 else (field_values[0][0], (count,)))
+        offsets.append(field_values[0][1])
+        index += count
+    if index != len(values):
+        raise ValueError(f"{packet_class.__name__} fields do not cover the packet structure")
+
+    dtype = np.dtype({"names": names, "formats": formats, "offsets": offsets, "itemsize": length})
+    _dtypes[packet_class] = dtype
+    return dtype
+
+
+def decode_batch(packet_class: Type, packets: Iterable[Union[ANFrame, ANPacket]]) -> np.ndarray:
+    """Decodes every packet of a fixed length packet type into a numpy structured array.
+
+    Args:
+        packet_class: The packet class, e.g. SystemStatePacket.
+        packets: Decoded ANPP packets, such as those returned by ANDecoder.decode_all().
+            Packets with another ID or length are skipped.
+
+    Returns:
+        An array with one row per packet, with the fields of the packet class
+        as columns, e.g. decode_batch(SystemStatePacket, packets)["latitude"].
+    """
+    dtype = packet_dtype(packet_class)
+    packet_id = packet_class.ID
+    length = packet_class.LENGTH
+    payload = b"".join(
+        packet.data for packet in packets if packet.id == packet_id and len(packet.data) == length
+    )
+    return np.frombuffer(payload, dtype=dtype)
@@ -0,0 +1,167 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                           an_packet_bitfield.py                            ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+"""
+Base class of the flag structures decoded from a bit field.
+
+Most consumers of status flags only check whether the flags changed, so the
+flag structures keep the raw value of the bit field when a packet is decoded.
+The flags are decoded the first time one of them is read, and the decoded
+flags are kept until the next unpack().
+"""
+
+from typing import Any, Union
+
+# Raw values kept decoded per flag structure, a device reports few distinct values
+_DECODED_FLAGS_LIMIT = 256
+
+
+class _LazyFlag:
+    """Class attribute of a flag, read when the flag is not yet decoded. The
+    decoded flags are stored in the instance, which takes precedence."""
+
+    def __init__(self, name: str, default: Any):
+        self.name = name
+        self.default = default
+
+    def __get__(self, instance, owner=None) -> Any:
+        if instance is None:
+            return self.default
+        attributes = instance.__dict__
+        raw = attributes.get("_raw")
+        if raw is None:
+            return self.default
+        # The raw value is kept, as it is still valid
+        flags = type(instance)._decoded_flags.get(raw)
+        if flags is None:
+            instance._decode_flags(raw)
+            return attributes[self.name]
+        attributes.update(flags)
+        return flags[self.name]
+
+
+def _flags_init(class_name: str, names: tuple):
+    """Returns the __init__ of a flag structure with the given flags"""
+    known_names = frozenset(names)
+
+    def __init__(self, *args, **kwargs):
+        if not (args or kwargs):
+            return
+        if len(args) > len(names):
+            raise TypeError(f"{class_name}() takes at most {len(names)} positional arguments")
+        attributes = self.__dict__
+        attributes.update(zip(names, args))
+        for name, value in kwargs.items():
+            if name not in known_names:
+                raise TypeError(f"{class_name}() got an unexpected keyword argument '{name}'")
+            attributes[name] = value
+
+    return __init__
+
+
+class LazyBitfield:
+    """Flag structure that decodes its flags from the raw bit field on first access.
+
+    Subclasses are dataclasses with a field per flag that implement
+    _unpack_flags(data) to return every flag decoded from the raw value, and
+    pack() to build the raw value from the flags. FLAG_MASK holds the bits of
+    the raw value that define a flag.
+    """
+
+    FLAG_MASK = -1
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._decoded_flags = {}
+        names = tuple(cls.__dict__.get("__annotations__", {}))
+        for name in names:
+            if name in cls.__dict__:
+                setattr(cls, name, _LazyFlag(name, cls.__dict__[name]))
+        if "__init__" not in cls.__dict__ and all(name in cls.__dict__ for name in names):
+            # Set by the class instead of the dataclass decorator, so that a new flag structure
+            # stores only the given flags and reads the others from their defaults, rather than
+            # setting every flag through __setattr__
+            cls.__init__ = _flags_init(cls.__name__, names)
+
+    def unpack(self, data: int):
+        """Unpack data bytes, the flags are decoded when first read"""
+        attributes = self.__dict__
+        attributes.clear()
+        attributes["_raw"] = data
+
+    def _unpack_flags(self, data: int) -> dict:
+        raise NotImplementedError
+
+    def pack(self) -> int:
+        raise NotImplementedError
+
+    def _decode_flags(self, raw: int):
+        """Decodes every flag from the raw value.
+
+        The flags are added together, as a decoded packet may be read by several
+        threads: a flag is read from the class default only while the raw value
+        is absent, so the raw value must stay until every flag is set. The flags
+        are immutable values, so they are shared by every instance decoded from
+        the same raw value."""
+        decoded_flags = type(self)._decoded_flags
+        flags = decoded_flags.get(raw)
+        if flags is None:
+            flags = self._unpack_flags(raw)
+            if len(decoded_flags) >= _DECODED_FLAGS_LIMIT:
+                decoded_flags.clear()
+            decoded_flags[raw] = flags
+        self.__dict__.update(flags)
+
+    def _decode(self) -> int:
+        """Decodes every flag from the raw value, removes the raw value and returns it"""
+        attributes = self.__dict__
+        raw = attributes["_raw"]
+        self._decode_flags(raw)
+        attributes.pop("_raw", None)
+        return raw
+
+    def __setattr__(self, name: str, value: Any):
+        # Setting a flag makes the raw value stale, so keep the decoded flags instead
+        if "_raw" in self.__dict__:
+            self._decode()
+        object.__setattr__(self, name, value)
+
+    @property
+    def raw(self) -> int:
+        """The raw value of the bit field"""
+        raw = self.__dict__.get("_raw")
+        return raw if raw is not None else self.pack()
+
+    def changed_since(self, previous: Union["LazyBitfield", int]) -> bool:
+        """Returns True if any flag differs from previous, a flag structure or raw value.
+        Keep the raw value when the packet object is reused for every packet.
+        Reserved bits are ignored."""
+        if not isinstance(previous, int):
+            previous = previous.raw
+        return (self.raw ^ previous) & self.FLAG_MASK != 0
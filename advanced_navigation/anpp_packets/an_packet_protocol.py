@@ -27,7 +27,7 @@
 # DEALINGS IN THE SOFTWARE.                                                    #
 ################################################################################
 from dataclasses import dataclass, field
-from typing import Final
+from typing import Any, Final, Iterable, Iterator, List, NamedTuple, Optional
 from array import array
 from struct import pack
 import struct
@@ -118,83 +118,414 @@ class ANPacket:
         return self.header + self.data
 
 
+class ANFrame(NamedTuple):
+    """Immutable ANPP frame produced by ANDecoder.decode_all(). It can be passed
+    to the packet classes' decode() in place of an ANPacket."""
+
+    id: int
+    length: int
+    data: bytes  # bytes, or a memoryview when produced by ANRingDecoder
+    timestamp: int = 0  # Receive time in nanoseconds, 0 if unknown
+
+    @property
+    def header(self) -> bytes:
+        """Returns the packet header, rebuilt from the frame contents"""
+        crc = calculate_crc16(self.data)
+        crc_low, crc_high = crc & 0xFF, crc >> 8
+        lrc = calculate_header_lrc(bytes([self.id, self.length, crc_low, crc_high]))
+        return ANPacket._structure.pack(lrc, self.id, self.length, crc_low, crc_high)
+
+    def bytes(self):
+        """Returns the packet as byte array"""
+        return self.header + bytes(self.data)
+
+
+# Packet IDs accepted by the decoders, indexed by ID byte. 82 is not part of
+# PacketID but is still emitted by some devices.
+_DECODER_PACKET_IDS: Final = bytes(
+    1 if (i in PacketID._value2member_map_ or i == 82) else 0 for i in range(256)
+)
+
+# Out of sync data shorter than this is searched byte by byte, longer runs are
+# searched with numpy (when available) in blocks of _RESYNC_BLOCK_SIZE bytes.
+_RESYNC_VECTOR_MINIMUM = 256
+_RESYNC_BLOCK_SIZE = 64 * 1024
+
+
+# numpy is optional and slow to import, so it is imported the first time a long
+# run of out of sync data is searched. False when numpy is not installed.
+_numpy: Any = None
+
+
+def _import_numpy():
+    """Returns the numpy module, or False if numpy is not installed"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy
+
+
+def _valid_header_lrc(buffer, index: int) -> bool:
+    """Returns True if the header LRC at index is valid"""
+    return (
+        buffer[index]
+        + buffer[index + 1]
+        + buffer[index + 2]
+        + buffer[index + 3]
+        + buffer[index + 4]
+    ) & 0xFF == 0
+
+
+def _find_headers(buffer, start: int, end: int):
+    """Yields every offset in buffer[start:end] holding a header with a valid LRC
+    and a known packet ID. Only the header is checked, not the packet CRC."""
+    last = end - AN_PACKET_HEADER_SIZE + 1
+    np = _import_numpy() if (last - start) >= _RESYNC_VECTOR_MINIMUM else False
+    if np:
+        packet_ids = np.frombuffer(_DECODER_PACKET_IDS, dtype=np.bool_)
+        for block_start in range(start, last, _RESYNC_BLOCK_SIZE):
+            count = min(_RESYNC_BLOCK_SIZE, last - block_start)
+            block = np.frombuffer(
+                buffer,
+                dtype=np.uint8,
+                count=count + AN_PACKET_HEADER_SIZE - 1,
+                offset=block_start,
+            )
+            # uint8 arithmetic wraps, so the LRC check is a sum equal to zero
+            header_sum = block[0:count] + block[1 : count + 1]
+            header_sum += block[2 : count + 2]
+            header_sum += block[3 : count + 3]
+            header_sum += block[4 : count + 4]
+            candidates = np.flatnonzero(
+                (header_sum == 0) & packet_ids[block[1 : count + 1]]
+            ).tolist()
+            # Release the buffer export before handing control back
+            del block, header_sum
+            for offset in candidates:
+                yield block_start + offset
+    else:
+        packet_ids = _DECODER_PACKET_IDS
+        for index in range(start, last):
+            if packet_ids[buffer[index + 1]] and (
+                buffer[index]
+                + buffer[index + 1]
+                + buffer[index + 2]
+                + buffer[index + 3]
+                + buffer[index + 4]
+            ) & 0xFF == 0:
+                yield index
+
+
 class ANDecoder:
     BUFFER_STREAM_LIMIT: int = 10 * 1024 * 1024     # 10MB limit to check when adding/streaming data where we resize the buffer 
     DECODER_ITERATOR_LIMIT: int = 10 * 1024 * 1024  # 10MB limit for when we resize the buffer after decoding that amount of data
     
-    decode_iterator: int = 0
-    buffer: bytearray = bytearray()
-    mem_view: memoryview
-    crc_errors: int = 0
-    an_packet: ANPacket = ANPacket()
+    decode_iterator: int
+    buffer: bytearray
+    crc_errors: int
+    bytes_skipped: int  # Bytes discarded while searching for a valid packet
+    packets_filtered: int  # Packets skipped as their ID is not in the ID filter
+    id_filter: Optional[bytes]  # Non-zero for each packet ID to decode, None to decode all
+    an_packet: ANPacket
+    _in_sync: bool  # True when the next scan starts right after a packet whose CRC was checked
+
+    def __init__(self):
+        self.decode_iterator = 0
+        self.buffer = bytearray()
+        self.crc_errors = 0
+        self.bytes_skipped = 0
+        self.packets_filtered = 0
+        self.id_filter = None
+        self.an_packet = ANPacket()
+        self._in_sync = False
+
+    def set_id_filter(self, packet_ids: Optional[Iterable[int]]):
+        """Only decode the packets with an ID in packet_ids, or every packet if
+        packet_ids is None. Other packets are skipped by their length while the
+        decoder is in sync, without checking their CRC or copying their data."""
+        if packet_ids is None:
+            self.id_filter = None
+        else:
+            packet_ids = set(packet_ids)
+            self.id_filter = bytes(1 if i in packet_ids else 0 for i in range(256))
 
     def add_data(self, packet_bytes: bytes):
-        packet_bytes = bytearray(packet_bytes)
         """Add data bytes to the buffer"""
-        if self.buffer is None or len(self.buffer) == 0:
-            self.buffer = packet_bytes
-        else:
-            self.buffer.extend(packet_bytes)
+        self.buffer += packet_bytes
 
         if len(self.buffer) > self.BUFFER_STREAM_LIMIT:
             self.remove_processed_data()
 
     def remove_processed_data(self):
         if self.decode_iterator > 0:
-            self.buffer = self.buffer[self.decode_iterator :]
+            # Deleting from the front of a bytearray is done in place
+            del self.buffer[: self.decode_iterator]
             self.decode_iterator = 0
 
+    def _scan(self, buffer, view: memoryview, index: int, end: int):
+        """Search buffer[index:end] for the next valid ANPP packet that passes
+        the ID filter, view is a memoryview of buffer. Returns a tuple of the
+        packet offset and payload length. If no complete packet is found the
+        length is -1 and the offset is where the search should resume once
+        more data is available. Discarded bytes are added to bytes_skipped."""
+        id_filter = self.id_filter
+        # Only a packet that follows a packet whose CRC was checked is trusted
+        # to start at index, any other header may be a false one
+        in_sync = self._in_sync
+        self._in_sync = False
+        while True:
+            if (index + AN_PACKET_HEADER_SIZE) > end:
+                return index, -1
+
+            length = None
+            # When in sync the next packet starts exactly at index
+            if _DECODER_PACKET_IDS[buffer[index + 1]] and _valid_header_lrc(buffer, index):
+                if in_sync and id_filter is not None and not id_filter[buffer[index + 1]]:
+                    # Skip the packet by its length without checking the CRC, as
+                    # long as a valid header follows it to confirm the sync
+                    next_index = index + AN_PACKET_HEADER_SIZE + buffer[index + 2]
+                    if (
+                        next_index + AN_PACKET_HEADER_SIZE <= end
+                        and _DECODER_PACKET_IDS[buffer[next_index + 1]]
+                        and _valid_header_lrc(buffer, next_index)
+                    ):
+                        self.packets_filtered += 1
+                        index = next_index
+                        continue
+                length = self._check_packet(view, index, end)
+
+            if length is None:
+                # Out of sync, only verify the CRC where a header could start
+                in_sync = False
+                for candidate in _find_headers(buffer, index + 1, end):
+                    length = self._check_packet(view, candidate, end)
+                    if length is not None:
+                        self.bytes_skipped += candidate - index
+                        index = candidate
+                        break
+                else:
+                    # Every complete header has been checked, resume at the first partial one
+                    resume = end - AN_PACKET_HEADER_SIZE + 1
+                    self.bytes_skipped += resume - index
+                    return resume, -1
+
+            if length < 0:
+                # The CRC of the incomplete packet is checked once it is complete
+                return index, length
+
+            # The packet after one whose CRC has been checked is in sync
+            in_sync = True
+            if id_filter is None or id_filter[buffer[index + 1]]:
+                self._in_sync = True
+                return index, length
+
+            # A packet that is not subscribed, whose CRC has been checked
+            self.packets_filtered += 1
+            index += AN_PACKET_HEADER_SIZE + length
+
+    def _check_packet(self, view: memoryview, index: int, end: int):
+        """Check the CRC of the packet with a valid header at index. Returns the
+        payload length, -1 if the packet is incomplete, or None if the CRC fails."""
+        length = view[index + 2]
+        data_start = index + AN_PACKET_HEADER_SIZE
+        data_end = data_start + length
+
+        if data_end > end:
+            return -1
+
+        if (view[index + 3] | (view[index + 4] << 8)) == crc16.ibm_3740(
+            view[data_start:data_end]
+        ):
+            return length
+
+        self.crc_errors += 1
+        return None
+
     def decode(self):
         """Takes binary data byte array consisting of ANPP packets. Returns tuple
         consisting of first ANPP packet found and inputted byte array with the first
         ANPP packet returned and data before this packet, removed."""
-        buffer_length = len(self.buffer)
+        with memoryview(self.buffer) as view:
+            index, length = self._scan(
+                self.buffer, view, self.decode_iterator, len(self.buffer)
+            )
+            self.decode_iterator = index
+            if length < 0:
+                return None
+
+            data_start = index + AN_PACKET_HEADER_SIZE
+            data_end = data_start + length
+            self.an_packet.id = self.buffer[index + 1]
+            self.an_packet.length = length
+            self.an_packet.header = bytes(view[index:data_start])
+            self.an_packet.data = bytes(view[data_start:data_end])
+
+        self.decode_iterator = data_end
+        if self.decode_iterator > self.DECODER_ITERATOR_LIMIT:
+            self.remove_processed_data()
+
+        return self.an_packet
 
-        while (self.decode_iterator + AN_PACKET_HEADER_SIZE) <= buffer_length:
-            header_lrc = self.buffer[self.decode_iterator]
-            header_data = self.buffer[
-                self.decode_iterator + 1 : self.decode_iterator + AN_PACKET_HEADER_SIZE
-            ]
+    def decode_all(self, timestamp: int = 0) -> List[ANFrame]:
+        """Decodes every complete ANPP packet in the buffer and removes the
+        processed data once. Unlike decode(), each packet is returned as an
+        immutable ANFrame stamped with timestamp."""
+        buffer = self.buffer
+        end = len(buffer)
+        index = self.decode_iterator
+        frames = []
 
-            if header_lrc == calculate_header_lrc(header_data):
-                length = header_data[1]
+        with memoryview(buffer) as view:
+            while True:
+                index, length = self._scan(buffer, view, index, end)
+                if length < 0:
+                    break
 
-                data_start = self.decode_iterator + AN_PACKET_HEADER_SIZE
+                data_start = index + AN_PACKET_HEADER_SIZE
                 data_end = data_start + length
+                frames.append(
+                    ANFrame(
+                        buffer[index + 1],
+                        length,
+                        bytes(view[data_start:data_end]),
+                        timestamp,
+                    )
+                )
+                index = data_end
 
-                if data_end > buffer_length:
-                    return None
+        self.decode_iterator = index
+        self.remove_processed_data()
+        return frames
 
-                crc = header_data[2] | (header_data[3] << 8)
+    def __iter__(self) -> Iterator[ANFrame]:
+        """Iterates over every complete ANPP packet in the buffer, see decode_all()"""
+        return iter(self.decode_all())
 
-                if crc == calculate_crc16(self.buffer[data_start:data_end]):
-                    if (
-                        header_data[0] not in list(map(int, PacketID))
-                        and header_data[0] != 82
-                    ):
-                        self.decode_iterator += 1
-                        continue
 
-                    self.an_packet.id = int(header_data[0])
-                    self.an_packet.length = length
-                    self.an_packet.header = bytes(
-                        self.buffer[self.decode_iterator : data_start]
-                    )
-                    self.an_packet.data = bytes(self.buffer[data_start:data_end])
+class ANRingDecoder(ANDecoder):
+    """Decoder backed by a fixed-capacity ring buffer.
 
-                    self.decode_iterator += (
-                        AN_PACKET_HEADER_SIZE + self.an_packet.length
-                    )
-                    if self.decode_iterator > self.DECODER_ITERATOR_LIMIT:
-                        self.remove_processed_data()
+    Decoded packets reference the ring storage through memoryviews instead of
+    copying the header and payload, and the buffer is never reallocated, so
+    memory use stays constant regardless of stream length. A packet is only
+    valid until the next call to add_data(); copy its data with bytes() to
+    keep it longer."""
 
-                    return self.an_packet
-                else:
-                    self.crc_errors += 1
-            self.decode_iterator += 1
+    DEFAULT_CAPACITY: int = 64 * 1024
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 2 * (AN_MAXIMUM_PACKET_SIZE + AN_PACKET_HEADER_SIZE):
+            raise ValueError(f"Ring buffer capacity too small: {capacity}")
+        super().__init__()
+        self.buffer = bytearray(capacity)
+        self._view = memoryview(self.buffer)
+        self._write_index = 0
 
-        if self.decode_iterator > buffer_length:
-            self.buffer = bytearray()
+    @property
+    def capacity(self) -> int:
+        return len(self.buffer)
+
+    def __len__(self) -> int:
+        """Number of bytes buffered and not yet decoded"""
+        return self._write_index - self.decode_iterator
+
+    def add_data(self, packet_bytes: bytes):
+        """Copy data bytes into the ring buffer. Raises BufferError if the data
+        does not fit in the free space of the buffer."""
+        length = len(packet_bytes)
+        if self._write_index + length > len(self.buffer):
+            self.remove_processed_data()
+            if self._write_index + length > len(self.buffer):
+                raise BufferError(
+                    f"Ring buffer full: {length} bytes added, "
+                    f"{len(self.buffer) - self._write_index} bytes free"
+                )
+        self._view[self._write_index : self._write_index + length] = packet_bytes
+        self._write_index += length
+
+    def get_buffer(self, sizehint: int = -1) -> memoryview:
+        """Returns the free space of the ring buffer, for data to be read into
+        directly as with asyncio.BufferedProtocol. Call buffer_updated() with
+        the number of bytes written. Like add_data(), this invalidates the
+        packets decoded before."""
+        minimum_size = max(sizehint, AN_MAXIMUM_PACKET_SIZE + AN_PACKET_HEADER_SIZE)
+        if len(self.buffer) - self._write_index < minimum_size:
+            self.remove_processed_data()
+            if self._write_index == len(self.buffer):
+                raise BufferError("Ring buffer full: 0 bytes free")
+        return self._view[self._write_index :]
+
+    def buffer_updated(self, nbytes: int):
+        """Adds nbytes written to the start of the buffer returned by get_buffer()"""
+        self._write_index += nbytes
+
+    def remove_processed_data(self):
+        """Move the undecoded tail of the data to the start of the ring buffer"""
+        if self.decode_iterator > 0:
+            remaining = self._write_index - self.decode_iterator
+            if remaining > 0:
+                self.buffer[:remaining] = self.buffer[
+                    self.decode_iterator : self._write_index
+                ]
+            self._write_index = remaining
             self.decode_iterator = 0
 
-        return None
+    def decode(self):
+        """Returns the next ANPP packet in the ring buffer, or None if no complete
+        packet is available. The packet header and data are memoryviews into
+        the ring buffer."""
+        index, length = self._scan(
+            self.buffer, self._view, self.decode_iterator, self._write_index
+        )
+        self.decode_iterator = index
+        if length < 0:
+            return None
+
+        data_start = index + AN_PACKET_HEADER_SIZE
+        data_end = data_start + length
+        self.an_packet.id = self.buffer[index + 1]
+        self.an_packet.length = length
+        self.an_packet.header = self._view[index:data_start]
+        self.an_packet.data = self._view[data_start:data_end]
+
+        if data_end == self._write_index:
+            # Everything has been decoded, start writing from the beginning again
+            self.decode_iterator = self._write_index = 0
+        else:
+            self.decode_iterator = data_end
+
+        return self.an_packet
+
+    def decode_all(self, timestamp: int = 0, copy_data: bool = False) -> List[ANFrame]:
+        """Decodes every complete ANPP packet in the ring buffer. The data of
+        each returned ANFrame is a memoryview into the ring buffer, valid until
+        the next call to add_data(), or bytes if copy_data is True."""
+        buffer = self.buffer
+        view = self._view
+        end = self._write_index
+        index = self.decode_iterator
+        frames = []
+
+        while True:
+            index, length = self._scan(buffer, view, index, end)
+            if length < 0:
+                break
+
+            data_start = index + AN_PACKET_HEADER_SIZE
+            data_end = data_start + length
+            data = view[data_start:data_end]
+            frames.append(
+                ANFrame(buffer[index + 1], length, bytes(data) if copy_data else data, timestamp)
+            )
+            index = data_end
+
+        if index == end:
+            self.decode_iterator = self._write_index = 0
+        else:
+            self.decode_iterator = index
+        return frames
@@ -0,0 +1,223 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                           an_packet_registry.py                            ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+"""
+Lookup of the packet class used to decode each packet ID.
+
+The table below is static, so finding the class for a packet does not need to
+inspect the packet modules. A packet module is only imported the first time
+one of its packet IDs is looked up.
+"""
+
+import importlib
+from typing import Any, Dict, Final, Iterator, Optional, Tuple, Type
+
+from .an_packets import PacketID
+from .an_packet_3 import DeviceID
+
+# fmt: off
+# Packet class decoding each packet ID, as (module, class name)
+_PACKET_CLASSES: Final[Dict[int, Tuple[str, str]]] = {
+    PacketID.acknowledge: ("an_packet_0", "AcknowledgePacket"),
+    PacketID.request: ("an_packet_1", "RequestPacket"),
+    PacketID.boot_mode: ("an_packet_2", "BootModePacket"),
+    PacketID.device_information: ("an_packet_3", "DeviceInformationPacket"),
+    PacketID.restore_factory_settings: ("an_packet_4", "RestoreFactorySettingsPacket"),
+    PacketID.reset: ("an_packet_5", "ResetPacket"),
+    PacketID.file_transfer_request: ("an_packet_7", "FileTransferFirstPacket"),
+    PacketID.file_transfer_acknowledge: ("an_packet_8", "FileTransferAcknowledgePacket"),
+    PacketID.file_transfer: ("an_packet_9", "FileTransferOngoingPacket"),
+    PacketID.serial_port_passthrough: ("an_packet_10", "SerialPortPassthroughPacket"),
+    PacketID.ip_configuration: ("an_packet_11", "IPConfigurationPacket"),
+    PacketID.extended_device_information: ("an_packet_13", "ExtendedDeviceInformationPacket"),
+    PacketID.subcomponent_information: ("an_packet_14", "SubcomponentInformationPacket"),
+    PacketID.system_state: ("an_packet_20", "SystemStatePacket"),
+    PacketID.unix_time: ("an_packet_21", "UnixTimePacket"),
+    PacketID.formatted_time: ("an_packet_22", "FormattedTimePacket"),
+    PacketID.status: ("an_packet_23", "StatusPacket"),
+    PacketID.position_standard_deviation: ("an_packet_24", "PositionStandardDeviationPacket"),
+    PacketID.velocity_standard_deviation: ("an_packet_25", "VelocityStandardDeviationPacket"),
+    PacketID.euler_orientation_standard_deviation: ("an_packet_26", "EulerOrientationStandardDeviationPacket"),
+    PacketID.quaternion_orientation_standard_deviation: ("an_packet_27", "QuaternionOrientationStandardDeviationPacket"),
+    PacketID.raw_sensors: ("an_packet_28", "RawSensorsPacket"),
+    PacketID.raw_gnss: ("an_packet_29", "RawGNSSPacket"),
+    PacketID.satellites: ("an_packet_30", "SatellitesPacket"),
+    PacketID.detailed_satellites: ("an_packet_31", "DetailedSatellitesPacket"),
+    PacketID.geodetic_position: ("an_packet_32", "GeodeticPositionPacket"),
+    PacketID.ecef_position: ("an_packet_33", "ECEFPositionPacket"),
+    PacketID.utm_position: ("an_packet_34", "UTMPositionPacket"),
+    PacketID.ned_velocity: ("an_packet_35", "NEDVelocityPacket"),
+    PacketID.body_velocity: ("an_packet_36", "BodyVelocityPacket"),
+    PacketID.acceleration: ("an_packet_37", "AccelerationPacket"),
+    PacketID.body_acceleration: ("an_packet_38", "BodyAccelerationPacket"),
+    PacketID.euler_orientation: ("an_packet_39", "EulerOrientationPacket"),
+    PacketID.quaternion_orientation: ("an_packet_40", "QuaternionOrientationPacket"),
+    PacketID.dcm_orientation: ("an_packet_41", "DCMOrientationPacket"),
+    PacketID.angular_velocity: ("an_packet_42", "AngularVelocityPacket"),
+    PacketID.angular_acceleration: ("an_packet_43", "AngularAccelerationPacket"),
+    PacketID.external_position_velocity: ("an_packet_44", "ExternalPositionVelocityPacket"),
+    PacketID.external_position: ("an_packet_45", "ExternalPositionPacket"),
+    PacketID.external_velocity: ("an_packet_46", "ExternalVelocityPacket"),
+    PacketID.external_body_velocity: ("an_packet_47", "ExternalBodyVelocityPacket"),
+    PacketID.external_heading: ("an_packet_48", "ExternalHeadingPacket"),
+    PacketID.running_time: ("an_packet_49", "RunningTimePacket"),
+    PacketID.local_magnetic_field: ("an_packet_50", "LocalMagneticFieldPacket"),
+    PacketID.odometer_state: ("an_packet_51", "OdometerStatePacket"),
+    PacketID.external_time: ("an_packet_52", "ExternalTimePacket"),
+    PacketID.external_depth: ("an_packet_53", "ExternalDepthPacket"),
+    PacketID.geoid_height: ("an_packet_54", "GeoidHeightPacket"),
+    PacketID.rtcm_corrections: ("an_packet_55", "RTCMCorrectionsPacket"),
+    PacketID.wind: ("an_packet_57", "WindPacket"),
+    PacketID.heave: ("an_packet_58", "HeavePacket"),
+    PacketID.raw_satellite_data: ("an_packet_60", "RawSatelliteDataPacket"),
+    PacketID.raw_satellite_ephemeris: ("an_packet_61", "RawSatelliteEphemerisPacket"),
+    PacketID.external_odometer: ("an_packet_67", "ExternalOdometerPacket"),
+    PacketID.external_air_data: ("an_packet_68", "ExternalAirDataPacket"),
+    PacketID.gnss_receiver_information: ("an_packet_69", "GNSSReceiverInformationPacket"),
+    PacketID.raw_dvl_data: ("an_packet_70", "RawDVLDataPacket"),
+    PacketID.north_seeking_initialisation_status: ("an_packet_71", "NorthSeekingInitialisationStatusPacket"),
+    PacketID.gimbal_state: ("an_packet_72", "GimbalStatePacket"),
+    PacketID.automotive: ("an_packet_73", "AutomotivePacket"),
+    PacketID.external_magnetometers: ("an_packet_75", "ExternalMagnetometersPacket"),
+    PacketID.base_station: ("an_packet_80", "BasestationPacket"),
+    PacketID.zero_angular_velocity: ("an_packet_83", "ZeroAngularVelocityPacket"),
+    PacketID.extended_satellites: ("an_packet_84", "ExtendedSatellitesPacket"),
+    PacketID.sensor_temperatures: ("an_packet_85", "SensorTemperaturePacket"),
+    PacketID.system_temperatures: ("an_packet_86", "SystemTemperaturePacket"),
+    PacketID.vessel_motion: ("an_packet_89", "VesselMotionPacket"),
+    PacketID.gnss_position_velocity_time: ("an_packet_92", "GNSSPositionVelocityTimePacket"),
+    PacketID.gnss_orientation: ("an_packet_93", "GNSSOrientationPacket"),
+    PacketID.lvs_line_of_sight: ("an_packet_94", "LvsLineOfSightPacket"),
+    PacketID.filter_aiding_source_status: ("an_packet_95", "AidingSourceStatusPacket"),
+    PacketID.pose_initialisation: ("an_packet_96", "PoseInitialisationPacket"),
+    PacketID.packet_timer_period: ("an_packet_180", "PacketTimerPeriodPacket"),
+    PacketID.packets_period: ("an_packet_181", "PacketsPeriodPacket"),
+    PacketID.baud_rates: ("an_packet_182", "BaudRatesPacket"),
+    PacketID.sensor_ranges: ("an_packet_184", "SensorRangesPacket"),
+    PacketID.installation_alignment: ("an_packet_185", "InstallationAlignmentPacket"),
+    PacketID.filter_options: ("an_packet_186", "FilterOptionsPacket"),
+    PacketID.gpio_configuration: ("an_packet_188", "GPIOConfigurationPacket"),
+    PacketID.magnetic_calibration_values: ("an_packet_189", "MagneticCalibrationValuesPacket"),
+    PacketID.magnetic_calibration_configuration: ("an_packet_190", "MagneticCalibrationConfigurationPacket"),
+    PacketID.magnetic_calibration_status: ("an_packet_191", "MagneticCalibrationStatusPacket"),
+    PacketID.odometer_configuration: ("an_packet_192", "OdometerConfigurationPacket"),
+    PacketID.set_zero_orientation_alignment: ("an_packet_193", "SetZeroOrientationAlignmentPacket"),
+    PacketID.reference_point_offsets: ("an_packet_194", "ReferencePointOffsetsPacket"),
+    PacketID.gpio_output_configuration: ("an_packet_195", "GPIOOutputConfigurationPacket"),
+    PacketID.dual_antenna_configuration: ("an_packet_196", "DualAntennaConfigurationPacket"),
+    PacketID.gnss_configuration: ("an_packet_197", "GNSSConfigurationPacket"),
+    PacketID.user_data: ("an_packet_198", "UserDataPacket"),
+    PacketID.gpio_input_configuration: ("an_packet_199", "GPIOInputConfigurationPacket"),
+    PacketID.ip_dataports_configuration: ("an_packet_202", "IPDataportConfigurationPacket"),
+    PacketID.can_configuration: ("an_packet_203", "CANConfigurationPacket"),
+    PacketID.lvs_line_of_sight_configuration: ("an_packet_206", "LvsLineOfSightConfigurationPacket"),
+    PacketID.aiding_source_config_1: ("an_packet_207", "AidingSourceConfigPacket1"),
+    PacketID.aiding_source_config_2: ("an_packet_208", "AidingSourceConfigPacket2"),
+    PacketID.external_temperature_sensor_configuration: ("an_packet_209", "ExternalTemperatureSensorConfigurationPacket"),
+}
+
+# Devices that overload a packet ID with a different packet structure
+_DEVICE_PACKET_CLASSES: Final[Dict[Tuple[int, DeviceID], Tuple[str, str]]] = {
+    (PacketID.status, DeviceID.air_data_unit_v2): ("an_packet_23", "StatusPacketAdu2"),
+    (PacketID.raw_sensors, DeviceID.air_data_unit): ("an_packet_28", "RawSensorsPacketAdu"),
+}
+
+# Packet classes that share a packet ID with the class in _PACKET_CLASSES
+_PACKET_VARIANTS: Final[Tuple[Tuple[str, str], ...]] = (
+    ("an_packet_9", "FileTransferFirstPacket"),
+    ("an_packet_23", "StatusPacketAdu2"),
+    ("an_packet_28", "RawSensorsPacketAdu"),
+    ("an_packet_68", "AirDataPacket"),
+)
+# fmt: on
+
+
+def _load_class(location: Tuple[str, str]) -> Type:
+    module_name, class_name = location
+    module = importlib.import_module(f"{__package__}.{module_name}")
+    return getattr(module, class_name)
+
+
+class PacketClassTable(Dict[int, Optional[Type]]):
+    """Maps packet IDs to packet classes for one device. Classes are loaded on
+    first lookup and cached, after which a lookup is a single dict access.
+    Unknown packet IDs map to None."""
+
+    def __init__(self, device_id: Optional[DeviceID] = None):
+        super().__init__()
+        self.device_id = device_id
+
+    def __missing__(self, packet_id: int) -> Optional[Type]:
+        location = _DEVICE_PACKET_CLASSES.get((packet_id, self.device_id))
+        if location is None:
+            location = _PACKET_CLASSES.get(packet_id)
+        packet_class = _load_class(location) if location is not None else None
+        self[packet_id] = packet_class
+        return packet_class
+
+
+_packet_class_tables: Dict[Optional[DeviceID], PacketClassTable] = {}
+
+
+def get_packet_classes(device_id: Optional[DeviceID] = None) -> PacketClassTable:
+    """Returns the packet class table for a device. Index it with a packet ID,
+    e.g. get_packet_classes(device_id)[an_packet.id], to get the packet class."""
+    table = _packet_class_tables.get(device_id)
+    if table is None:
+        table = _packet_class_tables[device_id] = PacketClassTable(device_id)
+    return table
+
+
+def get_packet_class(
+    packet_id: int, device_id: Optional[DeviceID] = None
+) -> Optional[Type]:
+    """Returns the packet class that decodes packet_id for the device, or None if
+    the packet ID is unknown"""
+    return get_packet_classes(device_id)[packet_id]
+
+
+def decode_packet(an_packet, device_id: Optional[DeviceID] = None) -> Optional[Any]:
+    """Decodes an ANPacket or ANFrame into a new object of its packet class.
+    Returns None if the packet ID is unknown or decoding fails."""
+    packet_class = get_packet_classes(device_id)[an_packet.id]
+    if packet_class is None:
+        return None
+    packet = packet_class()
+    decode = getattr(packet, "decode", None)
+    if decode is None or decode(an_packet) != 0:
+        return None
+    return packet
+
+
+def iter_packet_classes() -> Iterator[Type]:
+    """Iterates over every packet class, including device specific variants"""
+    for location in _PACKET_CLASSES.values():
+        yield _load_class(location)
+    for location in _PACKET_VARIANTS:
+        yield _load_class(location)
@@ -0,0 +1,154 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                               ack_latency.py                               ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+"""
+Measures the acknowledgement latency of AnDeviceInterface.send() while a
+simulated device streams system state packets at 2000 packets/s to a
+callback that cannot keep up, so the receive queue keeps growing.
+
+The acknowledgements are resolved as soon as they are received, ahead of
+the receive queue. For comparison, the queued mode resolves them only once
+the worker reaches them in the receive queue.
+
+Usage: python -m benchmarks.ack_latency [seconds]
+"""
+
+import asyncio
+import logging
+import statistics
+import struct
+import sys
+import time
+
+from advanced_navigation.an_devices.an_device_async_interface import AnDeviceInterface
+from advanced_navigation.anpp_packets.an_packet_protocol import ANDecoder, ANFrame, ANPacket
+from advanced_navigation.anpp_packets.an_packets import PacketID
+from advanced_navigation.anpp_packets.an_packet_20 import SystemStatePacket
+from advanced_navigation.anpp_packets.an_packet_180 import PacketTimerPeriodPacket
+
+STREAM_RATE = 2000  # packets/s
+STREAM_BATCH = 20  # Packets written at once
+CALLBACK_TIME = 0.001  # Time each system state callback waits, too long for the stream rate
+SEND_INTERVAL = 0.1
+SEND_TIMEOUT = 1.0
+
+
+class QueuedResponsesInterface(AnDeviceInterface):
+    """Resolves the responses from the receive queue, as the worker reaches them"""
+
+    def _handle_response(self, an_packet: ANFrame) -> bool:
+        return False
+
+    async def _handle_recv_packet(self, an_packet: ANFrame):
+        self._resolve_pending(an_packet)
+        await super()._handle_recv_packet(an_packet)
+
+
+def system_state_bytes() -> bytes:
+    an_packet = ANPacket()
+    an_packet.encode(
+        PacketID.system_state,
+        SystemStatePacket.LENGTH,
+        SystemStatePacket._structure.pack(*([0] * 23)),
+    )
+    return an_packet.bytes()
+
+
+async def simulated_device(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Streams system state packets and acknowledges every packet received"""
+    batch = system_state_bytes() * STREAM_BATCH
+
+    async def stream():
+        start = time.monotonic()
+        sent = 0
+        while True:
+            writer.write(batch)
+            sent += STREAM_BATCH
+            await asyncio.sleep(max(0.0, start + sent / STREAM_RATE - time.monotonic()))
+
+    streaming = asyncio.create_task(stream())
+    decoder = ANDecoder()
+    try:
+        while data := await reader.read(4096):
+            decoder.add_data(data)
+            for an_packet in decoder.decode_all():
+                acknowledge = ANPacket()
+                acknowledge.encode(PacketID.acknowledge, 4, struct.pack("<BHB", an_packet.id, 0, 0))
+                writer.write(acknowledge.bytes())
+    finally:
+        streaming.cancel()
+        writer.close()
+
+
+async def measure(name: str, interface: AnDeviceInterface, port: int, duration: float):
+    async def slow_callback(packet):
+        await asyncio.sleep(CALLBACK_TIME)
+
+    interface.register_callback(SystemStatePacket, slow_callback)
+    await interface.connect_tcp("127.0.0.1", port)
+    latencies = []
+    timeouts = 0
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        start = time.perf_counter()
+        if await interface.send(PacketTimerPeriodPacket(), timeout=SEND_TIMEOUT) is None:
+            timeouts += 1
+        else:
+            latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(SEND_INTERVAL)
+    backlog = interface.receive_queue.qsize()
+    interface.close()
+    interface._protocol._worker_task.cancel()
+    await asyncio.sleep(0.1)  # Let the simulated device see the connection close
+
+    if latencies:
+        latencies.sort()
+        print(
+            f"{name:<8} median {statistics.median(latencies) * 1e3:8.2f} ms  "
+            f"max {latencies[-1] * 1e3:8.2f} ms  "
+            f"timeouts {timeouts:3}  backlog {backlog:6} packets"
+        )
+    else:
+        print(f"{name:<8} timeouts {timeouts:3}  backlog {backlog:6} packets")
+
+
+async def main():
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    # The timeouts of the queued mode are counted instead of logged
+    logging.disable(logging.WARNING)
+    server = await asyncio.start_server(simulated_device, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    await measure("priority", AnDeviceInterface(), port, duration)
+    await measure("queued", QueuedResponsesInterface(), port, duration)
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                              batch_decode.py                               ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+"""
+Measures the time to decode the system state and raw sensors packets of an
+ANPP log one packet object at a time, against decode_batch() into numpy
+structured arrays.
+
+Usage: python -m benchmarks.batch_decode [log_file] [repeat]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from advanced_navigation.anpp_packets.an_packet_batch import decode_batch
+from advanced_navigation.anpp_packets.an_packet_protocol import ANDecoder
+from advanced_navigation.anpp_packets.an_packet_20 import SystemStatePacket
+from advanced_navigation.anpp_packets.an_packet_28 import RawSensorsPacket
+
+DEFAULT_LOG = Path(__file__).parent.parent.joinpath("tests", "anpp_packets_tests", "Log.anpp")
+PACKET_CLASSES = (SystemStatePacket, RawSensorsPacket)
+
+
+def decode_objects(frames: list) -> int:
+    count = 0
+    for packet_class in PACKET_CLASSES:
+        for frame in frames:
+            packet = packet_class()
+            if packet.decode(frame) == 0:
+                count += 1
+    return count
+
+
+def decode_columns(frames: list) -> int:
+    return sum(len(decode_batch(packet_class, frames)) for packet_class in PACKET_CLASSES)
+
+
+def measure(name: str, function, frames: list):
+    function(frames)  # Warm up
+    start = time.perf_counter()
+    count = function(frames)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} {count:>8} packets  {elapsed * 1e3:8.2f} ms  {elapsed * 1e9 / count:8.1f} ns/packet")
+
+
+def main():
+    log_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_LOG
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    with open(log_path, "rb") as log:
+        raw_data = log.read()
+    decoder = ANDecoder()
+    decoder.add_data(raw_data)
+    frames = decoder.decode_all() * repeat
+    measure("objects", decode_objects, frames)
+    measure("decode_batch", decode_columns, frames)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                           decode_allocations.py                            ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+"""
+Measures the memory blocks kept alive per queued packet and the decode time
+per packet for Log.anpp, comparing the decode() and copy.deepcopy() loop
+against ANDecoder.decode_all().
+
+Usage: python -m benchmarks.decode_allocations [log_file]
+"""
+
+import copy
+import gc
+import sys
+import time
+from pathlib import Path
+
+from advanced_navigation.anpp_packets.an_packet_protocol import ANDecoder
+
+DEFAULT_LOG = Path(__file__).parent.parent.joinpath("tests", "anpp_packets_tests", "Log.anpp")
+CHUNK_SIZE = 1024
+
+
+def decode_deepcopy(raw_data: bytes) -> list:
+    decoder = ANDecoder()
+    queue = []
+    for index in range(0, len(raw_data), CHUNK_SIZE):
+        decoder.add_data(raw_data[index : index + CHUNK_SIZE])
+        while (an_packet := decoder.decode()) is not None:
+            queue.append(copy.deepcopy(an_packet))
+            decoder.remove_processed_data()
+    return queue
+
+
+def decode_frames(raw_data: bytes) -> list:
+    decoder = ANDecoder()
+    queue = []
+    for index in range(0, len(raw_data), CHUNK_SIZE):
+        decoder.add_data(raw_data[index : index + CHUNK_SIZE])
+        queue.extend(decoder.decode_all())
+    return queue
+
+
+def measure(name: str, function, raw_data: bytes):
+    function(raw_data)  # Warm up
+    gc.collect()
+    gc.disable()
+    blocks_before = sys.getallocatedblocks()
+    start = time.perf_counter()
+    queue = function(raw_data)
+    elapsed = time.perf_counter() - start
+    blocks = sys.getallocatedblocks() - blocks_before
+    gc.enable()
+    print(
+        f"{name:<12} {len(queue):>6} packets  "
+        f"{blocks / len(queue):6.2f} blocks/packet  "
+        f"{elapsed * 1e6 / len(queue):6.2f} us/packet"
+    )
+
+
+def main():
+    log_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_LOG
+    with open(log_path, "rb") as log:
+        raw_data = log.read()
+    measure("deepcopy", decode_deepcopy, raw_data)
+    measure("decode_all", decode_frames, raw_data)
+
+
+if __name__ == "__main__":
+    main()
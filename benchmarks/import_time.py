@@ -0,0 +1,78 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                              import_time.py                                ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+"""
+Measures the time a fresh interpreter takes to import the SDK and decode a
+single packet type, with the packet modules loaded lazily, against importing
+every packet module up front.
+
+Usage: python -m benchmarks.import_time [runs]
+"""
+
+import subprocess
+import sys
+import time
+
+SCENARIOS = {
+    "interpreter": "pass",
+    "eager": (
+        "import importlib\n"
+        "import advanced_navigation.anpp_packets as anpp_packets\n"
+        "for name in anpp_packets.__all__:\n"
+        "    importlib.import_module(f'advanced_navigation.anpp_packets.{name}')\n"
+        "from advanced_navigation.anpp_packets import SystemStatePacket\n"
+    ),
+    "lazy": (
+        "from advanced_navigation.anpp_packets import SystemStatePacket\n"
+        "from advanced_navigation.anpp_packets.an_packet_protocol import ANDecoder\n"
+    ),
+    "registry": (
+        "from advanced_navigation.anpp_packets.an_packet_registry import get_packet_class\n"
+        "get_packet_class(20)\n"
+    ),
+}
+
+
+def measure(code: str, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for name, code in SCENARIOS.items():
+        print(f"{name:<12} {measure(code, runs) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
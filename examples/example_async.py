@@ -119,7 +119,7 @@ async def main():
         device.register_callback(SystemStatePacket, system_state_handler)
 
         # Example 2: Use a raw packet listener
-        # Use device.register_raw_callback() to receive all raw ANPackets.
+        # Use device.register_raw_callback() to receive all raw packets as ANFrames.
         async def generic_packet_printer(an_packet):
             # Log the raw binary bytes to the file
             log_file.write(an_packet.bytes())
@@ -159,13 +159,9 @@ def main():
                 # Add raw data to our decoder buffer
                 decoder.add_data(raw_data)
 
-            # Attempt to pop fully assembled ANPackets off the internal buffer
-            # decoder.decode() returns None if there is not enough data yet to form a complete packet
-            while True:
-                an_packet = decoder.decode()
-                if an_packet is None:
-                    break
-
+            # Pop every fully assembled packet off the internal buffer as an ANFrame
+            # decoder.decode_all() returns an empty list if there is not enough data yet to form a complete packet
+            for an_packet in decoder.decode_all():
                 # The first packet we get should be the DeviceInformationPacket
                 if an_packet.id == DeviceInformationPacket.ID.value and device_id == DeviceID.unknown:
                     info_packet = DeviceInformationPacket()
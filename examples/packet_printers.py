@@ -29,14 +29,10 @@
 
 import json
 from dataclasses import asdict
-from advanced_navigation.anpp_packets.an_packet_protocol import ANPacket
-from advanced_navigation.anpp_packets.an_packets import PacketID
+from typing import Any, Dict, Tuple
+from advanced_navigation.anpp_packets.an_packet_protocol import ANFrame, ANPacket
 from advanced_navigation.anpp_packets.an_packet_3 import DeviceID
-from advanced_navigation.anpp_packets.an_packet_23 import StatusPacket, StatusPacketAdu2
-from advanced_navigation.anpp_packets.an_packet_28 import RawSensorsPacket, RawSensorsPacketAdu
-from advanced_navigation.anpp_packets import __all__ as anpp_all
-import importlib
-import inspect
+from advanced_navigation.anpp_packets.an_packet_registry import get_packet_class
 
 
 def get_device_specific_packet_obj(an_packet_id: int, device_id: DeviceID):
@@ -45,23 +41,28 @@ def get_device_specific_packet_obj(an_packet_id: int, device_id: DeviceID):
     This handles devices that overload the same packet ID with different packet structures.
     For instance, packet ID 23 (Status) or 28 (RawSensors) has a different layout for the Air Data Unit.
     """
-    packet_id_enum = PacketID(an_packet_id)
+    # The packet registry handles the device specific overloads
+    packet_class = get_packet_class(an_packet_id, device_id)
+    if packet_class is None:
+        return None
+    return packet_class()
 
-    # Handle packet overrides based on specific devices
-    if packet_id_enum == PacketID.status:
-        if device_id == DeviceID.air_data_unit_v2:
-            return StatusPacketAdu2()
-        else:
-            return StatusPacket()
-
-    if packet_id_enum == PacketID.raw_sensors:
-        if device_id == DeviceID.air_data_unit:
-            return RawSensorsPacketAdu()
-        else:
-            return RawSensorsPacket()
+# Packet objects reused for each packet ID and device, as every packet is printed before the next is decoded
+_packet_pool: Dict[Tuple[int, DeviceID], Any] = {}
 
-    # For all other packets, use the generic mapping
-    return get_obj_from_enum(packet_id_enum)
+def get_pooled_packet_obj(an_packet_id: int, device_id: DeviceID):
+    """
+    Returns the packet object of the packet ID and device ID from the packet pool.
+    For the packets that can be decoded into again (REUSABLE), the same object is returned on every call,
+    so decoding into it does not allocate new packet objects. Other packets get a new object on every call.
+    """
+    key = (an_packet_id, device_id)
+    packet_obj = _packet_pool.get(key)
+    if packet_obj is None:
+        packet_obj = get_device_specific_packet_obj(an_packet_id, device_id)
+        if getattr(type(packet_obj), "REUSABLE", False):
+            _packet_pool[key] = packet_obj
+    return packet_obj
 
 def print_packet(packet):
     """
@@ -74,13 +75,13 @@ def print_packet(packet):
     except Exception:
         print(f"Received Packet ID {packet.ID.value} (Length: {packet.LENGTH})")
 
-def handle_raw_an_packet(an_packet: ANPacket, device_id: DeviceID):
+def handle_raw_an_packet(an_packet: ANFrame | ANPacket, device_id: DeviceID):
     """
-    Takes a raw ANPacket, looks up the correct packet object definition for the current device,
+    Takes a raw ANFrame or ANPacket, looks up the correct packet object definition for the current device,
     decodes it, and prints it in a human-readable format.
     """
     try:
-        pkt_obj = get_device_specific_packet_obj(an_packet.id, device_id)
+        pkt_obj = get_pooled_packet_obj(an_packet.id, device_id)
 
         if pkt_obj is None:
             return # No class mapping available for this packet ID
@@ -93,34 +94,3 @@ def handle_raw_an_packet(an_packet: ANPacket, device_id: DeviceID):
     except ValueError:
         pass # Unknown enum value or unhandled packet
 
-
-_packet_classes_cache = None
-
-def get_obj_from_enum(packet_enum):
-    # This function dynamically discovers and caches packet classes by inspecting SDK modules.
-    # It avoids having to manually maintain a giant dictionary mapping Packet IDs to Classes.
-    global _packet_classes_cache
-    if _packet_classes_cache is None:
-        _packet_classes_cache = {}
-        # Iterate over all exported module names in advanced_navigation.anpp_packets
-        for module_name in anpp_all:
-            if not module_name.startswith('an_packet_'):
-                continue
-            module = importlib.import_module(f'advanced_navigation.anpp_packets.{module_name}')
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if hasattr(obj, 'ID') and obj.__module__ == module.__name__:
-                    # Skip specific overloaded classes because their packet IDs conflict with generic ones.
-                    # They are handled explicitly in `get_device_specific_packet_obj` or manually below.
-                    if name in ['StatusPacketAdu2', 'RawSensorsPacketAdu', 'FileTransferFirstPacket', 'AcknowledgePacket']:
-                        continue
-                    _packet_classes_cache[obj.ID.value] = obj
-
-        import advanced_navigation.anpp_packets.an_packet_0 as an_packet_0
-        import advanced_navigation.anpp_packets.an_packet_7 as an_packet_7
-        _packet_classes_cache[0] = an_packet_0.AcknowledgePacket
-        _packet_classes_cache[7] = an_packet_7.FileTransferFirstPacket
-
-    packet_class = _packet_classes_cache.get(packet_enum.value)
-    if packet_class:
-        return packet_class()
-    return None
@@ -0,0 +1,121 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                          an_packet_batch_test.py                           ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+import pytest
+
+from advanced_navigation.anpp_packets.an_packet_protocol import ANDecoder, ANRingDecoder
+from advanced_navigation.anpp_packets.an_packet_20 import SystemStatePacket
+from advanced_navigation.anpp_packets.an_packet_28 import RawSensorsPacket
+from advanced_navigation.anpp_packets.an_packet_29 import RawGNSSPacket
+from advanced_navigation.anpp_packets.an_packet_89 import VesselMotionPacket
+from advanced_navigation.anpp_packets.an_packet_92 import GNSSPositionVelocityTimePacket
+from advanced_navigation.anpp_packets.an_packet_31 import DetailedSatellitesPacket
+from tests.anpp_packets_tests.an_packet_protocol_test import read_log
+
+np = pytest.importorskip("numpy")
+
+from advanced_navigation.anpp_packets.an_packet_batch import decode_batch, packet_dtype  # noqa: E402
+
+
+def log_frames(decoder):
+    decoder.add_data(read_log())
+    return decoder.decode_all()
+
+
+@pytest.mark.parametrize(
+    "packet_class",
+    [SystemStatePacket, RawSensorsPacket, VesselMotionPacket, GNSSPositionVelocityTimePacket],
+)
+def test_packet_dtype(packet_class):
+    dtype = packet_dtype(packet_class)
+
+    assert dtype.itemsize == packet_class.LENGTH
+    assert dtype.names == tuple(field for field in packet_class.__dataclass_fields__)
+    assert packet_dtype(packet_class) is dtype
+
+
+def test_packet_dtype_subarrays():
+    dtype = packet_dtype(SystemStatePacket)
+
+    assert dtype["system_status"] == np.dtype("<u2")
+    assert dtype["latitude"] == np.dtype("<f8")
+    assert dtype["velocity"].shape == (3,)
+    assert packet_dtype(VesselMotionPacket)["surge"].shape == (4,)
+
+
+def test_packet_dtype_variable_length():
+    with pytest.raises(ValueError):
+        packet_dtype(DetailedSatellitesPacket)
+
+
+@pytest.mark.parametrize("decoder", [ANDecoder(), ANRingDecoder()])
+@pytest.mark.parametrize("packet_class", [SystemStatePacket, RawSensorsPacket, RawGNSSPacket])
+def test_decode_batch_matches_decode(decoder, packet_class):
+    frames = log_frames(decoder)
+    expected = []
+    for frame in frames:
+        packet = packet_class()
+        if packet.decode(frame) == 0:
+            expected.append(packet)
+
+    batch = decode_batch(packet_class, frames)
+
+    assert len(batch) == len(expected) > 0
+    for row, packet in zip(batch, expected):
+        for name in batch.dtype.names:
+            value = getattr(packet, name)
+            if hasattr(value, "unpack"):
+                status = type(value)()
+                status.unpack(int(row[name]))
+                assert status == value
+            else:
+                assert row[name] == pytest.approx(value, nan_ok=True)
+
+
+def test_decode_batch_gnss_position_velocity_time():
+    packets = [GNSSPositionVelocityTimePacket() for _ in range(3)]
+    for index, packet in enumerate(packets):
+        packet.gnss_id = index
+        packet.gnss_position_velocity_time_bitfield.time_valid = True
+        packet.position = [index, 2.5, -3.0]
+        packet.latency_micros = 1000 + index
+
+    batch = decode_batch(GNSSPositionVelocityTimePacket, [packet.encode() for packet in packets])
+
+    assert list(batch["gnss_id"]) == [0, 1, 2]
+    assert list(batch["gnss_position_velocity_time_bitfield"]) == [1 << 10] * 3
+    assert batch["position"][:, 0].tolist() == [0, 1, 2]
+    assert list(batch["latency_micros"]) == [1000, 1001, 1002]
+
+
+def test_decode_batch_empty():
+    batch = decode_batch(VesselMotionPacket, log_frames(ANDecoder()))
+
+    assert len(batch) == 0
+    assert batch.dtype == packet_dtype(VesselMotionPacket)
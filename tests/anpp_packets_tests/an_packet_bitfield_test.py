@@ -0,0 +1,184 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                         an_packet_bitfield_test.py                         ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+import copy
+from dataclasses import asdict, fields
+
+import pytest
+
+from advanced_navigation.anpp_packets.an_packet_20 import FilterStatus, GNSSFixType, SystemStatus
+from advanced_navigation.anpp_packets.an_packet_60 import TrackingStatus
+from advanced_navigation.anpp_packets.an_packet_95 import AidingSourceStatus
+
+
+@pytest.mark.parametrize(
+    "status_class, raw_values",
+    [
+        (SystemStatus, range(0, 0x10000, 257)),
+        (FilterStatus, range(0, 0x10000, 257)),
+        (TrackingStatus, range(0, 0x40)),
+        (AidingSourceStatus, [0, 1, 2, 3, 0x0400, 0xFC03]),
+    ],
+)
+def test_unpack_pack(status_class, raw_values):
+    for raw in raw_values:
+        status = status_class()
+        status.unpack(raw)
+        assert status.raw == raw
+        assert status.pack() == raw
+
+
+def test_flags_decoded_on_access():
+    status = SystemStatus()
+    status.unpack(1 << 14)
+
+    assert vars(status) == {"_raw": 1 << 14}
+    assert status.gnss_antenna_disconnected is True
+    assert status.system_failure is False
+    assert len(vars(status)) == len(fields(SystemStatus)) + 1
+
+    status.unpack(1)
+    assert vars(status) == {"_raw": 1}
+    assert status.system_failure is True
+    assert status.gnss_antenna_disconnected is False
+
+
+def test_flags_read_during_decode():
+    # A flag read by another thread while the flags are being decoded
+    status = None
+    unpacked = []
+    seen = []
+
+    class ProbedSystemStatus(SystemStatus):
+        def _unpack_flags(self, data):
+            unpacked.append(data)
+            if len(unpacked) == 1:
+                seen.append(status.gnss_failure)
+            return super()._unpack_flags(data)
+
+    status = ProbedSystemStatus()
+    status.unpack(1 << 5)
+    status.system_failure = True
+
+    assert seen == [True]
+    assert status.gnss_failure
+    assert status.raw == (1 << 5) | 1
+
+
+def test_filter_status_fix_type():
+    status = FilterStatus()
+    status.unpack(0x0071)
+
+    assert status.gnss_fix_type == GNSSFixType.rtk_fixed
+    assert status.orientation_filter_initialised is True
+    assert status.ins_filter_initialised is False
+
+
+def test_set_flag_updates_raw():
+    status = FilterStatus()
+    status.unpack(0x0021)
+    status.heading_initialised = True
+
+    assert status.raw == 0x0025
+    assert status.orientation_filter_initialised is True
+    assert status.gnss_fix_type == GNSSFixType.threeD
+
+
+def test_reserved_bits_kept_until_modified():
+    status = AidingSourceStatus()
+    status.unpack(0x0C07)
+
+    assert (status.online, status.valid, status.origin) == (True, True, 3)
+    assert status.raw == 0x0C07
+    status.valid = False
+    assert status.raw == 0x0C01
+
+
+def test_changed_since():
+    previous = SystemStatus()
+    previous.unpack(0x0001)
+    current = SystemStatus()
+    current.unpack(0x0001)
+
+    assert not current.changed_since(previous)
+    assert not current.changed_since(0x0001)
+    assert current.changed_since(0x0003)
+    assert current.changed_since(SystemStatus())
+    current.gyroscope_sensor_failure = True
+    assert current.changed_since(previous)
+
+
+def test_changed_since_ignores_reserved_bits():
+    previous = AidingSourceStatus()
+    previous.unpack(0x0401)
+    current = AidingSourceStatus()
+    current.unpack(0x0405)
+
+    assert not current.changed_since(previous)
+    assert not current.changed_since(0x0001 | 0x0400 | 0x03FC)
+    assert current.changed_since(0x0003)
+
+
+def test_flags_decoded_from_same_raw_value_are_independent():
+    first = FilterStatus()
+    first.unpack(0x0021)
+    second = FilterStatus()
+    second.unpack(0x0021)
+
+    assert first.gnss_fix_type == GNSSFixType.threeD
+    first.heading_initialised = True
+    assert second.heading_initialised is False
+    assert second.raw == 0x0021
+    third = FilterStatus()
+    third.unpack(0x0021)
+    assert third.heading_initialised is False
+
+
+def test_dataclass_behaviour():
+    status = SystemStatus()
+    status.unpack(0x0003)
+    expected = SystemStatus(system_failure=True, accelerometer_sensor_failure=True)
+
+    assert status == expected
+    assert asdict(status) == asdict(expected)
+    assert repr(status) == repr(expected)
+    assert copy.deepcopy(status) == expected
+    with pytest.raises(AttributeError):
+        status.not_a_flag
+
+
+def test_constructor_arguments():
+    # Flags that are not given are read from their defaults
+    assert SystemStatus().__dict__ == {}
+    assert SystemStatus(True, gnss_failure=True) == SystemStatus(system_failure=True, gnss_failure=True)
+    assert SystemStatus(True).pack() == 1
+    with pytest.raises(TypeError):
+        SystemStatus(not_a_flag=True)
+    with pytest.raises(TypeError):
+        SystemStatus(*[False] * 17)
@@ -0,0 +1,291 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                         an_packet_protocol_test.py                         ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+import os
+import random
+from pathlib import Path
+
+import pytest
+
+from advanced_navigation.anpp_packets import an_packet_protocol
+from advanced_navigation.anpp_packets.an_packet_protocol import ANDecoder, ANFrame, ANPacket, ANRingDecoder
+from advanced_navigation.anpp_packets.an_packets import PacketID
+from advanced_navigation.anpp_packets.an_packet_20 import SystemStatePacket
+
+
+LOG_PATH = Path(os.path.dirname(os.path.abspath(__file__))).joinpath("Log.anpp")
+
+
+def read_log() -> bytes:
+    with open(LOG_PATH, "rb") as log:
+        return log.read()
+
+
+def system_state_bytes(latitude: float = 0.5) -> bytes:
+    values = [0] * 23
+    values[4] = latitude
+    an_packet = ANPacket()
+    an_packet.encode(
+        PacketID.system_state,
+        SystemStatePacket.LENGTH,
+        SystemStatePacket._structure.pack(*values),
+    )
+    return an_packet.bytes()
+
+
+def decode_chunks(decoder, raw_data, chunk_size):
+    packets = []
+    for index in range(0, len(raw_data), chunk_size):
+        decoder.add_data(raw_data[index : index + chunk_size])
+        while (an_packet := decoder.decode()) is not None:
+            packets.append((an_packet.id, bytes(an_packet.header), bytes(an_packet.data)))
+    return packets
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024, 4096])
+def test_ring_decoder_matches_decoder(chunk_size):
+    raw_data = read_log()
+    expected = decode_chunks(ANDecoder(), raw_data, len(raw_data))
+    decoder = ANRingDecoder(capacity=8192)
+
+    assert decode_chunks(decoder, raw_data, chunk_size) == expected
+    assert decoder.capacity == 8192
+    assert decoder.crc_errors == 0
+
+
+def test_ring_decoder_packets_are_views():
+    decoder = ANRingDecoder()
+    decoder.add_data(system_state_bytes(latitude=0.5))
+
+    an_packet = decoder.decode()
+    assert isinstance(an_packet.data, memoryview)
+    assert an_packet.data.obj is decoder.buffer
+
+    packet = SystemStatePacket()
+    assert packet.decode(an_packet) == 0
+    assert packet.latitude == 0.5
+    assert len(decoder) == 0
+
+
+def test_ring_decoder_full():
+    decoder = ANRingDecoder(capacity=1024)
+    decoder.add_data(bytes(1000))
+    with pytest.raises(BufferError):
+        decoder.add_data(bytes(100))
+
+
+def test_decoders_are_independent():
+    first = ANDecoder()
+    second = ANDecoder()
+    first.add_data(system_state_bytes())
+    assert second.decode() is None
+    assert first.decode() is not None
+    assert first.an_packet is not second.an_packet
+
+
+@pytest.mark.parametrize("vectorised", [True, False])
+def test_decoder_resync_after_garbage(monkeypatch, vectorised):
+    if not vectorised:
+        monkeypatch.setattr(an_packet_protocol, "_numpy", False)
+    raw_data = read_log()
+    garbage = random.Random(20).randbytes(256 * 1024)
+    log_decoder = ANDecoder()
+    expected = decode_chunks(log_decoder, raw_data, len(raw_data))
+
+    decoder = ANDecoder()
+    packets = decode_chunks(decoder, raw_data + garbage + raw_data, 64 * 1024)
+
+    assert packets == expected + expected
+    # The partial packet at the end of the log is lost along with the garbage
+    log_tail = len(raw_data) - log_decoder.decode_iterator
+    assert decoder.bytes_skipped == log_tail + len(garbage) + 2 * log_decoder.bytes_skipped
+
+
+def test_decoder_resync_after_corruption():
+    packet = system_state_bytes()
+    corrupted = bytearray(packet)
+    corrupted[20] ^= 0xFF
+    decoder = ANRingDecoder()
+    decoder.add_data(bytes(corrupted) + packet)
+
+    an_packet = decoder.decode()
+    assert an_packet is not None
+    assert bytes(an_packet.header) + bytes(an_packet.data) == packet
+    assert decoder.crc_errors > 0
+    assert decoder.bytes_skipped == len(corrupted)
+    assert decoder.decode() is None
+
+
+@pytest.mark.parametrize("decoder_class", [ANDecoder, ANRingDecoder])
+def test_decode_all(decoder_class):
+    raw_data = read_log()
+    expected = decode_chunks(ANDecoder(), raw_data, len(raw_data))
+
+    decoder = decoder_class()
+    packets = []
+    for index in range(0, len(raw_data), 4096):
+        decoder.add_data(raw_data[index : index + 4096])
+        packets.extend(
+            (an_packet.id, bytes(an_packet.header), bytes(an_packet.data))
+            for an_packet in decoder.decode_all()
+        )
+
+    assert packets == expected
+    assert decoder.decode_all() == []
+
+
+def test_decode_all_packets_are_independent():
+    decoder = ANDecoder()
+    decoder.add_data(system_state_bytes(latitude=1.0) + system_state_bytes(latitude=2.0))
+    decoder.add_data(system_state_bytes(latitude=3.0)[:50])
+
+    first, second = decoder
+    assert isinstance(first, ANFrame)
+    assert first is not second
+    assert SystemStatePacket._structure.unpack_from(first.data)[4] == 1.0
+    assert SystemStatePacket._structure.unpack_from(second.data)[4] == 2.0
+    # Processed data is removed, the partial packet is kept
+    assert decoder.decode_iterator == 0
+    assert len(decoder.buffer) == 50
+
+
+@pytest.mark.parametrize("decoder_class", [ANDecoder, ANRingDecoder])
+def test_frame(decoder_class):
+    raw_packet = system_state_bytes(latitude=1.5)
+    decoder = decoder_class()
+    decoder.add_data(raw_packet)
+
+    (frame,) = decoder.decode_all(timestamp=1234)
+    assert frame.id == PacketID.system_state
+    assert frame.length == SystemStatePacket.LENGTH
+    assert frame.timestamp == 1234
+    assert frame.bytes() == raw_packet
+    with pytest.raises(AttributeError):
+        frame.id = PacketID.unix_time
+
+    packet = SystemStatePacket()
+    assert packet.decode(frame) == 0
+    assert packet.latitude == 1.5
+
+
+@pytest.mark.parametrize("decoder_class", [ANDecoder, ANRingDecoder])
+@pytest.mark.parametrize("chunk_size", [1, 100, 4096])
+def test_id_filter(decoder_class, chunk_size):
+    raw_data = read_log()
+    expected = decode_chunks(ANDecoder(), raw_data, len(raw_data))
+    subscribed = {PacketID.system_state, PacketID.unix_time}
+
+    decoder = decoder_class()
+    decoder.set_id_filter(subscribed)
+    packets = decode_chunks(decoder, raw_data, chunk_size)
+
+    assert packets == [packet for packet in expected if packet[0] in subscribed]
+    assert decoder.packets_filtered == len(expected) - len(packets)
+    assert decoder.crc_errors == 0
+
+
+def test_id_filter_skips_without_crc():
+    corrupted = bytearray(system_state_bytes(latitude=1.0))
+    corrupted[20] ^= 0xFF
+    wanted = ANPacket()
+    wanted.encode(PacketID.unix_time, 8, bytes(8))
+    decoder = ANDecoder()
+    decoder.set_id_filter([PacketID.unix_time])
+    # The first packet has its CRC checked, the decoder is in sync after it
+    decoder.add_data(wanted.bytes() + bytes(corrupted) + wanted.bytes())
+
+    frames = decoder.decode_all()
+    assert [frame.bytes() for frame in frames] == [wanted.bytes()] * 2
+    assert decoder.packets_filtered == 1
+    assert decoder.crc_errors == 0
+    assert decoder.bytes_skipped == 0
+
+
+def test_id_filter_checks_crc_out_of_sync():
+    corrupted = bytearray(system_state_bytes(latitude=1.0))
+    corrupted[20] ^= 0xFF
+    garbage = bytes(range(1, 40))
+    wanted = ANPacket()
+    wanted.encode(PacketID.unix_time, 8, bytes(8))
+    decoder = ANDecoder()
+    decoder.set_id_filter([PacketID.unix_time])
+    # Without a valid header after a filtered packet its CRC is checked
+    decoder.add_data(system_state_bytes() + garbage + bytes(corrupted) + garbage + wanted.bytes())
+
+    (frame,) = decoder.decode_all()
+    assert frame.bytes() == wanted.bytes()
+    assert decoder.packets_filtered == 1
+    assert decoder.crc_errors > 0
+    assert decoder.bytes_skipped == 2 * len(garbage) + len(corrupted)
+
+    decoder.set_id_filter(None)
+    assert decoder.id_filter is None
+
+
+@pytest.mark.parametrize("decoder_class", [ANDecoder, ANRingDecoder])
+def test_id_filter_false_header_before_subscribed_packet(decoder_class):
+    wanted = system_state_bytes(latitude=1.0)
+    following = system_state_bytes(latitude=2.0)
+    # A header of a packet that is not subscribed in the middle of garbage, whose
+    # length would skip the real packet that follows it
+    false_header = bytearray([0, PacketID.unix_time, len(wanted), 0, 0])
+    false_header[0] = an_packet_protocol.calculate_header_lrc(false_header[1:])
+    decoder = decoder_class()
+    decoder.set_id_filter([PacketID.system_state])
+
+    # The decoder stops at the false header, as its packet is incomplete
+    decoder.add_data(bytes(range(1, 20)) + bytes(false_header))
+    assert decoder.decode_all() == []
+    decoder.add_data(wanted + following)
+    frames = decoder.decode_all()
+
+    assert [frame.bytes() for frame in frames] == [wanted, following]
+    assert decoder.crc_errors == 1
+    assert decoder.packets_filtered == 0
+
+
+def test_ring_decoder_get_buffer():
+    raw_data = read_log()
+    expected = decode_chunks(ANDecoder(), raw_data, len(raw_data))
+    decoder = ANRingDecoder(capacity=8192)
+
+    packets = []
+    index = 0
+    while index < len(raw_data):
+        buffer = decoder.get_buffer(-1)
+        nbytes = min(len(buffer), 1000, len(raw_data) - index)
+        buffer[:nbytes] = raw_data[index : index + nbytes]
+        decoder.buffer_updated(nbytes)
+        index += nbytes
+        for frame in decoder.decode_all(copy_data=True):
+            assert isinstance(frame.data, bytes)
+            packets.append((frame.id, frame.header, frame.data))
+
+    assert packets == expected
+    assert len(decoder.get_buffer(8000)) >= 8000
@@ -0,0 +1,118 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                         an_packet_registry_test.py                         ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+import importlib
+import inspect
+import subprocess
+import sys
+
+import pytest
+
+from advanced_navigation.anpp_packets import __all__ as anpp_all
+from advanced_navigation.anpp_packets.an_packet_protocol import ANDecoder
+from advanced_navigation.anpp_packets.an_packet_registry import (
+    decode_packet,
+    get_packet_class,
+    get_packet_classes,
+    iter_packet_classes,
+)
+from advanced_navigation.anpp_packets.an_packet_3 import DeviceID
+from advanced_navigation.anpp_packets.an_packet_20 import SystemStatePacket
+from advanced_navigation.anpp_packets.an_packet_23 import StatusPacket, StatusPacketAdu2
+from advanced_navigation.anpp_packets.an_packet_28 import RawSensorsPacket, RawSensorsPacketAdu
+from tests.anpp_packets_tests.an_packet_protocol_test import read_log
+
+
+def test_registry_lists_every_packet_class():
+    defined = set()
+    for module_name in anpp_all:
+        if not module_name.startswith("an_packet_") or module_name in ("an_packet_protocol", "an_packet_registry"):
+            continue
+        module = importlib.import_module(f"advanced_navigation.anpp_packets.{module_name}")
+        for _, obj in inspect.getmembers(module, inspect.isclass):
+            if hasattr(obj, "ID") and obj.__module__ == module.__name__:
+                defined.add(obj)
+
+    assert set(iter_packet_classes()) == defined
+    for packet_class in defined:
+        assert get_packet_class(packet_class.ID) is not None
+
+
+@pytest.mark.parametrize("packet_id, device_id, expected_type", [
+    (23, DeviceID.air_data_unit_v2, StatusPacketAdu2),
+    (23, DeviceID.certus, StatusPacket),
+    (23, None, StatusPacket),
+    (28, DeviceID.air_data_unit, RawSensorsPacketAdu),
+    (28, DeviceID.certus, RawSensorsPacket),
+    (20, DeviceID.certus, SystemStatePacket),
+    (66, None, None),
+    (255, None, None),
+])
+def test_get_packet_class(packet_id, device_id, expected_type):
+    assert get_packet_class(packet_id, device_id) is expected_type
+    assert get_packet_classes(device_id)[packet_id] is expected_type
+
+
+def test_packet_class_table_is_cached():
+    assert get_packet_classes(DeviceID.certus) is get_packet_classes(DeviceID.certus)
+    assert 20 in get_packet_classes(DeviceID.certus)
+
+
+def test_decode_packet():
+    decoder = ANDecoder()
+    decoder.add_data(read_log())
+    decoded = [decode_packet(frame, DeviceID.certus) for frame in decoder.decode_all()]
+
+    assert decoded
+    assert all(packet is not None for packet in decoded)
+    assert any(isinstance(packet, SystemStatePacket) for packet in decoded)
+
+
+def test_packet_modules_are_imported_lazily():
+    code = (
+        "import sys\n"
+        "from advanced_navigation.anpp_packets import SystemStatePacket\n"
+        "from advanced_navigation.anpp_packets.an_packet_registry import get_packet_class\n"
+        "assert get_packet_class(21).__name__ == 'UnixTimePacket'\n"
+        "print(*sorted(m.rsplit('.', 1)[1] for m in sys.modules if '.an_packet_' in m))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.split() == [
+        "an_packet_20", "an_packet_21", "an_packet_3", "an_packet_bitfield", "an_packet_protocol", "an_packet_registry"
+    ]
+
+
+def test_package_attributes():
+    import advanced_navigation.anpp_packets as anpp_packets
+
+    assert anpp_packets.SystemStatePacket is SystemStatePacket
+    assert anpp_packets.an_packet_23.StatusPacketAdu2 is StatusPacketAdu2
+    assert "RawSensorsPacketAdu" in dir(anpp_packets)
+    with pytest.raises(AttributeError):
+        anpp_packets.NotAPacket
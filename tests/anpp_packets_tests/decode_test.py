@@ -31,7 +31,8 @@ import pytest
 import os
 from pathlib import Path
 
-from advanced_navigation.anpp_packets.an_packet_protocol import ANDecoder
+from advanced_navigation.anpp_packets.an_packet_protocol import ANDecoder, ANPacket
+from advanced_navigation.anpp_packets.an_packet_registry import iter_packet_classes
 from advanced_navigation.anpp_packets.an_packets import PacketID
 from tests.anpp_packets_tests.test_utils import get_obj_from_enum
 
@@ -81,3 +82,52 @@ def test_decode_packet_in_log(packet_id):
     decoded_ids = get_decoded_packet_ids()
     assert packet_id in decoded_ids, f"PacketID {packet_id} was expected to be decoded from Log.anpp but wasn't found."
 
+
+
+def test_decode_reuses_packet_object():
+    from advanced_navigation.anpp_packets.an_packet_20 import SystemStatePacket
+
+    log_path = Path(os.path.dirname(os.path.abspath(__file__))).joinpath("Log.anpp")
+    with open(log_path, "rb") as log:
+        decoder = ANDecoder()
+        decoder.add_data(log.read())
+    frames = [frame for frame in decoder.decode_all() if frame.id == PacketID.system_state]
+
+    packet = SystemStatePacket()
+    velocity, orientation, system_status = packet.velocity, packet.orientation, packet.system_status
+    for frame in frames[:2]:
+        assert packet.decode(frame) == 0
+        expected = SystemStatePacket()
+        assert expected.decode(frame) == 0
+        assert packet == expected
+        assert (packet.velocity, packet.orientation) == (expected.velocity, expected.orientation)
+    assert packet.velocity is velocity
+    assert packet.orientation is orientation
+    assert packet.system_status is system_status
+
+
+@pytest.mark.parametrize(
+    "packet_class",
+    [packet_class for packet_class in iter_packet_classes() if getattr(packet_class, "REUSABLE", False)],
+    ids=lambda packet_class: packet_class.__name__,
+)
+def test_decode_twice_into_reusable_packet_object(packet_class):
+    structure = packet_class._structure
+    value_count = len(structure.unpack(bytes(structure.size)))
+    packet = packet_class()
+    for value in (1, 2):
+        an_packet = ANPacket()
+        an_packet.encode(packet_class.ID, structure.size, structure.pack(*[value] * value_count))
+        assert packet.decode(an_packet) == 0
+        expected = packet_class()
+        assert expected.decode(an_packet) == 0
+        assert packet == expected
+
+
+def test_reusable_packet_classes():
+    reusable = {
+        packet_class.ID.value
+        for packet_class in iter_packet_classes()
+        if getattr(packet_class, "REUSABLE", False)
+    }
+    assert reusable == {20, 28, 35, 39, 40, 89, 92}
@@ -28,24 +28,13 @@
 ################################################################################
 
 import pytest
-import importlib
-import inspect
 
 from advanced_navigation.anpp_packets.an_packet_protocol import ANDecoder
-from advanced_navigation.anpp_packets import __all__ as anpp_all
+from advanced_navigation.anpp_packets.an_packet_registry import iter_packet_classes
 
 
-packet_classes = []
-for module_name in anpp_all:
-    if not module_name.startswith('an_packet_'):
-        continue
-    module = importlib.import_module(f'advanced_navigation.anpp_packets.{module_name}')
-    for name, obj in inspect.getmembers(module, inspect.isclass):
-        if hasattr(obj, 'ID') and obj.__module__ == module.__name__:
-            if name in ['StatusPacketAdu2', 'RawSensorsPacketAdu', 'FileTransferFirstPacket', 'AcknowledgePacket']:
-                continue
-            packet_classes.append(obj)
-            
+packet_classes = list(iter_packet_classes())
+
 @pytest.mark.parametrize("packet_class", packet_classes)
 def test_encode_decode_packets(packet_class):
     packet = packet_class()
@@ -27,32 +27,11 @@
 # DEALINGS IN THE SOFTWARE.                                                    #
 ################################################################################
 
-import importlib
-import inspect
-from advanced_navigation.anpp_packets import __all__ as anpp_all
+from advanced_navigation.anpp_packets.an_packet_registry import get_packet_class
 
-_packet_classes_cache = None
 
 def get_obj_from_enum(packet_enum):
-    global _packet_classes_cache
-    if _packet_classes_cache is None:
-        _packet_classes_cache = {}
-        for module_name in anpp_all:
-            if not module_name.startswith('an_packet_'):
-                continue
-            module = importlib.import_module(f'advanced_navigation.anpp_packets.{module_name}')
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if hasattr(obj, 'ID') and obj.__module__ == module.__name__:
-                    if name in ['StatusPacketAdu2', 'RawSensorsPacketAdu', 'FileTransferFirstPacket', 'AcknowledgePacket']:
-                        continue
-                    _packet_classes_cache[obj.ID.value] = obj
-                    
-        import advanced_navigation.anpp_packets.an_packet_0 as an_packet_0
-        import advanced_navigation.anpp_packets.an_packet_7 as an_packet_7
-        _packet_classes_cache[0] = an_packet_0.AcknowledgePacket
-        _packet_classes_cache[7] = an_packet_7.FileTransferFirstPacket
-        
-    packet_class = _packet_classes_cache.get(packet_enum.value if hasattr(packet_enum, "value") else packet_enum)
+    packet_class = get_packet_class(packet_enum.value if hasattr(packet_enum, "value") else packet_enum)
     if packet_class:
         return packet_class()
     return None
@@ -0,0 +1,93 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                          test_an_clock_offset.py                           ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+import random
+import struct
+
+from advanced_navigation.an_devices import ClockOffsetEstimator
+from advanced_navigation.anpp_packets.an_packet_protocol import ANFrame
+from advanced_navigation.anpp_packets.an_packets import PacketID
+
+DEVICE_START = 1_700_000_000 * 1_000_000_000
+HOST_START = 5_000_000_000
+
+
+def host_time(device_time: int, drift_ppm: float) -> int:
+    """Host time of a device time, for a host clock drifting from the device clock"""
+    return HOST_START + round((device_time - DEVICE_START) * (1 + drift_ppm * 1e-6))
+
+
+def test_offset_and_drift_with_delays():
+    estimator = ClockOffsetEstimator(max_segments=20)
+    rng = random.Random(1)
+    # 100 Hz for 60 s, with transport delays of 0.2 to 20 ms
+    for index in range(6000):
+        device_time = DEVICE_START + index * 10_000_000
+        delay = 200_000 + int(rng.expovariate(1 / 2_000_000)) % 20_000_000
+        estimator.update(device_time, host_time(device_time, 50) + delay)
+
+    device_time = DEVICE_START + 60 * 1_000_000_000
+    error = estimator.to_host_time(device_time) - host_time(device_time, 50)
+    # Within the constant part of the delay and the delay of the least delayed samples
+    assert 0 <= error < 500_000
+    assert abs(estimator.drift_ppm - 50) < 5
+    assert len(estimator._segments) == 19
+    assert estimator.samples == 6000
+
+
+def test_device_clock_step_restarts_estimate():
+    estimator = ClockOffsetEstimator()
+    for index in range(10):
+        device_time = DEVICE_START + index * 500_000_000
+        estimator.update(device_time, host_time(device_time, 0))
+    # The device time jumps forward by an hour
+    device_time = DEVICE_START + 3600 * 1_000_000_000
+    estimator.update(device_time, host_time(DEVICE_START + 5 * 1_000_000_000, 0))
+
+    assert estimator.resets == 1
+    assert estimator.to_host_time(device_time) == host_time(DEVICE_START + 5 * 1_000_000_000, 0)
+
+
+def test_update_from_frame():
+    estimator = ClockOffsetEstimator()
+    assert estimator.to_host_time(DEVICE_START) is None
+
+    unix_time = ANFrame(PacketID.unix_time, 8, struct.pack("<II", 1_700_000_000, 250_000), HOST_START)
+    assert estimator.update_from_frame(unix_time)
+    # Packets without a receive time or device time are skipped
+    assert not estimator.update_from_frame(unix_time._replace(timestamp=0))
+    assert not estimator.update_from_frame(unix_time._replace(data=bytes(8)))
+
+    system_state = bytearray(100)
+    struct.pack_into("<II", system_state, 4, 1_700_000_001, 250_000)
+    assert estimator.update_from_frame(
+        ANFrame(PacketID.system_state, 100, bytes(system_state), HOST_START + 1_000_000_000)
+    )
+    assert estimator.offset_ns == HOST_START - DEVICE_START - 250_000_000
+    assert estimator.samples == 2
@@ -0,0 +1,276 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                          test_an_device_async.py                           ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+import asyncio
+import struct
+import time
+from typing import Optional, Set
+
+import pytest
+
+from advanced_navigation.an_devices import AnDevice
+from advanced_navigation.anpp_packets.an_packet_protocol import ANDecoder, ANPacket
+from advanced_navigation.anpp_packets.an_packets import PacketID
+from advanced_navigation.anpp_packets.an_packet_8 import FileTransferResponse
+from advanced_navigation.anpp_packets.an_packet_9 import FileTransferDataEncoding, FileTransferMetadataType
+
+
+def file_transfer_acknowledge_bytes(unique_id: int, data_index: int, response: FileTransferResponse) -> bytes:
+    an_packet = ANPacket()
+    an_packet.encode(
+        PacketID.file_transfer_acknowledge, 9, struct.pack("<IIB", unique_id, data_index, response.value)
+    )
+    return an_packet.bytes()
+
+
+class FileTransferDevice:
+    """
+    Simulated device that receives a file over TCP, acknowledging each fragment after latency seconds.
+    Fragments at the indices in drop are lost the first time they are sent.
+    """
+
+    def __init__(self, latency: float = 0.0, drop: Optional[Set[int]] = None):
+        self.latency = latency
+        self.drop = set(drop or ())
+        self.data = bytearray()
+        self.metadata = b""
+        self.total_size = 0
+        self.fragments_received = 0
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._handle_client, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    def _receive(self, data: bytes) -> bytes:
+        unique_id, data_index = struct.unpack_from("<II", data)
+        self.fragments_received += 1
+        if data_index in self.drop:
+            self.drop.remove(data_index)
+            return b""
+        expected_index = len(self.metadata) + len(self.data)
+        if data_index == 0:
+            _, _, self.total_size, _, _, metadata_length = struct.unpack_from("<IIIBBH", data)
+            payload = data[16:]
+            self.metadata = bytes(payload[:metadata_length])
+            self.data = bytearray(payload[metadata_length:])
+        elif data_index != expected_index:
+            return file_transfer_acknowledge_bytes(unique_id, expected_index, FileTransferResponse.index_mismatch)
+        else:
+            self.data += data[8:]
+        if len(self.metadata) + len(self.data) >= self.total_size:
+            return file_transfer_acknowledge_bytes(unique_id, data_index, FileTransferResponse.completed_successfully)
+        return file_transfer_acknowledge_bytes(unique_id, data_index, FileTransferResponse.ready)
+
+    def _handle_frame(self, frame, writer):
+        if frame.id == PacketID.file_transfer:
+            acknowledge = self._receive(bytes(frame.data))
+            if acknowledge:
+                asyncio.get_running_loop().call_later(self.latency, writer.write, acknowledge)
+
+    async def _handle_client(self, reader, writer):
+        decoder = ANDecoder()
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                decoder.add_data(data)
+                for frame in decoder.decode_all():
+                    self._handle_frame(frame, writer)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def transfer(device: FileTransferDevice, file_data: bytes, window: int, progress=None):
+    async def run():
+        port = await device.start()
+        an_device = AnDevice()
+        await an_device.connect_tcp("127.0.0.1", port)
+        try:
+            return await an_device.transfer_file(
+                file_data,
+                1234,
+                FileTransferDataEncoding.binary,
+                FileTransferMetadataType.utf8_filename,
+                b"firmware.bin",
+                window,
+                progress,
+            )
+        finally:
+            an_device.close()
+            await an_device._teardown_protocol()
+            await device.stop()
+
+    return asyncio.run(run())
+
+
+FILE_DATA = bytes(range(256)) * 400
+
+
+@pytest.mark.parametrize("window", [1, 16])
+def test_transfer_file(window):
+    device = FileTransferDevice(latency=0.001)
+    updates = []
+
+    assert transfer(device, FILE_DATA, window, updates.append) == 0
+
+    assert device.metadata == b"firmware.bin"
+    assert bytes(device.data) == FILE_DATA
+    assert updates[-1].bytes_acknowledged == len(FILE_DATA) + len(b"firmware.bin")
+    assert updates[-1].retransmissions == 0
+    assert updates[-1].throughput > 0
+
+
+def test_transfer_file_recovers_lost_fragments():
+    max_data_size = 224
+    device = FileTransferDevice(latency=0.001, drop={max_data_size * 10, max_data_size * 100})
+    updates = []
+
+    assert transfer(device, FILE_DATA, 16, updates.append) == 0
+
+    assert bytes(device.data) == FILE_DATA
+    assert updates[-1].retransmissions == 2
+
+
+class LossyAcknowledgeFileTransferDevice(FileTransferDevice):
+    """
+    Simulated device that loses the acknowledgements of the fragments at the indices in lost, and
+    acknowledges the last fragment as ready rather than completed
+    """
+
+    def __init__(self, lost: Set[int], **kwargs):
+        super().__init__(**kwargs)
+        self.lost = set(lost)
+        self.acknowledged = []
+
+    def _receive(self, data: bytes) -> bytes:
+        acknowledge = super()._receive(data)
+        unique_id, data_index = struct.unpack_from("<II", data)
+        if data_index in self.lost:
+            return b""
+        if acknowledge:
+            self.acknowledged.append(data_index)
+            return file_transfer_acknowledge_bytes(unique_id, data_index, FileTransferResponse.ready)
+        return acknowledge
+
+
+def test_transfer_file_matches_acknowledgements_by_index():
+    max_data_size = 224
+    total_size = len(FILE_DATA) + len(b"firmware.bin")
+    device = LossyAcknowledgeFileTransferDevice(lost={max_data_size * 10, max_data_size * 11}, latency=0.001)
+    updates = []
+    start = time.monotonic()
+
+    assert transfer(device, FILE_DATA, 16, lambda progress: updates.append(progress.bytes_acknowledged)) == 0
+
+    # The transfer completes on the acknowledgement of the last fragment, without waiting for a timeout
+    assert time.monotonic() - start < 2.0
+    assert bytes(device.data) == FILE_DATA
+    # Each update reports the end of the acknowledged fragment, past the fragments with lost acknowledgements
+    expected = [min(data_index + max_data_size, total_size) for data_index in device.acknowledged]
+    assert updates == expected
+    assert updates[-1] == total_size
+
+
+def firmware_file(path, payload: bytes):
+    header = b"ANFW" + struct.pack("<III", 0, 1234, 1700000000)
+    path.write_bytes(header + bytes(48 - len(header)) + payload)
+    return path
+
+
+class DroppingFileTransferDevice(FileTransferDevice):
+    """Simulated device whose link drops after receiving a number of fragments"""
+
+    def __init__(self, fragments_per_connection: int, **kwargs):
+        super().__init__(**kwargs)
+        self.fragments_per_connection = fragments_per_connection
+        self.writers = []
+
+    async def _handle_client(self, reader, writer):
+        self.writers.append(writer)
+        await super()._handle_client(reader, writer)
+
+    def _receive(self, data: bytes) -> bytes:
+        acknowledge = super()._receive(data)
+        if self.fragments_received % self.fragments_per_connection == 0:
+            self.writers[-1].transport.abort()
+            return b""
+        return acknowledge
+
+
+def test_write_firmware_resumes_from_checkpoint(tmp_path):
+    payload = bytes(range(256)) * 200
+    path = firmware_file(tmp_path / "firmware.anfw", payload)
+    checkpoint_path = tmp_path / "firmware.anfw.checkpoint"
+    device = DroppingFileTransferDevice(fragments_per_connection=100)
+    attempts = []
+
+    async def run():
+        port = await device.start()
+        an_device = AnDevice()
+        try:
+            for _ in range(10):
+                await an_device.connect_tcp("127.0.0.1", port)
+                try:
+                    await an_device.write_firmware(path, window=8, resume=True)
+                    attempts.append("done")
+                    break
+                except Exception:
+                    attempts.append(checkpoint_path.exists())
+        finally:
+            an_device.close()
+            await an_device._teardown_protocol()
+            await device.stop()
+
+    asyncio.run(run())
+
+    assert bytes(device.data) == payload
+    assert device.metadata == path.read_bytes()[:48]
+    # Each attempt resumed the transfer instead of starting again
+    assert attempts[:-1] and all(attempts[:-1]) and attempts[-1] == "done"
+    assert device.fragments_received < len(payload) // 224 + 10 * len(attempts)
+    assert not checkpoint_path.exists()
+
+
+def test_write_firmware_invalid_file(tmp_path):
+    path = tmp_path / "firmware.anfw"
+    path.write_bytes(bytes(100))
+
+    async def run():
+        await AnDevice().write_firmware(path)
+
+    with pytest.raises(Exception, match="Invalid anfw file"):
+        asyncio.run(run())
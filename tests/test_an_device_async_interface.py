@@ -0,0 +1,770 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                     test_an_device_async_interface.py                      ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+import asyncio
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from advanced_navigation.an_devices import CallbackMode, QueuePolicy
+from advanced_navigation.an_devices.an_device_async_interface import (
+    AnDeviceInterface,
+    AnDeviceInterfaceBufferedProtocol,
+    AnDeviceInterfaceProtocol,
+)
+from advanced_navigation.anpp_packets.an_packet_protocol import ANDecoder, ANFrame, ANPacket
+from advanced_navigation.anpp_packets.an_packets import PacketID
+from advanced_navigation.anpp_packets.an_packet_0 import AcknowledgeResult
+from advanced_navigation.anpp_packets.an_packet_1 import RequestPacket
+from advanced_navigation.anpp_packets.an_packet_14 import SubcomponentInformationPacket
+from advanced_navigation.anpp_packets.an_packet_20 import SystemStatePacket
+from advanced_navigation.anpp_packets.an_packet_21 import UnixTimePacket
+from advanced_navigation.anpp_packets.an_packet_28 import RawSensorsPacket
+from advanced_navigation.anpp_packets.an_packet_180 import PacketTimerPeriodPacket
+from advanced_navigation.anpp_packets.an_packet_181 import PacketPeriod, PacketsPeriodPacket
+from tests.anpp_packets_tests.an_packet_protocol_test import read_log, system_state_bytes
+
+
+def system_state_frame(latitude: float) -> ANFrame:
+    decoder = ANDecoder()
+    decoder.add_data(system_state_bytes(latitude))
+    return decoder.decode_all()[0]
+
+
+def test_callback_new_packet_objects():
+    interface = AnDeviceInterface()
+    received = []
+
+    async def callback(packet):
+        received.append(packet)
+
+    async def run():
+        interface.register_callback(SystemStatePacket, callback)
+        for latitude in (0.25, 0.5):
+            await interface._handle_recv_packet(system_state_frame(latitude))
+
+    asyncio.run(run())
+
+    assert [packet.latitude for packet in received] == [0.25, 0.5]
+    assert received[0] is not received[1]
+
+
+def test_callback_reused_packet_object():
+    interface = AnDeviceInterface()
+    packet = SystemStatePacket()
+    received = []
+
+    async def callback(state):
+        received.append((state, state.latitude))
+
+    async def run():
+        interface.register_callback(SystemStatePacket, callback, packet=packet)
+        for latitude in (0.25, 0.5):
+            await interface._handle_recv_packet(system_state_frame(latitude))
+
+    asyncio.run(run())
+
+    assert received == [(packet, 0.25), (packet, 0.5)]
+    assert all(state is packet for state, _ in received)
+
+
+def test_callback_rejects_packet_object_that_is_not_reusable():
+    interface = AnDeviceInterface()
+
+    async def callback(packet):
+        pass
+
+    # Decoding into the same object again would add to the entries of the previous packet
+    with pytest.raises(ValueError):
+        interface.register_callback(
+            SubcomponentInformationPacket, callback, packet=SubcomponentInformationPacket()
+        )
+
+
+def test_id_filter_follows_callbacks():
+    interface = AnDeviceInterface()
+    interface.disable_clock_offset()
+
+    async def callback(packet):
+        pass
+
+    async def run():
+        interface._protocol = AnDeviceInterfaceProtocol(interface._handle_recv_packet)
+        decoder = interface._protocol._decoder
+        filters = []
+        interface._update_id_filter()
+        filters.append(decoder.id_filter)
+        interface.register_callback(SystemStatePacket, callback)
+        filters.append(decoder.id_filter)
+        await interface.request(UnixTimePacket, timeout=0.01)
+        filters.append(decoder.id_filter)
+        interface.register_raw_callback(callback)
+        filters.append(decoder.id_filter)
+        interface._protocol._worker_task.cancel()
+        return filters
+
+    no_callbacks, system_state, after_request, raw = asyncio.run(run())
+
+    assert not any(no_callbacks)
+    assert system_state[PacketID.system_state] and sum(system_state) == 1
+    assert after_request == system_state
+    assert raw is None
+
+
+def test_connect_tcp_buffered_protocol():
+    raw_data = read_log()
+    decoder = ANDecoder()
+    decoder.add_data(raw_data)
+    expected = [frame.bytes() for frame in decoder.decode_all()]
+
+    interface = AnDeviceInterface()
+    received = []
+
+    async def callback(frame):
+        received.append(frame.bytes())
+
+    async def handle_client(reader, writer):
+        for index in range(0, len(raw_data), 1500):
+            writer.write(raw_data[index : index + 1500])
+            await writer.drain()
+        writer.close()
+
+    async def run():
+        server = await asyncio.start_server(handle_client, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        interface.register_raw_callback(callback)
+        await interface.connect_tcp("127.0.0.1", port)
+        assert isinstance(interface._protocol, AnDeviceInterfaceBufferedProtocol)
+        for _ in range(100):
+            if len(received) == len(expected):
+                break
+            await asyncio.sleep(0.01)
+        interface.close()
+        interface._protocol._worker_task.cancel()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
+
+    assert received == expected
+
+
+def test_callbacks_share_decoded_packet(monkeypatch):
+    interface = AnDeviceInterface()
+    received = []
+    decode_count = 0
+    decode = SystemStatePacket.decode
+
+    def counting_decode(self, an_packet):
+        nonlocal decode_count
+        decode_count += 1
+        return decode(self, an_packet)
+
+    monkeypatch.setattr(SystemStatePacket, "decode", counting_decode)
+
+    async def callback(packet):
+        received.append(packet)
+
+    async def run():
+        for _ in range(3):
+            interface.register_callback(SystemStatePacket, callback)
+        interface.register_callback(SystemStatePacket, callback, copy=True)
+        await interface._handle_recv_packet(system_state_frame(0.25))
+
+    asyncio.run(run())
+
+    assert decode_count == 2
+    assert received[0] is received[1] is received[2]
+    assert received[3] is not received[0]
+    assert received[3] == received[0]
+
+
+class FakeProtocol:
+    def __init__(self):
+        self.sent = []
+        self.id_filter = None
+
+    def send(self, packet):
+        self.sent.append(packet.bytes())
+
+    def set_id_filter(self, packet_ids):
+        self.id_filter = None if packet_ids is None else set(packet_ids)
+
+
+def acknowledge_frame(packet_id: int, result: int = 0) -> ANFrame:
+    return ANFrame(PacketID.acknowledge, 4, struct.pack("<BHB", packet_id, 0, result))
+
+
+def unix_time_frame(seconds: int) -> ANFrame:
+    return ANFrame(PacketID.unix_time, 8, struct.pack("<II", seconds, 0))
+
+
+def test_request_resolved_from_pending_table():
+    interface = AnDeviceInterface()
+    interface.disable_clock_offset()
+    interface._protocol = FakeProtocol()
+
+    async def run():
+        tasks = [asyncio.create_task(interface.request(UnixTimePacket)) for _ in range(1000)]
+        await asyncio.sleep(0)
+        # Concurrent requests of the same packet type share one request
+        assert len(interface._pending_responses[PacketID.unix_time]) == 1
+        assert interface._protocol.id_filter == {PacketID.unix_time}
+        assert interface._handle_response(unix_time_frame(1700000000))
+        return await asyncio.gather(*tasks)
+
+    responses = asyncio.run(run())
+
+    assert all(response.unix_time_seconds == 1700000000 for response in responses)
+    assert len(interface._protocol.sent) == 1
+    assert interface._pending_responses == {}
+    assert interface._shared_requests == {}
+    assert interface._callbacks == {}
+    assert interface._protocol.id_filter == set()
+
+
+def test_request_timeout_removes_pending():
+    interface = AnDeviceInterface()
+    interface._protocol = FakeProtocol()
+
+    assert asyncio.run(interface.request(UnixTimePacket, timeout=0.01)) is None
+    assert interface._pending_responses == {}
+
+
+def test_send_matches_acknowledgements():
+    interface = AnDeviceInterface()
+    interface.disable_clock_offset()
+    interface._protocol = FakeProtocol()
+
+    async def run():
+        first = asyncio.create_task(interface.send(PacketTimerPeriodPacket(), timeout=0.5))
+        second = asyncio.create_task(interface.send(PacketTimerPeriodPacket(), timeout=0.5))
+        other = asyncio.create_task(interface.send(RequestPacket(), timeout=0.05))
+        await asyncio.sleep(0)
+        assert interface._protocol.id_filter == {PacketID.acknowledge}
+        # Each acknowledgement resolves the oldest packet sent with its ID
+        assert interface._handle_response(acknowledge_frame(PacketID.packet_timer_period, 0))
+        assert interface._handle_response(acknowledge_frame(PacketID.packet_timer_period, 3))
+        return await asyncio.gather(first, second, other)
+
+    first, second, other = asyncio.run(run())
+
+    assert first.acknowledge_result == AcknowledgeResult.success
+    assert second.acknowledge_result == AcknowledgeResult.failure_range
+    assert other is None
+    assert interface._pending_acknowledgements == {}
+
+
+def test_request_many():
+    interface = AnDeviceInterface()
+    interface._protocol = FakeProtocol()
+
+    async def run():
+        many = asyncio.create_task(interface.request_many([UnixTimePacket, SystemStatePacket], timeout=0.1))
+        single = asyncio.create_task(interface.request(UnixTimePacket, timeout=0.1))
+        await asyncio.sleep(0)
+        assert interface._handle_response(unix_time_frame(1700000000))
+        return await many, await single
+
+    responses, response = asyncio.run(run())
+
+    request = RequestPacket()
+    request.requested_packets = [PacketID.unix_time, PacketID.system_state]
+    assert interface._protocol.sent == [request.encode().bytes()]
+    assert list(responses) == [UnixTimePacket, SystemStatePacket]
+    assert responses[UnixTimePacket].unix_time_seconds == 1700000000
+    assert responses[SystemStatePacket] is None
+    assert response is responses[UnixTimePacket]
+    assert interface._pending_responses == {}
+    assert interface._shared_requests == {}
+
+
+def test_clock_offset_without_device_time_callbacks():
+    interface = AnDeviceInterface()
+
+    async def callback(packet):
+        pass
+
+    def unix_time_bytes(seconds):
+        unix_time = ANPacket()
+        unix_time.encode(PacketID.unix_time, 8, unix_time_frame(seconds).data)
+        return unix_time.bytes()
+
+    async def run():
+        interface._protocol = AnDeviceInterfaceProtocol(
+            interface._handle_recv_packet, None, interface._handle_response
+        )
+        interface._configure_protocol()
+        interface.register_callback(RawSensorsPacket, callback)
+        interface._protocol.data_received(b"".join(unix_time_bytes(1700000000 + index) for index in range(5)))
+        samples = interface.clock_offset.samples
+        # The samples are not queued for the callbacks
+        backlog = interface.receive_queue.qsize()
+        interface.disable_clock_offset()
+        interface._protocol.data_received(unix_time_bytes(1700000005))
+        interface._protocol._worker_task.cancel()
+        return samples, backlog
+
+    samples, backlog = asyncio.run(run())
+
+    assert samples == 5
+    assert backlog == 0
+    assert interface.clock_offset.samples == 5
+    assert interface.clock_offset.offset_ns is not None
+
+
+def test_queue_policy_applied_to_protocol():
+    interface = AnDeviceInterface()
+    interface.set_queue_policy(SystemStatePacket, QueuePolicy.conflate)
+    assert interface.receive_queue is None
+
+    async def run():
+        interface._protocol = AnDeviceInterfaceProtocol(interface._handle_recv_packet)
+        interface._configure_protocol()
+        interface._protocol._worker_task.cancel()
+
+    asyncio.run(run())
+
+    assert interface.receive_queue.get_policy(PacketID.system_state) == (QueuePolicy.conflate, 1)
+    assert interface.receive_queue.get_policy(PacketID.unix_time) == (QueuePolicy.unbounded, 0)
+
+
+def test_response_resolved_ahead_of_queue():
+    interface = AnDeviceInterface()
+    blocked = asyncio.Event()
+
+    async def slow_callback(packet):
+        await blocked.wait()
+
+    async def run():
+        interface.register_callback(SystemStatePacket, slow_callback)
+        interface._protocol = AnDeviceInterfaceProtocol(
+            interface._handle_recv_packet, None, interface._handle_response
+        )
+        sending = asyncio.create_task(interface.send(PacketTimerPeriodPacket(), timeout=0.5))
+        await asyncio.sleep(0)
+        interface._protocol.data_received(system_state_bytes() * 100)
+        await asyncio.sleep(0)
+        acknowledge = ANPacket()
+        acknowledge.encode(PacketID.acknowledge, 4, acknowledge_frame(PacketID.packet_timer_period).data)
+        interface._protocol.data_received(acknowledge.bytes())
+        response = await sending
+        backlog = interface.receive_queue.qsize()
+        interface._protocol._worker_task.cancel()
+        return response, backlog
+
+    response, backlog = asyncio.run(run())
+
+    assert response.acknowledge_result == AcknowledgeResult.success
+    assert backlog == 99
+
+
+def test_stream_get_batch():
+    interface = AnDeviceInterface()
+
+    async def run():
+        interface._protocol = AnDeviceInterfaceProtocol(
+            interface._handle_recv_packet, None, interface._handle_response
+        )
+        interface._configure_protocol()
+        subscription = interface.stream(SystemStatePacket, maxsize=150)
+        batch = asyncio.create_task(subscription.get_batch(100))
+        await asyncio.sleep(0)
+        interface._protocol.data_received(b"".join(system_state_bytes(index) for index in range(99)))
+        await asyncio.sleep(0)
+        # The consumer is only woken up once the whole batch is buffered
+        assert not batch.done()
+        interface._protocol.data_received(system_state_bytes(99))
+        first = await batch
+        interface._protocol.data_received(b"".join(system_state_bytes(index) for index in range(100, 300)))
+        second = await subscription.get_batch(100, timeout=0.01)
+        subscription.close()
+        # Packets received after unsubscribing are no longer decoded
+        interface._protocol.data_received(system_state_bytes(300))
+        backlog = interface.receive_queue.qsize()
+        interface._protocol._worker_task.cancel()
+        return subscription, first, second, backlog
+
+    subscription, first, second, backlog = asyncio.run(run())
+
+    assert [packet.latitude for packet in first] == list(range(100))
+    # The oldest packets were dropped from the full buffer
+    assert [packet.latitude for packet in second] == list(range(150, 250))
+    assert subscription.qsize() == 50
+    assert subscription.frames_dropped == 50
+    # Streamed packets are not queued for the callbacks
+    assert backlog == 0
+
+
+def test_stream_iteration_stops_when_closed():
+    interface = AnDeviceInterface()
+    interface._protocol = FakeProtocol()
+    received = []
+
+    async def consume(subscription):
+        async for packet in subscription:
+            received.append(packet.latitude)
+
+    async def run():
+        async with interface.stream(SystemStatePacket) as subscription:
+            consumer = asyncio.create_task(consume(subscription))
+            for index in range(3):
+                interface._handle_response(system_state_frame(index))
+                await asyncio.sleep(0)
+        await asyncio.wait_for(consumer, 1)
+        # Packets received after unsubscribing are not buffered
+        interface._handle_response(system_state_frame(3))
+        return subscription
+
+    subscription = asyncio.run(run())
+
+    assert received == [0, 1, 2]
+    assert subscription.closed
+    assert subscription.qsize() == 0
+
+
+def test_batch_callbacks():
+    # The columnar batches are numpy arrays
+    pytest.importorskip("numpy")
+    interface = AnDeviceInterface()
+    batches = []
+    arrays = []
+    unix_times = []
+
+    async def batch_callback(packets):
+        batches.append(packets)
+
+    async def columnar_callback(array):
+        arrays.append(array)
+
+    async def unix_time_callback(packet):
+        unix_times.append(packet.unix_time_seconds)
+
+    async def run():
+        interface._protocol = AnDeviceInterfaceProtocol(
+            interface._handle_recv_packet, None, interface._handle_response, interface._handle_recv_packets
+        )
+        interface.register_batch_callback(SystemStatePacket, batch_callback)
+        interface.register_batch_callback(SystemStatePacket, columnar_callback, columnar=True)
+        interface.register_callback(UnixTimePacket, unix_time_callback)
+        unix_time = ANPacket()
+        unix_time.encode(PacketID.unix_time, 8, unix_time_frame(1700000000).data)
+        interface._protocol.data_received(system_state_bytes() * 50 + unix_time.bytes())
+        await asyncio.sleep(0.01)
+        interface._protocol._worker_task.cancel()
+
+    asyncio.run(run())
+
+    # Every packet of the read is decoded and passed to each batch callback at once
+    assert len(batches) == 1 and len(batches[0]) == 50
+    assert isinstance(batches[0][0], SystemStatePacket)
+    assert len(arrays) == 1 and arrays[0].shape == (50,)
+    assert arrays[0]["latitude"][0] == batches[0][0].latitude
+    assert unix_times == [1700000000]
+
+
+def test_inline_callback_stats():
+    interface = AnDeviceInterface()
+    received = []
+
+    def callback(packet):
+        if packet.latitude < 0:
+            raise ValueError("Invalid latitude")
+        received.append(packet.latitude)
+
+    stats = interface.register_callback(SystemStatePacket, callback)
+
+    async def run():
+        for latitude in (1.0, -1.0, 2.0):
+            await interface._handle_recv_packet(system_state_frame(latitude))
+
+    asyncio.run(run())
+
+    assert received == [1.0, 2.0]
+    assert stats.calls == 3
+    assert stats.errors == 1
+    assert 0 < stats.max_time <= stats.total_time
+    assert stats.mean_time == stats.total_time / 3
+
+
+def test_inline_callback_returning_awaitable():
+    interface = AnDeviceInterface()
+    received = []
+
+    async def handler(packet, source):
+        received.append((source, packet.latitude))
+
+    class AsyncCallable:
+        async def __call__(self, packet):
+            await handler(packet, "object")
+
+    interface.register_callback(SystemStatePacket, lambda packet: handler(packet, "lambda"))
+    stats = interface.register_callback(SystemStatePacket, AsyncCallable())
+
+    async def run():
+        await interface._handle_recv_packet(system_state_frame(1.0))
+
+    asyncio.run(run())
+
+    assert received == [("lambda", 1.0), ("object", 1.0)]
+    assert stats.calls == 1 and stats.errors == 0
+
+
+def test_executor_callback_keeps_order():
+    interface = AnDeviceInterface()
+    release = threading.Event()
+    received = []
+    thread_ids = set()
+
+    def slow_callback(packet):
+        release.wait(1)
+        time.sleep(0.001)
+        received.append(packet.latitude)
+        thread_ids.add(threading.get_ident())
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            stats = interface.register_callback(
+                SystemStatePacket, slow_callback, mode=CallbackMode.executor, executor=executor
+            )
+            start = time.perf_counter()
+            for index in range(20):
+                await interface._handle_recv_packet(system_state_frame(index))
+            # The worker is not held up by the callback
+            elapsed = time.perf_counter() - start
+            backlog = stats.backlog
+            release.set()
+            await interface.join_callbacks()
+        return stats, elapsed, backlog
+
+    stats, elapsed, backlog = asyncio.run(run())
+
+    assert elapsed < 0.5
+    assert backlog == 20
+    assert received == list(range(20))
+    assert stats.calls == 20 and stats.backlog == 0
+    assert threading.get_ident() not in thread_ids
+
+
+def test_executor_callback_backlog_follows_queue_policy():
+    interface = AnDeviceInterface()
+    interface.set_queue_policy(SystemStatePacket, QueuePolicy.drop_oldest, 5)
+    release = threading.Event()
+    received = []
+
+    def slow_callback(packet):
+        release.wait(1)
+        received.append(packet.latitude)
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            stats = interface.register_callback(
+                SystemStatePacket, slow_callback, mode=CallbackMode.executor, executor=executor
+            )
+            for index in range(20):
+                await interface._handle_recv_packet(system_state_frame(index))
+            backlog = stats.backlog
+            release.set()
+            await interface.join_callbacks()
+        return stats, backlog
+
+    stats, backlog = asyncio.run(run())
+
+    assert backlog <= 5
+    # The latest packets are kept
+    assert received[-5:] == list(range(15, 20))
+    assert stats.dropped == 20 - len(received)
+
+
+def test_close_discards_queued_executor_callbacks():
+    interface = AnDeviceInterface()
+    release = threading.Event()
+    received = []
+
+    def slow_callback(packet):
+        release.wait(1)
+        received.append(packet.latitude)
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            stats = interface.register_callback(
+                SystemStatePacket, slow_callback, mode=CallbackMode.executor, executor=executor
+            )
+            for index in range(10):
+                await interface._handle_recv_packet(system_state_frame(index))
+            await asyncio.sleep(0.01)
+            interface.close()
+            release.set()
+            await asyncio.sleep(0.05)
+            # No task of the callback is left running
+            tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        return stats, tasks
+
+    stats, tasks = asyncio.run(run())
+
+    # Only the call already running in the executor completes
+    assert received == [0]
+    assert stats.backlog == 0
+    assert not tasks
+
+
+def test_executor_callback_cannot_reuse_packet():
+    interface = AnDeviceInterface()
+    with pytest.raises(ValueError):
+        interface.register_callback(
+            SystemStatePacket, print, packet=SystemStatePacket(), mode=CallbackMode.executor
+        )
+
+
+def test_reconnect_restores_packet_periods():
+    cycles = 200
+    interface = AnDeviceInterface()
+    received = []
+    connections = []
+
+    async def callback(packet):
+        received.append(packet.latitude)
+
+    async def handle_client(reader, writer):
+        # Acknowledges the packets period packet, streams a system state packet, then drops the connection
+        decoder = ANDecoder()
+        connections.append([])
+        try:
+            while True:
+                data = await reader.read(1024)
+                if not data:
+                    break
+                decoder.add_data(data)
+                frames = decoder.decode_all()
+                connections[-1].extend(frame.id for frame in frames)
+                if any(frame.id == PacketID.packets_period for frame in frames):
+                    acknowledge = ANPacket()
+                    acknowledge.encode(PacketID.acknowledge, 4, acknowledge_frame(PacketID.packets_period).data)
+                    writer.write(acknowledge.bytes() + system_state_bytes(len(connections)))
+                    await writer.drain()
+                    break
+        finally:
+            writer.close()
+
+    async def run():
+        server = await asyncio.start_server(handle_client, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        interface.register_callback(SystemStatePacket, callback)
+        interface.enable_reconnect(initial_delay=0.001, max_delay=0.01)
+        await interface.connect_tcp("127.0.0.1", port)
+
+        packets_period = PacketsPeriodPacket()
+        packets_period.clear_existing_packets = 1
+        packet_period = PacketPeriod()
+        packet_period.packet_id = PacketID.system_state
+        packet_period.period = 100
+        packets_period.packet_periods.append(packet_period)
+        assert (await interface.send(packets_period)).acknowledge_result == AcknowledgeResult.success
+
+        task_counts = []
+        for _ in range(200 * cycles):
+            if interface.reconnects >= cycles:
+                break
+            if interface.reconnects == 10 and not task_counts:
+                task_counts.append(len(asyncio.all_tasks()))
+            await asyncio.sleep(0.001)
+        task_counts.append(len(asyncio.all_tasks()))
+        interface.close()
+        await interface._teardown_protocol()
+        server.close()
+        await server.wait_closed()
+        await asyncio.sleep(0.01)
+        return task_counts
+
+    task_counts = asyncio.run(run())
+
+    assert interface.reconnects >= cycles
+    # Every connection gets the packet periods, and nothing is left behind by the previous connections
+    assert all(PacketID.packets_period in ids for ids in connections)
+    assert task_counts[1] <= task_counts[0]
+    assert len(received) >= cycles
+    assert not interface.connected
+
+
+def test_reconnect_after_drop_while_restoring_packet_periods():
+    interface = AnDeviceInterface()
+    connections = []
+
+    async def handle_client(reader, writer):
+        # Acknowledges the packets period packet, except on the second connection which is dropped instead
+        decoder = ANDecoder()
+        connections.append(writer)
+        try:
+            while True:
+                data = await reader.read(1024)
+                if not data:
+                    break
+                decoder.add_data(data)
+                if any(frame.id == PacketID.packets_period for frame in decoder.decode_all()):
+                    if len(connections) == 2:
+                        break
+                    acknowledge = ANPacket()
+                    acknowledge.encode(PacketID.acknowledge, 4, acknowledge_frame(PacketID.packets_period).data)
+                    writer.write(acknowledge.bytes())
+        finally:
+            writer.close()
+
+    async def run():
+        server = await asyncio.start_server(handle_client, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        interface.enable_reconnect(initial_delay=0.001, max_delay=0.01)
+        await interface.connect_tcp("127.0.0.1", port)
+
+        packets_period = PacketsPeriodPacket()
+        packet_period = PacketPeriod()
+        packet_period.packet_id = PacketID.system_state
+        packet_period.period = 100
+        packets_period.packet_periods.append(packet_period)
+        assert (await interface.send(packets_period)).acknowledge_result == AcknowledgeResult.success
+        connections[0].close()
+
+        for _ in range(500):
+            if len(connections) == 3 and interface._reconnect_task.done():
+                break
+            await asyncio.sleep(0.01)
+        connected = interface.connected
+        interface.close()
+        await interface._teardown_protocol()
+        server.close()
+        await server.wait_closed()
+        return connected
+
+    connected = asyncio.run(run())
+
+    assert len(connections) == 3
+    assert interface.reconnects == 2
+    assert connected
@@ -0,0 +1,241 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                           test_an_fleet_async.py                           ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+import asyncio
+import struct
+import time
+
+from advanced_navigation.an_devices import AnFleet
+from advanced_navigation.anpp_packets.an_packet_protocol import ANPacket
+from advanced_navigation.anpp_packets.an_packets import PacketID
+from advanced_navigation.anpp_packets.an_packet_2 import BootMode
+from advanced_navigation.anpp_packets.an_packet_3 import DeviceID
+from advanced_navigation.anpp_packets.an_packet_20 import SystemStatePacket
+from tests.anpp_packets_tests.an_packet_protocol_test import system_state_bytes
+from tests.test_an_device_async import DroppingFileTransferDevice, firmware_file
+
+RESPONSE_DELAY = 0.1
+
+
+def device_information_bytes(serial_number: int) -> bytes:
+    an_packet = ANPacket()
+    an_packet.encode(PacketID.device_information, 24, struct.pack("<IIIIII", 1000, 0, 0, serial_number, 0, 0))
+    return an_packet.bytes()
+
+
+async def simulated_device(serial_number: int, packets: int) -> asyncio.AbstractServer:
+    """Device that answers the device information request after RESPONSE_DELAY, then streams system state"""
+
+    async def handle_client(reader, writer):
+        try:
+            await reader.read(1024)
+            await asyncio.sleep(RESPONSE_DELAY)
+            writer.write(device_information_bytes(serial_number))
+            await asyncio.sleep(0.05)
+            writer.write(b"".join(system_state_bytes(index) for index in range(packets)))
+            await writer.drain()
+            await reader.read(1024)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle_client, "127.0.0.1", 0)
+
+
+def test_fleet_bring_up_and_fan_in():
+    device_count = 8
+    fleet = AnFleet()
+
+    async def run():
+        servers = [await simulated_device(serial_number, 10) for serial_number in range(device_count)]
+        for serial_number, server in enumerate(servers):
+            fleet.add_tcp(f"unit-{serial_number}", "127.0.0.1", server.sockets[0].getsockname()[1])
+        # Unreachable device
+        fleet.add_tcp("unit-offline", "127.0.0.1", 1)
+
+        subscription = fleet.stream(SystemStatePacket)
+        start = time.monotonic()
+        errors = await fleet.connect(timeout=2)
+        bring_up_time = time.monotonic() - start
+        packets = await subscription.get_batch(device_count * 10, timeout=2)
+        subscription.close()
+        metrics = fleet.metrics()
+
+        fleet.close()
+        for fleet_device in fleet.devices.values():
+            if fleet_device.device._protocol is not None:
+                fleet_device.device._protocol._worker_task.cancel()
+        # Let the simulated devices see the connections close
+        await asyncio.sleep(0.05)
+        for server in servers:
+            server.close()
+            await server.wait_closed()
+        return errors, bring_up_time, packets, metrics
+
+    errors, bring_up_time, packets, metrics = asyncio.run(run())
+
+    assert list(errors) == ["unit-offline"]
+    # The devices are brought up concurrently
+    assert bring_up_time < RESPONSE_DELAY * device_count / 2
+    for serial_number in range(device_count):
+        name = f"unit-{serial_number}"
+        assert fleet.devices[name].device_information.serial_number[0] == serial_number
+        assert [packet.latitude for source, packet in packets if source == name] == list(range(10))
+        assert metrics[name].packets_received == 11
+        assert metrics[name].online_time >= RESPONSE_DELAY
+    assert not metrics["unit-offline"].connected
+    assert all(not fleet_device.device._subscriptions for fleet_device in fleet.devices.values())
+
+
+def packet_bytes(packet_id: int, data: bytes) -> bytes:
+    an_packet = ANPacket()
+    an_packet.encode(packet_id, len(data), data)
+    return an_packet.bytes()
+
+
+class FirmwareDevice(DroppingFileTransferDevice):
+    """
+    Simulated device with a boot mode, which restarts into the new firmware once it has received
+    a firmware file. The number of devices receiving a file at the same time is counted in transfers.
+    """
+
+    def __init__(self, device_id: DeviceID, transfers: dict, fragments_per_connection: int = 1000000):
+        super().__init__(fragments_per_connection, latency=0.001)
+        self.device_id = device_id
+        self.transfers = transfers
+        self.software_version = 1000
+        self.boot_mode = BootMode.main_program
+        self.boot_mode_changes = 0
+        self.receiving = False
+
+    def _handle_frame(self, frame, writer):
+        if frame.id == PacketID.request:
+            for packet_id in map(PacketID, bytes(frame.data)):
+                if packet_id == PacketID.device_information:
+                    writer.write(
+                        packet_bytes(
+                            packet_id,
+                            struct.pack("<IIIIII", self.software_version, self.device_id.value, 0, 1, 0, 0),
+                        )
+                    )
+                elif packet_id == PacketID.boot_mode:
+                    writer.write(packet_bytes(packet_id, struct.pack("<B", self.boot_mode.value)))
+        elif frame.id == PacketID.boot_mode:
+            self.boot_mode = BootMode(frame.data[0])
+            self.boot_mode_changes += 1
+            writer.write(packet_bytes(PacketID.acknowledge, struct.pack("<BHB", PacketID.boot_mode, 0, 0)))
+        else:
+            super()._handle_frame(frame, writer)
+
+    def _receive(self, data: bytes) -> bytes:
+        if not self.receiving:
+            self.receiving = True
+            self.transfers["active"] += 1
+            self.transfers["max_active"] = max(self.transfers["max_active"], self.transfers["active"])
+        acknowledge = super()._receive(data)
+        if self.total_size and len(self.metadata) + len(self.data) >= self.total_size:
+            self.receiving = False
+            self.transfers["active"] -= 1
+            self.software_version = 2000
+            self.boot_mode = BootMode.main_program
+            # Restart once the acknowledgement is sent
+            writer = self.writers[-1]
+            asyncio.get_running_loop().call_later(self.latency * 2, writer.transport.abort)
+        return acknowledge
+
+
+def test_fleet_firmware_rollout(tmp_path):
+    payload = bytes(range(256)) * 80
+    path = firmware_file(tmp_path / "firmware.anfw", payload)
+    transfers = {"active": 0, "max_active": 0}
+    devices = {
+        "boreas-1": FirmwareDevice(DeviceID.boreas_d90, transfers),
+        "certus-1": FirmwareDevice(DeviceID.certus, transfers),
+        "certus-2": FirmwareDevice(DeviceID.certus, transfers),
+        # The link of this device drops once during the transfer
+        "certus-3": FirmwareDevice(DeviceID.certus, transfers, fragments_per_connection=70),
+        # No application bootloader, the file is sent without changing the boot mode
+        "certus-mini-1": FirmwareDevice(DeviceID.certus_mini_a, transfers),
+        # No ANFW v2 support
+        "spatial-1": FirmwareDevice(DeviceID.spatial, transfers),
+    }
+    fleet = AnFleet()
+    updates = []
+    timeout = 2.0
+
+    async def run():
+        for name, device in devices.items():
+            fleet.add_tcp(name, "127.0.0.1", await device.start())
+        # Unreachable devices, which are waited for until the timeout
+        fleet.add_tcp("offline-1", "127.0.0.1", 1)
+        fleet.add_tcp("offline-2", "127.0.0.1", 1)
+        errors = await fleet.connect(timeout=2)
+        start = time.monotonic()
+        report = await fleet.update_firmware(
+            path,
+            concurrency=2,
+            window=8,
+            retry_delay=0.01,
+            timeout=timeout,
+            progress=lambda name, transfer: updates.append((name, time.monotonic() - start)),
+        )
+        fleet.close()
+        for fleet_device in fleet.devices.values():
+            await fleet_device.device._teardown_protocol()
+        for device in devices.values():
+            await device.stop()
+        return errors, report
+
+    errors, report = asyncio.run(run())
+
+    assert sorted(errors) == ["offline-1", "offline-2"]
+    assert report.skipped == ["spatial-1"]
+    assert sorted(report.updated) == ["boreas-1", "certus-1", "certus-2", "certus-3", "certus-mini-1"]
+    assert report.failed == ["offline-1", "offline-2"]
+    # The uploads start without waiting for the offline devices
+    assert updates[0][1] < timeout
+    assert transfers["max_active"] == 2
+    for name in report.updated:
+        result = report.results[name]
+        assert bytes(devices[name].data) == payload
+        assert result.device_information.software_version == 2000
+        assert result.bytes_transferred == len(payload) + 48
+        assert result.throughput > 0
+        assert name in [update[0] for update in updates]
+    assert report.results["certus-1"].attempts == 1
+    # The retry resumed the transfer where the device got to
+    assert report.results["certus-3"].attempts == 2
+    assert devices["certus-3"].fragments_received < len(payload) // 224 + 20
+    assert devices["certus-1"].boot_mode_changes == 1
+    assert devices["certus-mini-1"].boot_mode_changes == 0
+    assert devices["spatial-1"].fragments_received == 0
+    assert report.throughput > 0
+    assert not list(tmp_path.glob("*.checkpoint"))
+    assert "5 updated, 1 skipped, 2 failed" in str(report)
@@ -0,0 +1,135 @@
+################################################################################
+##                                                                            ##
+##                   Advanced Navigation Python Language SDK                  ##
+##                          test_an_receive_queue.py                          ##
+##                     Copyright 2026, Advanced Navigation                    ##
+##                                                                            ##
+################################################################################
+#                                                                              #
+# Copyright (C) 2026 Advanced Navigation                                       #
+#                                                                              #
+# Permission is hereby granted, free of charge, to any person obtaining        #
+# a copy of this software and associated documentation files (the "Software"), #
+# to deal in the Software without restriction, including without limitation    #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,     #
+# and/or sell copies of the Software, and to permit persons to whom the        #
+# Software is furnished to do so, subject to the following conditions:         #
+#                                                                              #
+# The above copyright notice and this permission notice shall be included      #
+# in all copies or substantial portions of the Software.                       #
+#                                                                              #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS      #
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,  #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE  #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER       #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING      #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER          #
+# DEALINGS IN THE SOFTWARE.                                                    #
+################################################################################
+
+import asyncio
+import time
+
+import pytest
+
+from advanced_navigation.an_devices import ANReceiveQueue, QueuePolicy
+from advanced_navigation.anpp_packets.an_packet_protocol import ANFrame
+from advanced_navigation.anpp_packets.an_packets import PacketID
+
+
+def frame(packet_id: int, value: int) -> ANFrame:
+    return ANFrame(packet_id, 1, bytes([value]))
+
+
+def drain(queue: ANReceiveQueue):
+    frames = []
+    while not queue.empty():
+        an_packet = queue.get_nowait()
+        frames.append((an_packet.id, an_packet.data[0]))
+    return frames
+
+
+def test_unbounded():
+    queue = ANReceiveQueue()
+    for value in range(5):
+        queue.put_nowait(frame(20, value))
+        queue.put_nowait(frame(28, value))
+
+    assert queue.qsize() == 10
+    assert drain(queue) == [(packet_id, value) for value in range(5) for packet_id in (20, 28)]
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+
+
+def test_drop_oldest():
+    queue = ANReceiveQueue()
+    queue.set_policy(28, QueuePolicy.drop_oldest, maxsize=2)
+    for value in range(5):
+        queue.put_nowait(frame(20, value))
+        queue.put_nowait(frame(28, value))
+
+    assert queue.qsize() == 7
+    assert queue.frames_dropped == 3
+    assert drain(queue) == [(20, 0), (20, 1), (20, 2), (20, 3), (28, 3), (20, 4), (28, 4)]
+
+
+def test_conflate():
+    queue = ANReceiveQueue()
+    queue.set_policy(20, QueuePolicy.conflate)
+    queue.put_nowait(frame(20, 0))
+    queue.put_nowait(frame(28, 0))
+    queue.put_nowait(frame(20, 1))
+    queue.put_nowait(frame(20, 2))
+
+    assert queue.frames_conflated == 2
+    # The latest packet takes the place of the oldest
+    assert drain(queue) == [(20, 2), (28, 0)]
+    queue.put_nowait(frame(20, 3))
+    assert drain(queue) == [(20, 3)]
+
+
+@pytest.mark.parametrize("packet_id", [PacketID.acknowledge, PacketID.file_transfer_acknowledge])
+def test_never_dropped(packet_id):
+    queue = ANReceiveQueue(default_policy=QueuePolicy.drop_oldest, default_maxsize=1)
+    with pytest.raises(ValueError):
+        queue.set_policy(packet_id, QueuePolicy.conflate)
+    for value in range(3):
+        queue.put_nowait(frame(packet_id, value))
+        queue.put_nowait(frame(20, value))
+
+    assert drain(queue) == [(packet_id, 0), (packet_id, 1), (packet_id, 2), (20, 2)]
+    assert queue.frames_dropped == 2
+
+
+def test_dropped_cells_bounded():
+    queue = ANReceiveQueue(default_policy=QueuePolicy.drop_oldest, default_maxsize=10)
+    for value in range(100000):
+        queue.put_nowait(frame(20, value % 256))
+
+    assert queue.qsize() == 10
+    assert len(queue._cells) <= 1024 + 2 * 10
+    assert len(drain(queue)) == 10
+
+
+def test_get_waits_for_packet():
+    queue = ANReceiveQueue()
+
+    async def run():
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+        queue.put_nowait(frame(20, 7))
+        return await getter
+
+    assert asyncio.run(run()).data == bytes([7])
+
+
+def test_latency():
+    queue = ANReceiveQueue()
+    queue.put_nowait(ANFrame(20, 1, b"\x00", time.monotonic_ns() - 5_000_000))
+    queue.put_nowait(frame(20, 1))
+    queue.get_nowait()
+    assert queue.latency_ns >= 5_000_000
+    # Packets without a receive time are not measured
+    queue.get_nowait()
+    assert queue.max_latency_ns == queue.latency_ns >= 5_000_000
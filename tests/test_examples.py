@@ -28,12 +28,14 @@
 ################################################################################
 
 import pytest
+import json
 import math
 from unittest.mock import patch
 
 from examples.packet_printers import (
     print_packet,
     get_device_specific_packet_obj,
+    get_pooled_packet_obj,
     handle_raw_an_packet
 )
 from advanced_navigation.anpp_packets.an_packet_3 import DeviceID
@@ -41,6 +43,7 @@ from advanced_navigation.anpp_packets.an_packet_20 import SystemStatePacket
 from advanced_navigation.anpp_packets.an_packet_28 import RawSensorsPacket, RawSensorsPacketAdu
 from advanced_navigation.anpp_packets.an_packet_23 import StatusPacket, StatusPacketAdu2
 from advanced_navigation.anpp_packets.an_packet_protocol import ANPacket
+from advanced_navigation.anpp_packets.an_packets import PacketID
 
 class TestPacketPrinters:
 
@@ -107,3 +110,26 @@ class TestPacketPrinters:
         args, _ = mock_print_packet.call_args
         assert isinstance(args[0], RawSensorsPacket)
         assert args[0].accelerometers == [1.0, 2.0, 3.0]
+
+    def test_get_pooled_packet_obj(self):
+        obj = get_pooled_packet_obj(28, DeviceID.certus)
+        assert isinstance(obj, RawSensorsPacket)
+        assert get_pooled_packet_obj(28, DeviceID.certus) is obj
+        assert isinstance(get_pooled_packet_obj(28, DeviceID.air_data_unit), RawSensorsPacketAdu)
+
+    def test_variable_length_packets_are_not_pooled(self):
+        subcomponents = get_pooled_packet_obj(14, DeviceID.certus)
+        assert get_pooled_packet_obj(14, DeviceID.certus) is not subcomponents
+
+    @patch('builtins.print')
+    def test_handle_raw_an_packet_variable_length(self, mock_print):
+        an_packet = ANPacket()
+        an_packet.encode(PacketID.subcomponent_information, 24, bytes(24))
+        for _ in range(3):
+            handle_raw_an_packet(an_packet, DeviceID.certus)
+
+        assert mock_print.call_count == 3
+        for call in mock_print.call_args_list:
+            printed = json.loads(call.args[0].split(" ", 1)[1])
+            assert len(printed["subcomponents_information"]) == 1
+